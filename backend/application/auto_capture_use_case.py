@@ -8,7 +8,6 @@ import json
 import logging
 from typing import Dict, List, Optional
 from groq import AsyncGroq
-from backend.config import get_settings
 
 logger = logging.getLogger("jarvis.usecase.autocapture")
 
@@ -47,8 +46,8 @@ ASSISTANT REPLY (for additional context):
 class AutoCaptureUseCase:
     """Detect and extract structured data from natural chat messages."""
 
-    def __init__(self):
-        self._client = AsyncGroq(api_key=get_settings().groq_api_key)
+    def __init__(self, client: AsyncGroq):
+        self._client = client
 
     async def detect_and_extract(
         self, user_message: str, assistant_reply: str
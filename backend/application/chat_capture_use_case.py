@@ -0,0 +1,136 @@
+"""
+Chat capture use case — the background half of auto-capture.
+Runs in the EventWorker on CHAT_EXCHANGE_COMPLETED: extracts learnings,
+decisions and objectives from one chat exchange, saves them, and records
+the outcome under capture:<id> in the staging cache, where the client
+polls for it (GET /chat/captures/{id}) or receives it on the chat stream.
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional
+from backend.ports.interfaces import (
+    VectorStore, EmbeddingProvider, LearningRepository, DecisionLogRepository, StagingCache,
+)
+from backend.domain.models import Learning, LearningCategory, DecisionLog
+from backend.application.auto_capture_use_case import AutoCaptureUseCase
+
+logger = logging.getLogger("jarvis.usecase.chatcapture")
+
+CAPTURE_TTL_SECONDS = 3600   # how long a client can still collect a capture's result
+
+
+def capture_key(capture_id: str) -> str:
+    return f"capture:{capture_id}"
+
+
+class ChatCaptureUseCase:
+    """Detect, save and publish the structured items in one chat exchange."""
+
+    def __init__(
+        self,
+        auto_capture: AutoCaptureUseCase,
+        vector_store: VectorStore,
+        embedding: EmbeddingProvider,
+        learning_repo: LearningRepository,
+        decision_repo: DecisionLogRepository,
+        cache: StagingCache,
+    ):
+        self._auto_capture = auto_capture
+        self._vector_store = vector_store
+        self._embedding = embedding
+        self._learning_repo = learning_repo
+        self._decision_repo = decision_repo
+        self._cache = cache
+
+    async def execute(self, capture_id: str, message: str, reply: str) -> List[Dict]:
+        """Capture the exchange; the cache entry ends "done" with the saved items, or "failed"."""
+        auto_captured = []
+        try:
+            extracted = await self._auto_capture.detect_and_extract(message, reply)
+            for item in extracted:
+                saved_item = await self._save_captured_item(item)
+                if saved_item:
+                    auto_captured.append(saved_item)
+            if auto_captured:
+                logger.info("[AUTOCAPTURE] Capture %s saved %d items: %s",
+                            capture_id, len(auto_captured), [i["type"] for i in auto_captured])
+        except Exception as e:
+            logger.warning("[AUTOCAPTURE] Capture %s failed: %s", capture_id, e)
+            await self._cache.store(capture_key(capture_id), {"status": "failed", "items": []}, ttl=CAPTURE_TTL_SECONDS)
+            return []
+
+        await self._cache.store(capture_key(capture_id), {"status": "done", "items": auto_captured}, ttl=CAPTURE_TTL_SECONDS)
+        return auto_captured
+
+    async def _save_captured_item(self, item: Dict) -> Optional[Dict]:
+        """Save an auto-captured item to the appropriate repo + vector store."""
+        item_type = item.get("type")
+
+        try:
+            if item_type == "learning":
+                cat_str = item.get("category", "insight")
+                try:
+                    category = LearningCategory(cat_str)
+                except ValueError:
+                    category = LearningCategory.INSIGHT
+
+                learning = Learning(
+                    content=item.get("content", ""),
+                    category=category,
+                    tags=item.get("tags", []),
+                )
+                emb = await self._embedding.embed(learning.embedding_text())
+                payload = learning.index_payload()
+
+                await asyncio.gather(
+                    self._learning_repo.save(learning),
+                    self._vector_store.upsert(learning.id, emb, payload),
+                    return_exceptions=True,
+                )
+                logger.info("[AUTOCAPTURE] Saved learning: %s [%s]", learning.id, category.value)
+                return {
+                    "type": "learning",
+                    "id": learning.id,
+                    "content": learning.content,
+                    "category": category.value,
+                    "tags": learning.tags,
+                }
+
+            elif item_type == "decision":
+                decision = DecisionLog(
+                    decision=item.get("decision", ""),
+                    why=item.get("why", "") or "Captured from conversation",
+                    context=item.get("context", "") or "Auto-captured from chat",
+                    expected_outcome=item.get("expected_outcome", "") or "",
+                    tags=item.get("tags", []),
+                )
+                emb = await self._embedding.embed(decision.embedding_text())
+                payload = decision.index_payload()
+
+                await asyncio.gather(
+                    self._decision_repo.save(decision),
+                    self._vector_store.upsert(decision.id, emb, payload),
+                    return_exceptions=True,
+                )
+                logger.info("[AUTOCAPTURE] Saved decision: %s", decision.id)
+                return {
+                    "type": "decision",
+                    "id": decision.id,
+                    "decision": decision.decision,
+                    "tags": decision.tags,
+                }
+
+            elif item_type == "objective":
+                # Return as a suggestion; objectives need user confirmation
+                return {
+                    "type": "objective_suggestion",
+                    "text": item.get("text", ""),
+                    "tags": item.get("tags", []),
+                }
+
+        except Exception as e:
+            logger.warning("[AUTOCAPTURE] Failed to save %s: %s", item_type, e)
+            return None
+
+        return None
@@ -4,23 +4,37 @@ Always surfaces learnings from past failures, decisions, and reflections.
 Persists all conversations to Postgres for cross-session memory.
 """
 
+import asyncio
 import logging
+import time
+import uuid
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import AsyncIterator, Awaitable, List, Dict, Optional, Tuple, TypeVar
 from groq import AsyncGroq
 from backend.ports.interfaces import (
-    VectorStore, EmbeddingProvider, ChatHistoryRepository,
-    LearningRepository, DecisionLogRepository,
+    VectorStore, EmbeddingProvider, ChatHistoryRepository, EventBus, StagingCache,
 )
-from backend.domain.models import (
-    ChatMessageRecord, ChatSession,
-    Learning, LearningCategory, DecisionLog,
-)
-from backend.application.auto_capture_use_case import AutoCaptureUseCase
-from backend.config import get_settings
+from backend.domain.events import DomainEvent, EventType
+from backend.domain.models import ChatMessageRecord, ChatSession, RankingPolicy
+from backend.application.chat_capture_use_case import CAPTURE_TTL_SECONDS, capture_key
+from backend.application.diversify import MMR_CANDIDATE_FACTOR, mmr, widen
+from backend.infrastructure.prompt_budget import MESSAGE_OVERHEAD_TOKENS, PromptBudget, estimate_tokens
 
 logger = logging.getLogger("jarvis.usecase.chat")
 
+T = TypeVar("T")
+
+# Per-type recall budget for the main context probe, so a flood of one type
+# (e.g. learnings) cannot crowd objectives or decisions out of the prompt.
+CONTEXT_TYPE_LIMITS = {"objective": 2, "learning": 3, "decision": 2, "reflection": 1}
+# Only learnings and objectives carry failure signals (_failure_line).
+FAILURE_TYPES = ["learning", "objective"]
+CHAT_MODEL = "llama-3.3-70b-versatile"
+CONTEXT_FRAME = "\n--- RETRIEVED KNOWLEDGE BASE ---\n{}\n--- END KNOWLEDGE BASE ---"
+HISTORY_FRAME = "\n--- RECENT CONVERSATION HISTORY ---\n{}\n--- END HISTORY ---"
+FAILURES_HEADER = "🔴 IMPORTANT — PAST FAILURES & LESSONS TO REMEMBER:"
+CAPTURE_POLL_SECONDS = 0.5
+
 JARVIS_SYSTEM_PROMPT = """You are JARVIS, a deeply personal business assistant for a solo business owner.
 
 YOUR CORE MISSION:
@@ -87,24 +101,44 @@ STRICT RULES FOR PLANS:
 {history_context}"""
 
 
+async def _timed(timings: Dict[str, float], stage: str, awaitable: Awaitable[T]) -> T:
+    """Await `awaitable`, recording its wall time in ms under `stage`."""
+    start = time.perf_counter()
+    try:
+        return await awaitable
+    finally:
+        timings[stage] = (time.perf_counter() - start) * 1000
+
+
 class ChatUseCase:
-    """Persistent chat interface with cross-session memory, proactive learning surfacing, and auto-capture."""
+    """
+    Persistent chat interface with cross-session memory and proactive learning
+    surfacing. Auto-capture is handed to the EventWorker: the reply is returned
+    after one LLM call, with a capture_id the client collects the captured
+    items under once the worker has run (see captured()).
+    """
 
     def __init__(
         self,
         vector_store: VectorStore,
         embedding: EmbeddingProvider,
+        client: AsyncGroq,
         chat_repo: Optional[ChatHistoryRepository] = None,
-        learning_repo: Optional[LearningRepository] = None,
-        decision_repo: Optional[DecisionLogRepository] = None,
+        event_bus: Optional[EventBus] = None,
+        cache: Optional[StagingCache] = None,
+        mmr_lambda: float = 1.0,
+        ranking: Optional[RankingPolicy] = None,
+        prompt_token_budget: int = 0,
     ):
         self._vector_store = vector_store
         self._embedding = embedding
         self._chat_repo = chat_repo
-        self._learning_repo = learning_repo
-        self._decision_repo = decision_repo
-        self._client = AsyncGroq(api_key=get_settings().groq_api_key)
-        self._auto_capture = AutoCaptureUseCase()
+        self._event_bus = event_bus
+        self._cache = cache
+        self._mmr_lambda = mmr_lambda
+        self._ranking = ranking
+        self._prompt_token_budget = prompt_token_budget
+        self._client = client
 
     async def execute(
         self,
@@ -112,89 +146,185 @@ class ChatUseCase:
         session_id: Optional[str] = None,
         history: Optional[List[Dict]] = None,
     ) -> Dict:
+        messages, all_results, prompt_tokens = await self._prepare(message, session_id, history)
+
+        # 7. Call Groq LLM
+        logger.info("[CHAT] Calling Groq LLM (model=%s)...", CHAT_MODEL)
+        llm_start = time.perf_counter()
+        response = await self._complete(messages)
+
+        reply = response.choices[0].message.content
+        logger.info(
+            "[CHAT] Reply (%d chars) in %.0fms: '%s'", len(reply), (time.perf_counter() - llm_start) * 1000, reply[:100],
+        )
+        if getattr(response, "usage", None):
+            logger.info("[CHAT] Prompt tokens: ~%d estimated, %d billed", prompt_tokens, response.usage.prompt_tokens)
+
+        # 8-10. Sources, persistence, auto-capture (queued for the worker)
+        sources = self._sources(all_results)
+        await self._persist(message, session_id, reply, all_results, sources)
+        capture_id = await self._capture(message, reply, session_id)
+
+        return {
+            "reply": reply,
+            "context_used": len(all_results),
+            "sources": sources,
+            "session_id": session_id,
+            "capture_id": capture_id,
+            "prompt_tokens": prompt_tokens,
+        }
+
+    async def stream(
+        self,
+        message: str,
+        session_id: Optional[str] = None,
+        history: Optional[List[Dict]] = None,
+    ) -> AsyncIterator[Tuple[str, Dict]]:
+        """
+        execute() as a stream of (event, data) pairs: "sources" as soon as
+        retrieval is done, a "token" per streamed completion chunk, then —
+        once the completion has closed and the exchange is persisted —
+        "done" with the capture_id of the queued auto-capture. A failed
+        retrieval or completion ends the stream with "error" and persists
+        nothing.
+        """
+        try:
+            messages, all_results, prompt_tokens = await self._prepare(message, session_id, history)
+        except Exception as e:
+            logger.error("[CHAT] Stream failed before the completion: %s", e)
+            yield "error", {"message": "The assistant could not look up context for this reply."}
+            return
+        sources = self._sources(all_results)
+        yield "sources", {
+            "sources": sources, "context_used": len(all_results), "session_id": session_id,
+            "prompt_tokens": prompt_tokens,
+        }
+
+        logger.info("[CHAT] Streaming Groq LLM (model=%s)...", CHAT_MODEL)
+        llm_start = time.perf_counter()
+        parts: List[str] = []
+        try:
+            completion = await self._complete(messages, stream=True)
+            async for chunk in completion:
+                text = chunk.choices[0].delta.content if chunk.choices else None
+                if not text:
+                    continue
+                if not parts:
+                    logger.info("[CHAT] First token after %.0fms", (time.perf_counter() - llm_start) * 1000)
+                parts.append(text)
+                yield "token", {"text": text}
+        except Exception as e:
+            logger.error("[CHAT] Stream failed after %d chunks: %s", len(parts), e)
+            yield "error", {"message": "The assistant could not finish this reply."}
+            return
+
+        reply = "".join(parts)
+        logger.info(
+            "[CHAT] Streamed reply (%d chars) in %.0fms: '%s'",
+            len(reply), (time.perf_counter() - llm_start) * 1000, reply[:100],
+        )
+        await self._persist(message, session_id, reply, all_results, sources)
+        capture_id = await self._capture(message, reply, session_id)
+        yield "done", {"reply_length": len(reply), "capture_id": capture_id}
+
+    async def captured(self, capture_id: str, wait_seconds: float = 0.0) -> Optional[Dict]:
+        """
+        The auto-capture result ({"status": "pending" | "done" | "failed",
+        "items": [...]}), or None once it has expired. With wait_seconds,
+        polls until the worker has finished or the wait runs out.
+        """
+        if not self._cache:
+            return None
+        deadline = time.monotonic() + wait_seconds
+        while True:
+            record = await self._cache.retrieve(capture_key(capture_id))
+            if record is None or record["status"] != "pending" or time.monotonic() >= deadline:
+                return record
+            await asyncio.sleep(CAPTURE_POLL_SECONDS)
+
+    async def _prepare(
+        self, message: str, session_id: Optional[str], history: Optional[List[Dict]],
+    ) -> Tuple[List[Dict], List[Dict], int]:
+        """(LLM messages, the context hits that made it into the prompt, estimated prompt tokens)."""
         logger.info("[CHAT] User (session=%s): '%s'", session_id, message[:120])
 
-        # 1. Load persistent history for this session
-        persistent_history = []
-        if session_id and self._chat_repo:
-            try:
-                past_messages = await self._chat_repo.get_session_messages(session_id, limit=20)
-                persistent_history = [
-                    {"role": m.role, "content": m.content}
-                    for m in past_messages
-                ]
-                logger.info("[CHAT] Loaded %d messages from session %s", len(persistent_history), session_id)
-            except Exception as e:
-                logger.warning("[CHAT] Could not load session history: %s", e)
-
-        # 2. Retrieve relevant context via semantic search (more items for richer context)
-        query_emb = await self._embedding.embed(message)
-        context_results = await self._vector_store.search(query_emb, limit=8)
-
-        # 3. Specifically search for failures/mistakes to always surface them
-        failure_query = f"mistake failure lesson learned from {message}"
-        failure_emb = await self._embedding.embed(failure_query)
-        failure_results = await self._vector_store.search(failure_emb, limit=4)
-
-        # Merge and deduplicate results
-        seen_ids = set()
-        all_results = []
-        for r in context_results + failure_results:
-            rid = r.get("id", "")
-            if rid not in seen_ids:
-                seen_ids.add(rid)
-                all_results.append(r)
-
-        # 4. Build rich context block
-        context_block = self._build_context(all_results)
-        logger.info("[CHAT] Retrieved %d unique context items (including failure search).", len(all_results))
-
-        # 5. Build history context summary from past conversations
-        history_context = ""
-        if persistent_history:
-            recent_summary = self._summarize_recent_history(persistent_history[-10:])
-            history_context = f"\n--- RECENT CONVERSATION HISTORY ---\n{recent_summary}\n--- END HISTORY ---"
+        # 1-3. Pre-LLM pipeline: the session history load runs concurrently
+        #      with retrieval (one batched embed → one multi-query search),
+        #      so the LLM call waits only for the slower of the two.
+        timings: Dict[str, float] = {}
+        pipeline_start = time.perf_counter()
+        persistent_history, all_results = await asyncio.gather(
+            _timed(timings, "history", self._load_history(session_id)),
+            self._retrieve(message, timings),
+        )
+        logger.info(
+            "[CHAT] Pre-LLM %.1fms | %s",
+            (time.perf_counter() - pipeline_start) * 1000,
+            " ".join(f"{stage}={ms:.1f}ms" for stage, ms in timings.items()),
+        )
+
+        # 4-5. Fill the prompt token budget by priority: the instructions and the
+        #      user's message always go; then past failures, then context by
+        #      relevance, then conversation history from the newest turn back.
+        budget = PromptBudget(self._prompt_token_budget)
+        budget.reserve(
+            JARVIS_SYSTEM_PROMPT.format(context_block=CONTEXT_FRAME.format(FAILURES_HEADER), history_context=HISTORY_FRAME),
+            MESSAGE_OVERHEAD_TOKENS,
+        )
+        budget.reserve(message, MESSAGE_OVERHEAD_TOKENS)
+
+        ranked = sorted(all_results, key=lambda r: -r.get("score", 0))
+        failures = budget.take([line for line in map(self._failure_line, ranked) if line])
+        entries = budget.take([self._format_entry(i, r) for i, r in enumerate(ranked, 1)], separator_tokens=2)
+        used_results = ranked[:len(entries)]
+        context_block = self._build_context(failures, entries, dropped=len(ranked) - len(entries))
+        logger.info(
+            "[CHAT] Retrieved %d unique context items (including failure search), %d fit the prompt.",
+            len(all_results), len(entries),
+        )
+
+        # Raw turns (persistent + current session) newest first; older persisted
+        # turns that did not make it in raw are summarised if room is left.
+        combined_history = list(persistent_history)
+        for turn in (history or [])[-10:]:
+            combined_history.append({"role": turn.get("role", "user"), "content": turn.get("content", "")})
+        recent = combined_history[-10:][::-1]
+        kept = budget.take([turn["content"] for turn in recent], separator_tokens=MESSAGE_OVERHEAD_TOKENS)
+        raw_turns = [dict(turn, content=content) for turn, content in zip(recent, kept)][::-1]
+        older = combined_history[:len(combined_history) - len(raw_turns)][-10:]
+        summary = budget.take(self._summarize_recent_history(older[::-1]))[::-1]
+
+        history_context = HISTORY_FRAME.format("\n".join(summary)) if summary else ""
 
         # 6. Build messages for Groq
         system_content = JARVIS_SYSTEM_PROMPT.format(
-            context_block=f"\n--- RETRIEVED KNOWLEDGE BASE ---\n{context_block}\n--- END KNOWLEDGE BASE ---",
+            context_block=CONTEXT_FRAME.format(context_block),
             history_context=history_context,
         )
 
         messages = [{"role": "system", "content": system_content}]
-
-        # Add conversation history (persistent + current session)
-        combined_history = persistent_history or []
-        if history:
-            for turn in history[-10:]:
-                combined_history.append({
-                    "role": turn.get("role", "user"),
-                    "content": turn.get("content", ""),
-                })
-
-        # Only use last 10 turns to stay within context window
-        for turn in combined_history[-10:]:
-            messages.append({
-                "role": turn["role"],
-                "content": turn["content"],
-            })
-
+        messages.extend({"role": turn["role"], "content": turn["content"]} for turn in raw_turns)
         messages.append({"role": "user", "content": message})
 
-        # 7. Call Groq LLM
-        logger.info("[CHAT] Calling Groq LLM (model=llama-3.3-70b-versatile)...")
-        response = await self._client.chat.completions.create(
-            model="llama-3.3-70b-versatile",
+        prompt_tokens = sum(estimate_tokens(m["content"]) + MESSAGE_OVERHEAD_TOKENS for m in messages)
+        logger.info(
+            "[CHAT] Prompt ~%d tokens (budget %s) | context %d/%d items, history %d/%d raw turns + %d summarised",
+            prompt_tokens, self._prompt_token_budget or "none", len(entries), len(ranked),
+            len(raw_turns), len(recent), len(summary),
+        )
+        return messages, used_results, prompt_tokens
+
+    def _complete(self, messages: List[Dict], stream: bool = False):
+        return self._client.chat.completions.create(
+            model=CHAT_MODEL,
             temperature=0.4,
             max_tokens=1500,
             messages=messages,
+            stream=stream,
         )
 
-        reply = response.choices[0].message.content
-        logger.info("[CHAT] Reply (%d chars): '%s'", len(reply), reply[:100])
-
-        # 8. Build sources list
-        sources = [
+    def _sources(self, all_results: List[Dict]) -> List[Dict]:
+        return [
             {
                 "type": r.get("payload", {}).get("_type", "unknown"),
                 "score": round(r.get("score", 0), 3),
@@ -203,210 +333,181 @@ class ChatUseCase:
             for r in all_results[:5]
         ]
 
-        # 9. Persist messages to Postgres
-        if session_id and self._chat_repo:
-            try:
-                # Check if session exists, create if not
-                existing_session = await self._chat_repo.get_session(session_id)
-                if not existing_session:
-                    title = message[:60] + ("…" if len(message) > 60 else "")
-                    new_session = ChatSession(
-                        id=session_id,
-                        title=title,
-                        message_count=0,
-                    )
-                    await self._chat_repo.create_session(new_session)
-                    existing_session = new_session
-
-                # Save user message
-                user_msg = ChatMessageRecord(
-                    session_id=session_id,
-                    role="user",
-                    content=message,
-                )
-                await self._chat_repo.save_message(user_msg)
-
-                # Save assistant reply
-                assistant_msg = ChatMessageRecord(
-                    session_id=session_id,
-                    role="assistant",
-                    content=reply,
-                    context_used=len(all_results),
-                    sources=sources,
-                )
-                await self._chat_repo.save_message(assistant_msg)
-
-                # Update session metadata
-                existing_session.updated_at = datetime.utcnow()
-                existing_session.message_count += 2
-                if existing_session.message_count == 2:
-                    existing_session.title = message[:60] + ("…" if len(message) > 60 else "")
-                await self._chat_repo.update_session(existing_session)
-
-                logger.info("[CHAT] Persisted messages for session %s", session_id)
-            except Exception as e:
-                logger.error("[CHAT] Failed to persist chat: %s", e)
-
-        # 10. Auto-capture learnings, decisions, objectives from message
-        auto_captured = []
+    async def _persist(
+        self, message: str, session_id: Optional[str], reply: str, all_results: List[Dict], sources: List[Dict],
+    ) -> None:
+        """Save both turns of the exchange and bump the session; failures are logged, not raised."""
+        if not session_id or not self._chat_repo:
+            return
         try:
-            extracted = await self._auto_capture.detect_and_extract(message, reply)
-            for item in extracted:
-                saved_item = await self._save_captured_item(item)
-                if saved_item:
-                    auto_captured.append(saved_item)
-            if auto_captured:
-                logger.info("[CHAT] Auto-captured %d items: %s",
-                            len(auto_captured), [i["type"] for i in auto_captured])
+            # Check if session exists, create if not
+            existing_session = await self._chat_repo.get_session(session_id)
+            if not existing_session:
+                title = message[:60] + ("…" if len(message) > 60 else "")
+                new_session = ChatSession(
+                    id=session_id,
+                    title=title,
+                    message_count=0,
+                )
+                await self._chat_repo.create_session(new_session)
+                existing_session = new_session
+
+            # Save user message
+            user_msg = ChatMessageRecord(
+                session_id=session_id,
+                role="user",
+                content=message,
+            )
+            await self._chat_repo.save_message(user_msg)
+
+            # Save assistant reply
+            assistant_msg = ChatMessageRecord(
+                session_id=session_id,
+                role="assistant",
+                content=reply,
+                context_used=len(all_results),
+                sources=sources,
+            )
+            await self._chat_repo.save_message(assistant_msg)
+
+            # Update session metadata
+            existing_session.updated_at = datetime.utcnow()
+            existing_session.message_count += 2
+            if existing_session.message_count == 2:
+                existing_session.title = message[:60] + ("…" if len(message) > 60 else "")
+            await self._chat_repo.update_session(existing_session)
+
+            logger.info("[CHAT] Persisted messages for session %s", session_id)
         except Exception as e:
-            logger.warning("[CHAT] Auto-capture failed (non-fatal): %s", e)
-
-        return {
-            "reply": reply,
-            "context_used": len(all_results),
-            "sources": sources,
-            "session_id": session_id,
-            "auto_captured": auto_captured,
-        }
-
-    async def _save_captured_item(self, item: Dict) -> Optional[Dict]:
-        """Save an auto-captured item to the appropriate repo + vector store."""
-        import asyncio
-        item_type = item.get("type")
+            logger.error("[CHAT] Failed to persist chat: %s", e)
 
+    async def _capture(self, message: str, reply: str, session_id: Optional[str]) -> Optional[str]:
+        """Queue auto-capture of the exchange for the EventWorker; returns its capture_id (non-fatal)."""
+        if not self._event_bus or not self._cache:
+            return None
+        capture_id = str(uuid.uuid4())
         try:
-            if item_type == "learning" and self._learning_repo:
-                cat_str = item.get("category", "insight")
-                try:
-                    category = LearningCategory(cat_str)
-                except ValueError:
-                    category = LearningCategory.INSIGHT
-
-                learning = Learning(
-                    content=item.get("content", ""),
-                    category=category,
-                    tags=item.get("tags", []),
-                )
-                emb = await self._embedding.embed(learning.embedding_text())
-                payload = learning.model_dump(mode="json")
-                payload["_type"] = "learning"
-
-                await asyncio.gather(
-                    self._learning_repo.save(learning),
-                    self._vector_store.upsert(learning.id, emb, payload),
-                    return_exceptions=True,
-                )
-                logger.info("[AUTOCAPTURE] Saved learning: %s [%s]", learning.id, category.value)
-                return {
-                    "type": "learning",
-                    "id": learning.id,
-                    "content": learning.content,
-                    "category": category.value,
-                    "tags": learning.tags,
-                }
-
-            elif item_type == "decision" and self._decision_repo:
-                decision = DecisionLog(
-                    decision=item.get("decision", ""),
-                    why=item.get("why", "") or "Captured from conversation",
-                    context=item.get("context", "") or "Auto-captured from chat",
-                    expected_outcome=item.get("expected_outcome", "") or "",
-                    tags=item.get("tags", []),
-                )
-                emb = await self._embedding.embed(decision.embedding_text())
-                payload = decision.model_dump(mode="json")
-                payload["_type"] = "decision"
-
-                await asyncio.gather(
-                    self._decision_repo.save(decision),
-                    self._vector_store.upsert(decision.id, emb, payload),
-                    return_exceptions=True,
-                )
-                logger.info("[AUTOCAPTURE] Saved decision: %s", decision.id)
-                return {
-                    "type": "decision",
-                    "id": decision.id,
-                    "decision": decision.decision,
-                    "tags": decision.tags,
-                }
-
-            elif item_type == "objective":
-                # Return as a suggestion; objectives need user confirmation
-                return {
-                    "type": "objective_suggestion",
-                    "text": item.get("text", ""),
-                    "tags": item.get("tags", []),
-                }
-
+            # "pending" is written before the event, so the worker's result can never be overwritten by it.
+            await self._cache.store(capture_key(capture_id), {"status": "pending", "items": []}, ttl=CAPTURE_TTL_SECONDS)
+            await self._event_bus.publish(
+                "objective_events",
+                DomainEvent(
+                    event_type=EventType.CHAT_EXCHANGE_COMPLETED,
+                    objective_id="",
+                    payload={"capture_id": capture_id, "message": message, "reply": reply, "session_id": session_id},
+                    idempotency_key=capture_id,
+                ),
+            )
         except Exception as e:
-            logger.warning("[AUTOCAPTURE] Failed to save %s: %s", item_type, e)
+            logger.warning("[CHAT] Could not queue auto-capture (non-fatal): %s", e)
             return None
+        logger.info("[CHAT] Auto-capture queued: capture_id=%s", capture_id)
+        return capture_id
 
-        return None
+    async def _load_history(self, session_id: Optional[str]) -> List[Dict]:
+        """The session's last 20 persisted turns; empty when there is no session or the load fails."""
+        if not session_id or not self._chat_repo:
+            return []
+        try:
+            past_messages = await self._chat_repo.get_session_messages(session_id, limit=20)
+        except Exception as e:
+            logger.warning("[CHAT] Could not load session history: %s", e)
+            return []
+        logger.info("[CHAT] Loaded %d messages from session %s", len(past_messages), session_id)
+        return [{"role": m.role, "content": m.content} for m in past_messages]
+
+    async def _retrieve(self, message: str, timings: Dict[str, float]) -> List[Dict]:
+        """Context for the message plus past failures/mistakes, so they always surface."""
+        # The message and the failure probe are embedded in one model call…
+        failure_query = f"mistake failure lesson learned from {message}"
+        query_emb, failure_emb = await _timed(timings, "embed", self._embedding.embed_many([message, failure_query]))
+
+        # …and searched in one pass over the index, merged and deduplicated by the store.
+        if self._mmr_lambda < 1.0:
+            # Over-fetch, then let MMR drop near-duplicates before they reach the prompt.
+            context_hits, failure_hits = await _timed(timings, "search", self._vector_store.search_many(
+                [query_emb, failure_emb],
+                [widen(CONTEXT_TYPE_LIMITS), 4 * MMR_CANDIDATE_FACTOR],
+                types=[None, FAILURE_TYPES],
+                with_vectors=True,
+                ranking=self._ranking,
+            ))
+            return self._vector_store.merge_hits([
+                mmr(context_hits, 0, self._mmr_lambda, type_limits=CONTEXT_TYPE_LIMITS),
+                mmr(failure_hits, 4, self._mmr_lambda),
+            ])
+        return await _timed(timings, "search", self._vector_store.search_many(
+            [query_emb, failure_emb],
+            [CONTEXT_TYPE_LIMITS, 4],
+            types=[None, FAILURE_TYPES],
+            union=True,
+            ranking=self._ranking,
+        ))
 
     @staticmethod
-    def _build_context(results: List[Dict]) -> str:
-        if not results:
+    def _build_context(failures: List[str], entries: List[str], dropped: int = 0) -> str:
+        if not failures and not entries:
+            if dropped:
+                return "Relevant knowledge was found but did not fit in this prompt."
             return "No prior knowledge found. This appears to be a fresh start — no objectives, learnings, or decisions recorded yet."
 
-        parts = []
-        failures = []
-        for i, r in enumerate(results, 1):
-            payload = r.get("payload", {})
-            item_type = payload.get("_type", "unknown")
-            score = r.get("score", 0)
-
-            if item_type == "objective":
-                status = payload.get('status', 'N/A')
-                entry = (
-                    f"{i}. [Objective] (relevance: {score:.2f})\n"
-                    f"   What: {payload.get('what', 'N/A')}\n"
-                    f"   Status: {status}\n"
-                    f"   Progress: {payload.get('workdone', 0)}%"
-                )
-                parts.append(entry)
-                if status == "failed":
-                    failures.append(f"⚠️ FAILED OBJECTIVE: {payload.get('what', 'N/A')}")
-
-            elif item_type == "learning":
-                category = payload.get('category', '?')
-                entry = (
-                    f"{i}. [Learning/{category}] (relevance: {score:.2f})\n"
-                    f"   {payload.get('content', 'N/A')}"
-                )
-                parts.append(entry)
-                if category in ("mistake", "pattern"):
-                    failures.append(f"📝 PAST {category.upper()}: {payload.get('content', 'N/A')[:120]}")
-
-            elif item_type == "decision":
-                parts.append(
-                    f"{i}. [Decision] (relevance: {score:.2f})\n"
-                    f"   {payload.get('decision', 'N/A')}\n"
-                    f"   Why: {payload.get('why', 'N/A')}"
-                )
-
-            elif item_type == "reflection":
-                parts.append(
-                    f"{i}. [Reflection] (relevance: {score:.2f})\n"
-                    f"   {payload.get('summary', 'N/A')[:200]}"
-                )
-            else:
-                parts.append(f"{i}. [{item_type}] (relevance: {score:.2f})")
-
+        parts = list(entries)
         # Highlight failures/mistakes prominently
         if failures:
-            parts.insert(0, "🔴 IMPORTANT — PAST FAILURES & LESSONS TO REMEMBER:\n" + "\n".join(failures) + "\n")
+            parts.insert(0, FAILURES_HEADER + "\n" + "\n".join(failures) + "\n")
 
         return "\n\n".join(parts)
 
     @staticmethod
-    def _summarize_recent_history(history: List[Dict]) -> str:
+    def _format_entry(i: int, r: Dict) -> str:
+        payload = r.get("payload", {})
+        item_type = payload.get("_type", "unknown")
+        score = r.get("score", 0)
+
+        if item_type == "objective":
+            return (
+                f"{i}. [Objective] (relevance: {score:.2f})\n"
+                f"   What: {payload.get('what', 'N/A')}\n"
+                f"   Status: {payload.get('status', 'N/A')}\n"
+                f"   Progress: {payload.get('workdone', 0)}%"
+            )
+        if item_type == "learning":
+            return (
+                f"{i}. [Learning/{payload.get('category', '?')}] (relevance: {score:.2f})\n"
+                f"   {payload.get('content', 'N/A')}"
+            )
+        if item_type == "decision":
+            return (
+                f"{i}. [Decision] (relevance: {score:.2f})\n"
+                f"   {payload.get('decision', 'N/A')}\n"
+                f"   Why: {payload.get('why', 'N/A')}"
+            )
+        if item_type == "reflection":
+            return (
+                f"{i}. [Reflection] (relevance: {score:.2f})\n"
+                f"   {payload.get('summary', 'N/A')[:200]}"
+            )
+        return f"{i}. [{item_type}] (relevance: {score:.2f})"
+
+    @staticmethod
+    def _failure_line(r: Dict) -> Optional[str]:
+        payload = r.get("payload", {})
+        item_type = payload.get("_type")
+        if item_type == "objective" and payload.get("status") == "failed":
+            return f"⚠️ FAILED OBJECTIVE: {payload.get('what', 'N/A')}"
+        category = payload.get("category")
+        if item_type == "learning" and category in ("mistake", "pattern"):
+            return f"📝 PAST {category.upper()}: {payload.get('content', 'N/A')[:120]}"
+        return None
+
+    @staticmethod
+    def _summarize_recent_history(history: List[Dict]) -> List[str]:
         parts = []
         for msg in history:
             role = msg.get("role", "unknown").capitalize()
             content = msg.get("content", "")[:200]
             parts.append(f"[{role}]: {content}")
-        return "\n".join(parts)
+        return parts
 
     @staticmethod
     def _preview(payload: Dict) -> str:
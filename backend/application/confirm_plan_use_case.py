@@ -92,8 +92,7 @@ class ConfirmPlanUseCase:
     async def _persist_committed(self, objective: Objective) -> None:
         logger.info("[PERSIST] Generating embedding for objective_id=%s ...", objective.id)
         embedding = await self._embedding.embed(objective.embedding_text())
-        payload = objective.model_dump(mode="json")
-        payload["_type"] = "objective"
+        payload = objective.index_payload()
 
         logger.info("[PERSIST] Saving to Postgres + VectorStore for objective_id=%s ...", objective.id)
         results = await asyncio.gather(
@@ -1,15 +1,24 @@
+import asyncio
 import logging
 from functools import lru_cache
+from typing import Dict
+from groq import AsyncGroq
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 from backend.config import get_settings
+from backend.infrastructure.database import get_session_factory
 from backend.infrastructure.redis_adapter import RedisStagingCache, RedisEventBus
 from backend.infrastructure.input_adapter import FileInputExtractor
 from backend.infrastructure.ai_adapter import (
-    GroqStructuringAgent, GroqPlanningAgent, GroqReflectionAgent, GroqInsightAgent,
+    GroqStructuringAgent, GroqPlanningAgent, GroqReflectionAgent, GroqInsightAgent, create_groq_client,
 )
 from backend.infrastructure.embedding_adapter import LocalEmbeddingProvider
+from backend.infrastructure.embedding_batcher import MicroBatchingEmbeddingProvider
+from backend.infrastructure.embedding_cache import CachingEmbeddingProvider
 from backend.infrastructure.vector_store import InMemoryVectorStore
+from backend.infrastructure.ivf_vector_store import IVFVectorStore
+from backend.infrastructure.pgvector_store import PgVectorStore
+from backend.infrastructure.lexical_index import BM25Index, LexicalMirrorStore
 from backend.infrastructure.postgres_adapter import (
     PostgresObjectiveRepository,
     PostgresLearningRepository,
@@ -25,7 +34,13 @@ from backend.application.learning_use_case import CaptureLearningUseCase
 from backend.application.decision_use_case import LogDecisionUseCase
 from backend.application.reflection_use_case import ReflectionUseCase
 from backend.application.search_use_case import SemanticSearchUseCase
+from backend.application.payload_hydrator import PayloadHydrator
 from backend.application.chat_use_case import ChatUseCase
+from backend.application.auto_capture_use_case import AutoCaptureUseCase
+from backend.application.chat_capture_use_case import ChatCaptureUseCase
+from backend.application.rehydrate_index_use_case import RehydrateIndexUseCase
+from backend.application.reconcile_index_use_case import ReconcileIndexUseCase
+from backend.application.lexical_index_use_case import BuildLexicalIndexUseCase
 from backend.application.event_worker import EventWorker
 
 
@@ -54,6 +69,8 @@ async def shutdown_redis():
         logger.info("  CONTAINER ▸ Closing Redis connection…")
         await _redis_client.aclose()
         _redis_client = None
+        _get_ingest_use_case.cache_clear()
+        _get_chat_use_case.cache_clear()
         logger.info("  CONTAINER ▸ Redis closed ✓")
 
 
@@ -62,34 +79,141 @@ def _get_extractor():
     return FileInputExtractor()
 
 
+@lru_cache()
+def _get_llm_client() -> AsyncGroq:
+    """One Groq client (and httpx connection pool) shared by every agent and use case."""
+    settings = get_settings()
+    logger.info(
+        "\n╔══ CONTAINER ▸ GROQ CLIENT ═══════════════════════════════\n"
+        "║  Connections : %d (%d kept alive for %.0fs)\n"
+        "║  Timeout     : %.0fs, %d retries\n"
+        "╚══════════════════════════════════════════════════════════\n",
+        settings.groq_max_connections, settings.groq_max_keepalive_connections,
+        settings.groq_keepalive_expiry_seconds, settings.groq_timeout_seconds, settings.groq_max_retries,
+    )
+    return create_groq_client(
+        api_key=settings.groq_api_key,
+        max_connections=settings.groq_max_connections,
+        max_keepalive_connections=settings.groq_max_keepalive_connections,
+        keepalive_expiry=settings.groq_keepalive_expiry_seconds,
+        timeout=settings.groq_timeout_seconds,
+        max_retries=settings.groq_max_retries,
+    )
+
+
+async def shutdown_llm_client():
+    if _get_llm_client.cache_info().currsize:
+        logger.info("  CONTAINER ▸ Closing Groq client…")
+        await _get_llm_client().close()
+        _get_llm_client.cache_clear()
+
+
 @lru_cache()
 def _get_structuring_agent():
-    return GroqStructuringAgent()
+    return GroqStructuringAgent(_get_llm_client())
 
 
 @lru_cache()
 def _get_planning_agent():
-    return GroqPlanningAgent()
+    return GroqPlanningAgent(_get_llm_client())
 
 
 @lru_cache()
 def _get_reflection_agent():
-    return GroqReflectionAgent()
+    return GroqReflectionAgent(_get_llm_client(), prompt_token_budget=get_settings().reflection_prompt_token_budget)
 
 
 @lru_cache()
 def _get_insight_agent():
-    return GroqInsightAgent()
+    return GroqInsightAgent(_get_llm_client())
+
+
+@lru_cache()
+def _get_auto_capture():
+    return AutoCaptureUseCase(_get_llm_client())
 
 
 @lru_cache()
 def _get_embedding():
-    return LocalEmbeddingProvider()
+    settings = get_settings()
+    provider = LocalEmbeddingProvider()
+    if settings.embedding_batch_max_size > 1:
+        provider = MicroBatchingEmbeddingProvider(
+            provider,
+            max_batch_size=settings.embedding_batch_max_size,
+            max_wait_ms=settings.embedding_batch_max_wait_ms,
+        )
+    if settings.embedding_cache_max_mb > 0:
+        # Outermost, so cache hits never wait on a micro-batch.
+        provider = CachingEmbeddingProvider(
+            provider,
+            model_name=settings.embedding_model,
+            max_bytes=settings.embedding_cache_max_mb * 1024 * 1024,
+            redis=get_redis if settings.embedding_cache_redis else None,
+            redis_ttl_seconds=settings.embedding_cache_redis_ttl_seconds,
+        )
+    return provider
+
+
+def embedding_stats() -> dict:
+    """Embedding executor metrics — empty until the model has been loaded."""
+    if not _get_embedding.cache_info().currsize:
+        return {}
+    return _get_embedding().stats()
+
+
+def shutdown_embedding():
+    if _get_embedding.cache_info().currsize:
+        _get_embedding().close()
 
 
 @lru_cache()
 def _get_vector_store():
-    return InMemoryVectorStore()
+    settings = get_settings()
+    if settings.vector_backend == "pgvector":
+        return PgVectorStore(
+            dimension=settings.embedding_dimension,
+            index=settings.pgvector_index,
+            lists=settings.pgvector_lists,
+            ef_search=settings.pgvector_ef_search,
+            probes=settings.pgvector_probes,
+        )
+    if settings.vector_backend == "qdrant":
+        from backend.infrastructure.qdrant_adapter import QdrantVectorStore   # optional dependency
+        return QdrantVectorStore(
+            host=settings.qdrant_host,
+            port=settings.qdrant_port,
+            collection=settings.qdrant_collection,
+            dimension=settings.embedding_dimension,
+            batch_size=settings.qdrant_batch_size,
+            flush_interval_ms=settings.qdrant_flush_interval_ms,
+            prefer_grpc=settings.qdrant_prefer_grpc,
+        )
+    storage = dict(quantization=settings.vector_quantization, rerank=settings.vector_rerank)
+    if settings.vector_index == "ivf":
+        return IVFVectorStore(
+            dimension=settings.embedding_dimension,
+            nlist=settings.ivf_nlist,
+            nprobe=settings.ivf_nprobe,
+            **storage,
+        )
+    return InMemoryVectorStore(dimension=settings.embedding_dimension, **storage)
+
+
+@lru_cache()
+def _get_lexical_index():
+    if get_settings().search_fusion == "none":
+        return None
+    return BM25Index()
+
+
+@lru_cache()
+def _get_indexed_store():
+    """The vector store use cases write through: every write also reaches the keyword index."""
+    lexical = _get_lexical_index()
+    if lexical is None:
+        return _get_vector_store()
+    return LexicalMirrorStore(_get_vector_store(), lexical)
 
 
 def _get_cache(redis: Redis) -> RedisStagingCache:
@@ -100,10 +224,10 @@ def _get_event_bus(redis: Redis) -> RedisEventBus:
     return RedisEventBus(redis)
 
 
-# ─── Original use cases ───────────────────────────────────────────
-async def get_ingest_use_case() -> IngestUseCase:
+# ─── Session-free use cases: one per Redis client, i.e. per process ──
+@lru_cache()
+def _get_ingest_use_case(redis: Redis) -> IngestUseCase:
     logger.debug("  CONTAINER ▸ Building IngestUseCase")
-    redis = await get_redis()
     return IngestUseCase(
         extractor=_get_extractor(),
         structuring_agent=_get_structuring_agent(),
@@ -113,13 +237,33 @@ async def get_ingest_use_case() -> IngestUseCase:
     )
 
 
+@lru_cache()
+def _get_chat_use_case(redis: Redis) -> ChatUseCase:
+    logger.debug("  CONTAINER ▸ Building ChatUseCase (no DB session)")
+    return ChatUseCase(
+        vector_store=_get_indexed_store(),
+        embedding=_get_embedding(),
+        client=_get_llm_client(),
+        event_bus=_get_event_bus(redis),
+        cache=_get_cache(redis),
+        mmr_lambda=get_settings().mmr_lambda,
+        ranking=get_settings().chat_ranking,
+        prompt_token_budget=get_settings().chat_prompt_token_budget,
+    )
+
+
+# ─── Original use cases ───────────────────────────────────────────
+async def get_ingest_use_case() -> IngestUseCase:
+    return _get_ingest_use_case(await get_redis())
+
+
 async def get_confirm_plan_use_case(session: AsyncSession) -> ConfirmPlanUseCase:
     logger.debug("  CONTAINER ▸ Building ConfirmPlanUseCase")
     redis = await get_redis()
     return ConfirmPlanUseCase(
         cache=_get_cache(redis),
         repo=PostgresObjectiveRepository(session),
-        vector_store=_get_vector_store(),
+        vector_store=_get_indexed_store(),
         embedding=_get_embedding(),
         event_bus=_get_event_bus(redis),
     )
@@ -130,7 +274,7 @@ async def get_update_progress_use_case(session: AsyncSession) -> UpdateProgressU
     redis = await get_redis()
     return UpdateProgressUseCase(
         repo=PostgresObjectiveRepository(session),
-        vector_store=_get_vector_store(),
+        vector_store=_get_indexed_store(),
         embedding=_get_embedding(),
         event_bus=_get_event_bus(redis),
     )
@@ -151,7 +295,7 @@ async def get_learning_use_case(session: AsyncSession) -> CaptureLearningUseCase
     redis = await get_redis()
     return CaptureLearningUseCase(
         repo=PostgresLearningRepository(session),
-        vector_store=_get_vector_store(),
+        vector_store=_get_indexed_store(),
         embedding=_get_embedding(),
         event_bus=_get_event_bus(redis),
     )
@@ -162,48 +306,69 @@ async def get_decision_use_case(session: AsyncSession) -> LogDecisionUseCase:
     redis = await get_redis()
     return LogDecisionUseCase(
         repo=PostgresDecisionLogRepository(session),
-        vector_store=_get_vector_store(),
+        vector_store=_get_indexed_store(),
         embedding=_get_embedding(),
         event_bus=_get_event_bus(redis),
     )
 
 
+def _get_hydrator(session: AsyncSession) -> PayloadHydrator:
+    return PayloadHydrator(
+        objective_repo=PostgresObjectiveRepository(session),
+        learning_repo=PostgresLearningRepository(session),
+        decision_repo=PostgresDecisionLogRepository(session),
+        reflection_repo=PostgresReflectionRepository(session),
+    )
+
+
 async def get_reflection_use_case(session: AsyncSession) -> ReflectionUseCase:
     logger.debug("  CONTAINER ▸ Building ReflectionUseCase")
     redis = await get_redis()
     return ReflectionUseCase(
         reflection_agent=_get_reflection_agent(),
         repo=PostgresReflectionRepository(session),
-        vector_store=_get_vector_store(),
+        vector_store=_get_indexed_store(),
         embedding=_get_embedding(),
         event_bus=_get_event_bus(redis),
+        hydrator=_get_hydrator(session),
+        mmr_lambda=get_settings().mmr_lambda,
+        ranking=get_settings().reflection_ranking,
     )
 
 
-async def get_search_use_case() -> SemanticSearchUseCase:
+async def get_search_use_case(session: AsyncSession) -> SemanticSearchUseCase:
     logger.debug("  CONTAINER ▸ Building SemanticSearchUseCase")
+    settings = get_settings()
     return SemanticSearchUseCase(
-        vector_store=_get_vector_store(),
+        vector_store=_get_indexed_store(),
         embedding=_get_embedding(),
+        hydrator=_get_hydrator(session),
+        lexical_index=_get_lexical_index(),
+        fusion=settings.search_fusion,
+        vector_weight=settings.search_vector_weight,
+        rrf_k=settings.search_rrf_k,
+        mmr_lambda=settings.mmr_lambda,
+        ranking=settings.search_ranking,
     )
 
 
 async def get_chat_use_case() -> ChatUseCase:
-    logger.debug("  CONTAINER ▸ Building ChatUseCase (no DB session)")
-    return ChatUseCase(
-        vector_store=_get_vector_store(),
-        embedding=_get_embedding(),
-    )
+    return _get_chat_use_case(await get_redis())
 
 
 async def get_chat_use_case_with_history(session: AsyncSession) -> ChatUseCase:
     logger.debug("  CONTAINER ▸ Building ChatUseCase (with persistent history + auto-capture)")
+    redis = await get_redis()
     return ChatUseCase(
-        vector_store=_get_vector_store(),
+        vector_store=_get_indexed_store(),
         embedding=_get_embedding(),
+        client=_get_llm_client(),
         chat_repo=PostgresChatHistoryRepository(session),
-        learning_repo=PostgresLearningRepository(session),
-        decision_repo=PostgresDecisionLogRepository(session),
+        event_bus=_get_event_bus(redis),
+        cache=_get_cache(redis),
+        mmr_lambda=get_settings().mmr_lambda,
+        ranking=get_settings().chat_ranking,
+        prompt_token_budget=get_settings().chat_prompt_token_budget,
     )
 
 
@@ -231,17 +396,147 @@ async def get_reflection_repo(session: AsyncSession) -> PostgresReflectionReposi
     return PostgresReflectionRepository(session)
 
 
+# ─── Vector index lifecycle ───────────────────────────────────────
+_vector_index_ready = False
+
+
+def vector_index_ready() -> bool:
+    """True once the vector index holds the full corpus (snapshot restored and reconciled, table populated or rehydrated)."""
+    return _vector_index_ready
+
+
+async def init_vector_store() -> bool:
+    """
+    Memory-map the vector index snapshot off the event loop. Returns True when
+    a snapshot was restored; the id map and page-in finish in the background,
+    and the index is ready once reconcile_vector_store() has caught it up
+    with Postgres. pgvector and Qdrant are already durable: they only need
+    their schema, and are ready as soon as they hold rows.
+    """
+    global _vector_index_ready
+    settings = get_settings()
+    store = _get_vector_store()
+    if not uses_vector_snapshots():
+        await store.ensure_schema()
+        _vector_index_ready = await store.count() > 0
+        return _vector_index_ready
+    restored = False
+    if settings.vector_snapshot_dir:
+        try:
+            restored = await asyncio.to_thread(store.load_snapshot, settings.vector_snapshot_dir)
+        except Exception as e:
+            logger.error("  CONTAINER ▸ Vector snapshot restore FAILED: %s", e)
+    if restored:
+        asyncio.get_running_loop().run_in_executor(None, store.warm_up)
+    return restored
+
+
+async def reconcile_vector_store() -> Dict[str, int]:
+    """Replay the Postgres writes the restored snapshot missed, mark the index ready and snapshot it."""
+    global _vector_index_ready
+    store = _get_vector_store()
+    indexed_ids = await asyncio.to_thread(store.ids)
+    async with get_session_factory()() as session:
+        use_case = ReconcileIndexUseCase(
+            objective_repo=PostgresObjectiveRepository(session),
+            learning_repo=PostgresLearningRepository(session),
+            decision_repo=PostgresDecisionLogRepository(session),
+            reflection_repo=PostgresReflectionRepository(session),
+            vector_store=_get_indexed_store(),
+            embedding=_get_embedding(),
+            batch_size=get_settings().rehydrate_batch_size,
+        )
+        counts = await use_case.execute(indexed_ids, store.snapshot_taken_at)
+    _vector_index_ready = True
+    await save_vector_snapshot()
+    return counts
+
+
+async def rehydrate_vector_store() -> int:
+    """Rebuild the vector index from Postgres, mark it ready and snapshot it."""
+    global _vector_index_ready
+    settings = get_settings()
+    async with get_session_factory()() as session:
+        use_case = RehydrateIndexUseCase(
+            objective_repo=PostgresObjectiveRepository(session),
+            learning_repo=PostgresLearningRepository(session),
+            decision_repo=PostgresDecisionLogRepository(session),
+            reflection_repo=PostgresReflectionRepository(session),
+            vector_store=_get_indexed_store(),
+            embedding=_get_embedding(),
+            batch_size=settings.rehydrate_batch_size,
+        )
+        count = await use_case.execute()
+    _vector_index_ready = True
+    await save_vector_snapshot()
+    return count
+
+
+async def vector_index_size() -> int:
+    store = _get_vector_store()
+    if not uses_vector_snapshots():
+        return await store.count()
+    return len(store)
+
+
+async def save_vector_snapshot() -> bool:
+    """Snapshot the vector index — never while it is still partial (mid-rehydration)."""
+    settings = get_settings()
+    if not settings.vector_snapshot_dir or not _vector_index_ready or not uses_vector_snapshots():
+        return False
+    return await asyncio.to_thread(_get_vector_store().save_snapshot, settings.vector_snapshot_dir)
+
+
+async def build_lexical_index() -> int:
+    """Fill the keyword index from Postgres; needed when the vector index was not rehydrated."""
+    lexical = _get_lexical_index()
+    if lexical is None:
+        return 0
+    async with get_session_factory()() as session:
+        use_case = BuildLexicalIndexUseCase(
+            objective_repo=PostgresObjectiveRepository(session),
+            learning_repo=PostgresLearningRepository(session),
+            decision_repo=PostgresDecisionLogRepository(session),
+            reflection_repo=PostgresReflectionRepository(session),
+            lexical_index=lexical,
+            batch_size=get_settings().rehydrate_batch_size,
+        )
+        return await use_case.execute()
+
+
+def uses_vector_snapshots() -> bool:
+    """Only the in-process indexes are snapshotted; pgvector and Qdrant persist themselves."""
+    return get_settings().vector_backend == "memory"
+
+
+async def shutdown_vector_store():
+    """Flush the Qdrant write buffer and close its client."""
+    if _get_vector_store.cache_info().currsize and get_settings().vector_backend == "qdrant":
+        await _get_vector_store().close()
+
+
 # ─── Event worker ─────────────────────────────────────────────────
 async def create_event_worker() -> EventWorker:
     logger.info("  CONTAINER ▸ Assembling EventWorker")
     redis = await get_redis()
-    cache = _get_cache(redis)
-    event_bus = _get_event_bus(redis)
-    ingest = IngestUseCase(
-        extractor=_get_extractor(),
-        structuring_agent=_get_structuring_agent(),
-        planning_agent=_get_planning_agent(),
-        cache=cache,
-        event_bus=event_bus,
+    return EventWorker(
+        event_bus=_get_event_bus(redis),
+        cache=_get_cache(redis),
+        ingest_use_case=_get_ingest_use_case(redis),
+        chat_capture=_run_chat_capture,
     )
-    return EventWorker(event_bus=event_bus, cache=cache, ingest_use_case=ingest)
+
+
+async def _run_chat_capture(capture_id: str, message: str, reply: str) -> list:
+    """Auto-capture one chat exchange in a DB session of its own (the worker has none)."""
+    redis = await get_redis()
+    async with get_session_factory()() as session:
+        use_case = ChatCaptureUseCase(
+            auto_capture=_get_auto_capture(),
+            vector_store=_get_indexed_store(),
+            embedding=_get_embedding(),
+            learning_repo=PostgresLearningRepository(session),
+            decision_repo=PostgresDecisionLogRepository(session),
+            cache=_get_cache(redis),
+        )
+        return await use_case.execute(capture_id, message, reply)
@@ -54,8 +54,7 @@ class LogDecisionUseCase:
         logger.info("[DECISION] Created decision_id=%s", log.id)
 
         embedding = await self._embedding.embed(log.embedding_text())
-        payload = log.model_dump(mode="json")
-        payload["_type"] = "decision"
+        payload = log.index_payload()
 
         await asyncio.gather(
             self._repo.save(log),
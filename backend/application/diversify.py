@@ -0,0 +1,73 @@
+import logging
+from typing import Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger("jarvis.usecase.diversify")
+
+# Candidates fetched per requested result when MMR re-ranks them.
+MMR_CANDIDATE_FACTOR = 3
+
+
+def mmr(
+    hits: List[Dict],
+    limit: int,
+    lam: float,
+    type_limits: Optional[Dict[str, int]] = None,
+) -> List[Dict]:
+    """Maximal marginal relevance over search hits fetched `with_vectors`.
+
+    Greedily picks the hit maximising λ·relevance − (1−λ)·(max cosine to the
+    hits already picked), so near-duplicates give way to the next distinct
+    item. Relevance is each hit's own score scaled to [0, 1] by the best
+    one, which also works for fused hybrid scores; hits without a vector
+    are treated as unlike every other. With `type_limits`, each type stops
+    being picked once its quota is full and `limit` is their sum. λ = 1 is
+    plain relevance order. The "vector" key is dropped from what is returned.
+    """
+    if type_limits is not None:
+        limit = sum(type_limits.values())
+    if not hits or limit <= 0:
+        return []
+
+    n = len(hits)
+    dimension = next((h["vector"].shape[0] for h in hits if h.get("vector") is not None), 1)
+    vectors = np.zeros((n, dimension), dtype=np.float32)
+    for i, hit in enumerate(hits):
+        if hit.get("vector") is not None:
+            vectors[i] = hit["vector"]
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    vectors /= np.where(norms > 0, norms, 1.0)
+    similarity = vectors @ vectors.T                      # (n, n) — n is a few dozen
+
+    scores = np.array([h["score"] for h in hits], dtype=np.float32)
+    top = scores.max()
+    relevance = scores / top if top > 0 else scores
+    max_similarity = np.zeros(n, dtype=np.float32)        # to the picked set; 0 while it is empty
+    available = np.ones(n, dtype=bool)
+    quotas = dict(type_limits) if type_limits is not None else None
+    hit_types = np.array([h.get("payload", {}).get("_type") for h in hits], dtype=object)
+    if quotas is not None:
+        available &= np.isin(hit_types, [t for t, q in quotas.items() if q > 0])
+
+    picked: List[int] = []
+    while len(picked) < limit and available.any():
+        gain = lam * relevance - (1.0 - lam) * max_similarity
+        gain[~available] = -np.inf
+        best = int(np.argmax(gain))
+        picked.append(best)
+        available[best] = False
+        np.maximum(max_similarity, similarity[best], out=max_similarity)
+        if quotas is not None:
+            item_type = hit_types[best]
+            quotas[item_type] -= 1
+            if quotas[item_type] <= 0:
+                available &= hit_types != item_type
+
+    logger.debug("[MMR] λ=%.2f | %d candidates → %d picked", lam, n, len(picked))
+    return [{k: v for k, v in hits[i].items() if k != "vector"} for i in picked]
+
+
+def widen(type_limits: Dict[str, int]) -> Dict[str, int]:
+    """Per-type candidate budget for MMR: MMR_CANDIDATE_FACTOR× each limit."""
+    return {item_type: n * MMR_CANDIDATE_FACTOR for item_type, n in type_limits.items()}
@@ -1,12 +1,16 @@
 import json
 import asyncio
 import logging
+from typing import Awaitable, Callable, Dict, List, Optional
 from backend.domain.events import EventType
 from backend.infrastructure.redis_adapter import RedisEventBus, RedisStagingCache
 from backend.application.ingest_use_case import IngestUseCase
 
 logger = logging.getLogger("jarvis.worker")
 
+# (capture_id, user message, assistant reply) -> captured items; opens its own DB session.
+ChatCaptureRunner = Callable[[str, str, str], Awaitable[List[Dict]]]
+
 
 class EventWorker:
     def __init__(
@@ -14,10 +18,12 @@ class EventWorker:
         event_bus: RedisEventBus,
         cache: RedisStagingCache,
         ingest_use_case: IngestUseCase,
+        chat_capture: Optional[ChatCaptureRunner] = None,
     ):
         self._event_bus = event_bus
         self._cache = cache
         self._ingest = ingest_use_case
+        self._chat_capture = chat_capture
         self._running = False
         self._processed_keys: set = set()
 
@@ -63,6 +69,12 @@ class EventWorker:
                 logger.info("[WORKER] Processing USER_INPUT_RECEIVED (%d chars)...", len(raw_text))
                 await self._ingest.process_input(objective_id, raw_text)
                 logger.info("[WORKER] Finished processing USER_INPUT_RECEIVED for objective_id=%s\n", objective_id)
+            elif event_type == EventType.CHAT_EXCHANGE_COMPLETED.value and self._chat_capture:
+                raw_payload = json.loads(data.get(b"payload", b"{}").decode())
+                capture_id = raw_payload["capture_id"]
+                logger.info("[WORKER] Processing CHAT_EXCHANGE_COMPLETED (capture_id=%s)...", capture_id)
+                items = await self._chat_capture(capture_id, raw_payload.get("message", ""), raw_payload.get("reply", ""))
+                logger.info("[WORKER] Finished auto-capture %s: %d items\n", capture_id, len(items))
             else:
                 logger.info("[WORKER] Event %s acknowledged (no handler).", event_type)
         except Exception as e:
@@ -52,8 +52,7 @@ class CaptureLearningUseCase:
         logger.info("[LEARNING] Created learning_id=%s", learning.id)
 
         embedding = await self._embedding.embed(learning.embedding_text())
-        payload = learning.model_dump(mode="json")
-        payload["_type"] = "learning"
+        payload = learning.index_payload()
 
         await asyncio.gather(
             self._repo.save(learning),
@@ -78,18 +77,25 @@ class CaptureLearningUseCase:
         """Save a batch of AI-extracted learnings."""
         logger.info("[LEARNING] Saving batch of %d learnings...", len(learnings))
 
+        if not learnings:
+            return []
+        embeddings = await self._embedding.embed_many([l.embedding_text() for l in learnings])
+        payloads = [learning.index_payload() for learning in learnings]
+
+        # Postgres saves share one session, so they stay sequential; the
+        # vector store takes the whole batch in one call.
         saved = []
         for i, learning in enumerate(learnings, 1):
-            embedding = await self._embedding.embed(learning.embedding_text())
-            payload = learning.model_dump(mode="json")
-            payload["_type"] = "learning"
-            await asyncio.gather(
-                self._repo.save(learning),
-                self._vector_store.upsert(learning.id, embedding, payload),
-                return_exceptions=True,
-            )
+            try:
+                await self._repo.save(learning)
+            except Exception as e:
+                logger.error("[LEARNING]   Postgres save FAILED for learning_id=%s: %s", learning.id, e)
             saved.append(learning)
             logger.info("[LEARNING]   Saved %d/%d: learning_id=%s [%s]", i, len(learnings), learning.id, learning.category.value)
+        try:
+            await self._vector_store.upsert_many([l.id for l in learnings], embeddings, payloads)
+        except Exception as e:
+            logger.error("[LEARNING]   VectorStore batch upsert FAILED: %s", e)
 
         logger.info("[LEARNING] Batch complete: %d learnings saved.\n", len(saved))
         return saved
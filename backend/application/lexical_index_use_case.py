@@ -0,0 +1,49 @@
+import logging
+import time
+from typing import AsyncIterator, Callable, List, Tuple
+from backend.ports.interfaces import (
+    ObjectiveRepository,
+    LearningRepository,
+    DecisionLogRepository,
+    ReflectionRepository,
+    LexicalIndex,
+)
+
+logger = logging.getLogger("jarvis.usecase.lexical")
+
+
+class BuildLexicalIndexUseCase:
+    """
+    Fill the keyword index from Postgres when the vector index came back
+    without a rehydration (snapshot restore, or a durable backend). Only
+    `index_payload()` is needed per row, so nothing is embedded.
+    """
+
+    def __init__(
+        self,
+        objective_repo: ObjectiveRepository,
+        learning_repo: LearningRepository,
+        decision_repo: DecisionLogRepository,
+        reflection_repo: ReflectionRepository,
+        lexical_index: LexicalIndex,
+        batch_size: int = 256,
+    ):
+        self._sources: List[Tuple[str, Callable[[int], AsyncIterator[list]]]] = [
+            ("objective", objective_repo.stream_all),
+            ("learning", learning_repo.stream_all),
+            ("decision", decision_repo.stream_all),
+            ("reflection", reflection_repo.stream_all),
+        ]
+        self._lexical = lexical_index
+        self._batch_size = batch_size
+
+    async def execute(self) -> int:
+        logger.info("[LEXICAL] Building keyword index from Postgres...")
+        start = time.perf_counter()
+        total = 0
+        for _, stream_all in self._sources:
+            async for batch in stream_all(self._batch_size):
+                await self._lexical.upsert_many([item.id for item in batch], [item.index_payload() for item in batch])
+                total += len(batch)
+        logger.info("[LEXICAL] Complete: %d items indexed in %.1fs.", total, time.perf_counter() - start)
+        return total
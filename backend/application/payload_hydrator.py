@@ -0,0 +1,55 @@
+import logging
+from typing import Dict, List
+from backend.ports.interfaces import (
+    ObjectiveRepository,
+    LearningRepository,
+    DecisionLogRepository,
+    ReflectionRepository,
+)
+
+logger = logging.getLogger("jarvis.usecase.hydrate")
+
+
+class PayloadHydrator:
+    """Swap the compact index payloads of search hits for the full Postgres rows.
+
+    The vector store only keeps the preview fields chat needs (see
+    `index_payload()` on the domain models). Callers that need whole objects
+    hand their hits here: ids are grouped by type and fetched with one
+    `get_many` query per type. Hits whose row is gone keep their compact payload.
+    """
+
+    def __init__(
+        self,
+        objective_repo: ObjectiveRepository,
+        learning_repo: LearningRepository,
+        decision_repo: DecisionLogRepository,
+        reflection_repo: ReflectionRepository,
+    ):
+        self._repos = {
+            "objective": objective_repo,
+            "learning": learning_repo,
+            "decision": decision_repo,
+            "reflection": reflection_repo,
+        }
+
+    async def hydrate(self, results: List[Dict]) -> List[Dict]:
+        ids_by_type: Dict[str, List[str]] = {}
+        for r in results:
+            item_type = r.get("payload", {}).get("_type")
+            if item_type in self._repos:
+                ids_by_type.setdefault(item_type, []).append(str(r["id"]))
+
+        full: Dict[str, Dict] = {}
+        # One session → queries run one after another, one per type present.
+        for item_type, ids in ids_by_type.items():
+            for item in await self._repos[item_type].get_many(ids):
+                payload = item.model_dump(mode="json")
+                payload["_type"] = item_type
+                full[item.id] = payload
+
+        logger.debug("[HYDRATE] %d hits | %d full rows loaded", len(results), len(full))
+        return [
+            {**r, "payload": full[str(r["id"])]} if str(r["id"]) in full else r
+            for r in results
+        ]
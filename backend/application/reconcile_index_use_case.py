@@ -0,0 +1,104 @@
+"""
+Reconcile use case — brings a vector index restored from a snapshot back in
+step with Postgres, the source of truth. A snapshot holds what was indexed
+when it was taken, so writes made after it are missing if the process died
+before the next save.
+
+Rows written since the snapshot (minus an overlap, for writes whose index
+update landed after their commit) are re-embedded and upserted. Every id
+is then compared with the index: rows the index lacks are indexed, and
+indexed ids Postgres no longer has are deleted. A snapshot without a
+timestamp re-embeds every row, as a rehydration would.
+"""
+
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set
+from backend.ports.interfaces import (
+    ObjectiveRepository,
+    LearningRepository,
+    DecisionLogRepository,
+    ReflectionRepository,
+    VectorStore,
+    EmbeddingProvider,
+)
+
+logger = logging.getLogger("jarvis.usecase.reconcile")
+
+# Rows written this long before the snapshot are replayed too: the Postgres
+# write and the index write of one item are not atomic.
+RECONCILE_OVERLAP = timedelta(minutes=5)
+
+
+class ReconcileIndexUseCase:
+    """Replay into the vector store the Postgres writes a restored snapshot missed."""
+
+    def __init__(
+        self,
+        objective_repo: ObjectiveRepository,
+        learning_repo: LearningRepository,
+        decision_repo: DecisionLogRepository,
+        reflection_repo: ReflectionRepository,
+        vector_store: VectorStore,
+        embedding: EmbeddingProvider,
+        batch_size: int = 256,
+    ):
+        self._repos = [
+            ("objective", objective_repo),
+            ("learning", learning_repo),
+            ("decision", decision_repo),
+            ("reflection", reflection_repo),
+        ]
+        self._vector_store = vector_store
+        self._embedding = embedding
+        self._batch_size = batch_size
+
+    async def execute(self, indexed_ids: Set[str], snapshot_taken_at: Optional[datetime]) -> Dict[str, int]:
+        """
+        Reconcile an index holding `indexed_ids`, restored from a snapshot
+        taken at `snapshot_taken_at` (None: unknown, re-index everything).
+        Returns how many items were replayed, indexed as missing and deleted.
+        """
+        since = snapshot_taken_at - RECONCILE_OVERLAP if snapshot_taken_at else None
+        logger.info(
+            "[RECONCILE] Replaying Postgres writes since %s into the restored index (%d items)...",
+            since.isoformat() if since else "the beginning", len(indexed_ids),
+        )
+        start = time.perf_counter()
+        replayed: Set[str] = set()
+        for item_type, repo in self._repos:
+            async for batch in repo.stream_all(self._batch_size, updated_since=since):
+                await self._index(batch)
+                replayed.update(item.id for item in batch)
+
+        stale = set(indexed_ids)
+        missing_total = 0
+        for item_type, repo in self._repos:
+            missing: List[str] = []
+            async for ids in repo.stream_ids():
+                stale.difference_update(ids)
+                missing.extend(i for i in ids if i not in indexed_ids and i not in replayed)
+            for chunk in range(0, len(missing), self._batch_size):
+                await self._index(await repo.get_many(missing[chunk:chunk + self._batch_size]))
+            if missing:
+                logger.info("[RECONCILE]   %ss: %d missing from the snapshot, indexed.", item_type, len(missing))
+            missing_total += len(missing)
+
+        for item_id in stale:
+            await self._vector_store.delete(item_id)
+
+        counts = {"replayed": len(replayed), "missing": missing_total, "deleted": len(stale)}
+        logger.info(
+            "[RECONCILE] Complete in %.1fs: %d replayed, %d missing indexed, %d stale deleted.\n",
+            time.perf_counter() - start, counts["replayed"], counts["missing"], counts["deleted"],
+        )
+        return counts
+
+    async def _index(self, items: Iterable) -> None:
+        items = list(items)
+        if not items:
+            return
+        embeddings = await self._embedding.embed_many([item.embedding_text() for item in items])
+        payloads = [item.index_payload() for item in items]
+        await self._vector_store.upsert_many([item.id for item in items], embeddings, payloads)
@@ -1,5 +1,6 @@
 import logging
-from backend.domain.models import Reflection
+from typing import Optional
+from backend.domain.models import RankingPolicy, Reflection
 from backend.ports.interfaces import (
     ReflectionAgent,
     ReflectionRepository,
@@ -8,9 +9,15 @@ from backend.ports.interfaces import (
     EventBus,
 )
 from backend.domain.events import DomainEvent, EventType
+from backend.application.payload_hydrator import PayloadHydrator
+from backend.application.diversify import mmr, widen
 
 logger = logging.getLogger("jarvis.usecase.reflection")
 
+# Per-type recall budget. The reflection agent reads up to five of each, so
+# fetching them per type keeps one busy type from crowding out the others.
+CONTEXT_TYPE_LIMITS = {"objective": 5, "learning": 5, "decision": 5}
+
 
 class ReflectionUseCase:
     """Generate a reflection based on user trigger + vector-recalled context."""
@@ -22,12 +29,18 @@ class ReflectionUseCase:
         vector_store: VectorStore,
         embedding: EmbeddingProvider,
         event_bus: EventBus,
+        hydrator: PayloadHydrator,
+        mmr_lambda: float = 1.0,
+        ranking: Optional[RankingPolicy] = None,
     ):
         self._agent = reflection_agent
         self._repo = repo
         self._vector_store = vector_store
         self._embedding = embedding
         self._event_bus = event_bus
+        self._hydrator = hydrator
+        self._mmr_lambda = mmr_lambda
+        self._ranking = ranking
 
     async def execute(self, trigger: str) -> Reflection:
         logger.info("[REFLECT] Trigger: '%s'", trigger[:100])
@@ -35,8 +48,18 @@ class ReflectionUseCase:
         # Semantic search for related context
         logger.info("[REFLECT] Searching vector store for related context...")
         query_embedding = await self._embedding.embed(trigger)
-        results = await self._vector_store.search(query_embedding, limit=10)
+        if self._mmr_lambda < 1.0:
+            candidates = await self._vector_store.search(
+                query_embedding, type_limits=widen(CONTEXT_TYPE_LIMITS), with_vectors=True, ranking=self._ranking,
+            )
+            results = mmr(candidates, 0, self._mmr_lambda, type_limits=CONTEXT_TYPE_LIMITS)
+        else:
+            results = await self._vector_store.search(
+                query_embedding, type_limits=CONTEXT_TYPE_LIMITS, ranking=self._ranking,
+            )
         logger.info("[REFLECT] Found %d related items.", len(results))
+        # The index keeps previews only; the agent also reads objective `why`.
+        results = await self._hydrator.hydrate(results)
 
         # Separate by type
         related_objectives = []
@@ -78,9 +101,7 @@ class ReflectionUseCase:
 
         # Embed the reflection itself for future recall
         emb = await self._embedding.embed(reflection.embedding_text())
-        payload = reflection.model_dump(mode="json")
-        payload["_type"] = "reflection"
-        await self._vector_store.upsert(reflection.id, emb, payload)
+        await self._vector_store.upsert(reflection.id, emb, reflection.index_payload())
         logger.info("[REFLECT] Indexed reflection in VectorStore.")
 
         await self._event_bus.publish(
@@ -0,0 +1,71 @@
+"""
+Rehydrate use case — rebuilds the vector index from Postgres, the source of
+truth, when no snapshot is available. Rows are streamed page by page through
+server-side cursors, embedded in batches and bulk-loaded, so memory stays
+flat however large the tables are.
+"""
+
+import logging
+import time
+from typing import AsyncIterator, Callable, List, Tuple
+from backend.ports.interfaces import (
+    ObjectiveRepository,
+    LearningRepository,
+    DecisionLogRepository,
+    ReflectionRepository,
+    VectorStore,
+    EmbeddingProvider,
+)
+
+logger = logging.getLogger("jarvis.usecase.rehydrate")
+
+
+class RehydrateIndexUseCase:
+    """Stream every objective, learning, decision and reflection into the vector store."""
+
+    def __init__(
+        self,
+        objective_repo: ObjectiveRepository,
+        learning_repo: LearningRepository,
+        decision_repo: DecisionLogRepository,
+        reflection_repo: ReflectionRepository,
+        vector_store: VectorStore,
+        embedding: EmbeddingProvider,
+        batch_size: int = 256,
+    ):
+        self._sources: List[Tuple[str, Callable[[int], AsyncIterator[list]]]] = [
+            ("objective", objective_repo.stream_all),
+            ("learning", learning_repo.stream_all),
+            ("decision", decision_repo.stream_all),
+            ("reflection", reflection_repo.stream_all),
+        ]
+        self._vector_store = vector_store
+        self._embedding = embedding
+        self._batch_size = batch_size
+
+    async def execute(self) -> int:
+        logger.info("[REHYDRATE] Rebuilding vector index from Postgres (batch_size=%d)...", self._batch_size)
+        start = time.perf_counter()
+        total = 0
+
+        for item_type, stream_all in self._sources:
+            type_start = time.perf_counter()
+            count = 0
+            async for batch in stream_all(self._batch_size):
+                embeddings = await self._embedding.embed_many([item.embedding_text() for item in batch])
+                payloads = [item.index_payload() for item in batch]
+                await self._vector_store.upsert_many([item.id for item in batch], embeddings, payloads)
+
+                count += len(batch)
+                elapsed = time.perf_counter() - type_start
+                logger.info(
+                    "[REHYDRATE]   %ss: %d indexed (%.0f/s)",
+                    item_type, count, count / elapsed if elapsed else 0.0,
+                )
+            logger.info("[REHYDRATE] %ss done: %d items.", item_type.capitalize(), count)
+            total += count
+
+        logger.info(
+            "[REHYDRATE] Complete: %d items indexed in %.1fs.\n", total, time.perf_counter() - start,
+        )
+        return total
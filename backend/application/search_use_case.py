@@ -1,30 +1,114 @@
+import asyncio
 import logging
-from typing import List, Dict
-from backend.ports.interfaces import VectorStore, EmbeddingProvider
+from typing import List, Dict, Optional
+from backend.domain.models import RankingPolicy
+from backend.ports.interfaces import VectorStore, EmbeddingProvider, LexicalIndex
+from backend.application.payload_hydrator import PayloadHydrator
+from backend.application.diversify import MMR_CANDIDATE_FACTOR, mmr
 
 logger = logging.getLogger("jarvis.usecase.search")
 
+CANDIDATE_FACTOR = 4   # candidates fetched per retriever, per requested result
+
+
+def weighted_fusion(vector_hits: List[Dict], lexical_hits: List[Dict], vector_weight: float) -> List[Dict]:
+    """
+    w·cosine + (1-w)·BM25, with BM25 scaled to [0, 1] by the best keyword
+    hit. An item missing from one list scores 0 there.
+    """
+    top_lexical = max((h["score"] for h in lexical_hits), default=0.0) or 1.0
+    fused: Dict[str, Dict] = {}
+    for hit in vector_hits:
+        fused[hit["id"]] = {**hit, "score": vector_weight * hit["score"]}
+    for hit in lexical_hits:
+        keyword = (1.0 - vector_weight) * hit["score"] / top_lexical
+        if hit["id"] in fused:
+            fused[hit["id"]]["score"] += keyword
+        else:
+            fused[hit["id"]] = {**hit, "score": keyword}
+    return sorted(fused.values(), key=lambda h: h["score"], reverse=True)
+
+
+def reciprocal_rank_fusion(vector_hits: List[Dict], lexical_hits: List[Dict], k: int = 60) -> List[Dict]:
+    """Σ 1/(k + rank) over both lists — needs no score calibration."""
+    fused: Dict[str, Dict] = {}
+    for hits in (vector_hits, lexical_hits):
+        for rank, hit in enumerate(hits, 1):
+            if hit["id"] in fused:
+                fused[hit["id"]]["score"] += 1.0 / (k + rank)
+            else:
+                fused[hit["id"]] = {**hit, "score": 1.0 / (k + rank)}
+    return sorted(fused.values(), key=lambda h: h["score"], reverse=True)
+
 
 class SemanticSearchUseCase:
-    """Search across all knowledge (objectives, learnings, decisions, reflections) by meaning."""
+    """Search across all knowledge (objectives, learnings, decisions, reflections) by meaning.
+
+    With a lexical index, results are hybrid: vector and BM25 candidates are
+    fused by weight ("weighted") or by reciprocal rank ("rrf"), so exact
+    terms — product names, tool names, tags — are found even when their
+    embedding is not close. `min_score` applies to the vector side only.
+    With `mmr_lambda` below 1, the final list is re-ranked by maximal
+    marginal relevance so near-duplicates do not fill it. A `ranking` policy
+    weighs the vector side by age and status.
+    """
 
     def __init__(
         self,
         vector_store: VectorStore,
         embedding: EmbeddingProvider,
+        hydrator: PayloadHydrator,
+        lexical_index: Optional[LexicalIndex] = None,
+        fusion: str = "weighted",
+        vector_weight: float = 0.7,
+        rrf_k: int = 60,
+        mmr_lambda: float = 1.0,
+        ranking: Optional[RankingPolicy] = None,
     ):
+        if lexical_index is not None and fusion not in ("weighted", "rrf"):
+            raise ValueError(f"Unknown search fusion {fusion!r}")
         self._vector_store = vector_store
         self._embedding = embedding
+        self._hydrator = hydrator
+        self._lexical = lexical_index
+        self._fusion = fusion
+        self._vector_weight = vector_weight
+        self._rrf_k = rrf_k
+        self._mmr_lambda = mmr_lambda
+        self._ranking = ranking
 
-    async def execute(self, query: str, limit: int = 10) -> List[Dict]:
-        logger.info("[SEARCH] Query: '%s' (limit=%d)", query[:100], limit)
+    async def execute(self, query: str, limit: int = 10, min_score: Optional[float] = None) -> List[Dict]:
+        logger.info("[SEARCH] Query: '%s' (limit=%d, min_score=%s)", query[:100], limit, min_score)
 
-        embedding = await self._embedding.embed(query)
-        results = await self._vector_store.search(embedding, limit=limit)
+        diversify = self._mmr_lambda < 1.0
+        if self._lexical is None:
+            embedding = await self._embedding.embed(query)
+            results = await self._vector_store.search(
+                embedding, limit=limit * MMR_CANDIDATE_FACTOR if diversify else limit,
+                min_score=min_score, with_vectors=diversify, ranking=self._ranking,
+            )
+        else:
+            pool = limit * CANDIDATE_FACTOR
+            embedding, lexical_hits = await asyncio.gather(
+                self._embedding.embed(query),
+                self._lexical.search(query, limit=pool),
+            )
+            vector_hits = await self._vector_store.search(
+                embedding, limit=pool, min_score=min_score, with_vectors=diversify, ranking=self._ranking,
+            )
+            if self._fusion == "rrf":
+                results = reciprocal_rank_fusion(vector_hits, lexical_hits, self._rrf_k)
+            else:
+                results = weighted_fusion(vector_hits, lexical_hits, self._vector_weight)
+            logger.info(
+                "[SEARCH] Hybrid (%s): %d vector + %d keyword candidates.",
+                self._fusion, len(vector_hits), len(lexical_hits),
+            )
+        results = mmr(results, limit, self._mmr_lambda) if diversify else results[:limit]
 
         logger.info("[SEARCH] Found %d results.", len(results))
         for i, r in enumerate(results, 1):
             item_type = r.get("payload", {}).get("_type", "unknown")
             logger.info("[SEARCH]   %d. [%s] score=%.4f", i, item_type, r.get("score", 0))
 
-        return results
+        return await self._hydrator.hydrate(results)
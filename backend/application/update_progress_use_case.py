@@ -1,4 +1,5 @@
 import asyncio
+import hashlib
 import logging
 from backend.domain.models import Objective
 from backend.domain.events import DomainEvent, EventType
@@ -12,6 +13,10 @@ from backend.ports.interfaces import (
 logger = logging.getLogger("jarvis.usecase.progress")
 
 
+def _text_hash(text: str) -> str:
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
 class UpdateProgressUseCase:
     def __init__(
         self,
@@ -33,16 +38,15 @@ class UpdateProgressUseCase:
             logger.error("[PROGRESS] Objective not found: %s", objective_id)
             raise ValueError(f"Objective {objective_id} not found")
 
+        text_hash_before = _text_hash(objective.embedding_text())
         objective.mark_step_completed(completed_step)
         logger.info("[PROGRESS] Step %d completed. Progress: %d%% | Status: %s", completed_step, objective.workdone, objective.status.value)
 
-        embedding = await self._embedding.embed(objective.embedding_text())
-        payload = objective.model_dump(mode="json")
-        payload["_type"] = "objective"
+        payload = objective.index_payload()
 
         await asyncio.gather(
             self._repo.update(objective),
-            self._vector_store.upsert(objective.id, embedding, payload),
+            self._update_vector(objective, payload, text_hash_before),
             return_exceptions=True,
         )
         logger.info("[PROGRESS] Stores updated for objective_id=%s", objective_id)
@@ -58,3 +62,14 @@ class UpdateProgressUseCase:
         logger.info("[PROGRESS] Published PROGRESS_UPDATED for objective_id=%s\n", objective_id)
 
         return objective
+
+    async def _update_vector(self, objective: Objective, payload: dict, text_hash_before: str) -> None:
+        # A step completion only moves workdone/status/plan, none of which is
+        # embedded — patch the payload and skip the model pass.
+        if _text_hash(objective.embedding_text()) == text_hash_before:
+            if await self._vector_store.patch_payload(objective.id, payload):
+                logger.info("[PROGRESS] Embedding text unchanged — patched payload only.")
+                return
+            logger.info("[PROGRESS] Objective not in vector store — re-embedding.")
+        embedding = await self._embedding.embed(objective.embedding_text())
+        await self._vector_store.upsert(objective.id, embedding, payload)
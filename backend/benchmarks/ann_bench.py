@@ -0,0 +1,110 @@
+"""
+Recall@k vs latency — IVFVectorStore against the exact InMemoryVectorStore.
+
+Uses clustered synthetic embeddings (a two-level topic mixture tuned so
+nearest neighbours score ~0.35-0.4 and unrelated pairs ~0, like MiniLM
+sentence embeddings — uniform noise has no structure for any ANN index to
+exploit) and queries drawn near stored items. Sweeps nprobe for each size.
+
+    python -m backend.benchmarks.ann_bench
+    python -m backend.benchmarks.ann_bench --sizes 100000 --nprobe 4 16 64 --k 10
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from typing import List
+
+import numpy as np
+
+from backend.infrastructure.ivf_vector_store import IVFVectorStore
+from backend.infrastructure.vector_store import InMemoryVectorStore
+
+DIMENSION = 384
+
+
+def _unit(x: np.ndarray) -> np.ndarray:
+    return x / np.linalg.norm(x, axis=1, keepdims=True)
+
+
+def _clustered(n: int, dim: int, rng: np.random.Generator) -> np.ndarray:
+    """Two-level topic mixture: broad themes, sub-topics around them, items around those."""
+    themes = _unit(rng.standard_normal((max(n // 5000, 4), dim), dtype=np.float32))
+    topics = _unit(themes[rng.integers(0, themes.shape[0], max(n // 100, 16))]
+                   + 1.2 * rng.standard_normal((max(n // 100, 16), dim), dtype=np.float32) / np.sqrt(dim))
+    out = np.empty((n, dim), dtype=np.float32)
+    for start in range(0, n, 100_000):   # chunked to keep temporaries small at 1M
+        m = min(100_000, n - start)
+        chunk = topics[rng.integers(0, topics.shape[0], m)]
+        chunk += 1.2 * rng.standard_normal((m, dim), dtype=np.float32) / np.sqrt(dim)
+        out[start:start + m] = _unit(chunk)
+    return out
+
+
+async def _load(store: InMemoryVectorStore, vectors: np.ndarray) -> float:
+    start = time.perf_counter()
+    for chunk in range(0, vectors.shape[0], 10_000):
+        block = vectors[chunk:chunk + 10_000]
+        ids = [f"item-{i}" for i in range(chunk, chunk + block.shape[0])]
+        await store.upsert_many(ids, block, [{"_type": "learning"}] * block.shape[0])
+    return time.perf_counter() - start
+
+
+async def _run_queries(store: InMemoryVectorStore, queries: np.ndarray, k: int):
+    latencies, results = [], []
+    for q in queries:
+        start = time.perf_counter()
+        hits = await store.search(q, limit=k, min_score=-1.0)
+        latencies.append((time.perf_counter() - start) * 1000)
+        results.append({h["id"] for h in hits})
+    return results, latencies
+
+
+async def run(sizes: List[int], nprobes: List[int], k: int, n_queries: int, nlist: int) -> None:
+    rng = np.random.default_rng(0)
+    print(f"{'N':>9} | {'index':<12} | {'recall@' + str(k):>9} | {'p50 ms':>8} | {'p95 ms':>8} | {'build s':>8}")
+    print("-" * 68)
+    for n in sizes:
+        vectors = _clustered(n, DIMENSION, rng)
+        picks = rng.choice(n, n_queries, replace=False)
+        queries = _unit(vectors[picks] + 1.0 * rng.standard_normal((n_queries, DIMENSION), dtype=np.float32) / np.sqrt(DIMENSION))
+
+        exact = InMemoryVectorStore(dimension=DIMENSION, initial_capacity=n)
+        exact_build = await _load(exact, vectors)
+        truth, exact_lat = await _run_queries(exact, queries, k)
+        print(f"{n:>9} | {'exact':<12} | {1.0:>9.3f} | {statistics.median(exact_lat):>8.2f} | "
+              f"{sorted(exact_lat)[int(n_queries * 0.95) - 1]:>8.2f} | {exact_build:>8.2f}")
+        del exact
+
+        ivf = IVFVectorStore(dimension=DIMENSION, initial_capacity=n, nlist=nlist)
+        ivf_build = await _load(ivf, vectors)
+        start = time.perf_counter()
+        await asyncio.to_thread(ivf.wait_for_training)   # trained in the background; count it as build time
+        ivf_build += time.perf_counter() - start
+        for nprobe in nprobes:
+            ivf.nprobe = nprobe
+            found, lat = await _run_queries(ivf, queries, k)
+            recall = statistics.mean(len(f & t) / max(len(t), 1) for f, t in zip(found, truth))
+            print(f"{n:>9} | {'ivf p=' + str(nprobe):<12} | {recall:>9.3f} | {statistics.median(lat):>8.2f} | "
+                  f"{sorted(lat)[int(n_queries * 0.95) - 1]:>8.2f} | {ivf_build:>8.2f}")
+        print(f"{'':>9} | lists: {ivf.index_stats()}")
+        del ivf, vectors
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 4, 8, 16, 32, 64])
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--nlist", type=int, default=0, help="inverted lists (0 = √n)")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    asyncio.run(run(args.sizes, args.nprobe, args.k, args.queries, args.nlist))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+Time-to-first-token — blocking vs streamed chat, against a local fake LLM.
+
+Starts an OpenAI-compatible chat completions server on localhost that
+waits --first-token-ms (prompt processing), then produces --tokens tokens
+--token-ms apart, and points the Groq client at it (GROQ_BASE_URL). Each
+run drives ChatUseCase.execute() and ChatUseCase.stream() over a small
+in-memory index and reports when the user first sees something: the whole
+reply for execute(), the sources and first token for stream().
+
+    python -m backend.benchmarks.chat_stream_bench
+    python -m backend.benchmarks.chat_stream_bench --tokens 400 --token-ms 10 --runs 20
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import time
+from typing import Dict, List, Set
+
+import numpy as np
+
+os.environ.setdefault("GROQ_API_KEY", "unused-by-benchmark")
+
+from backend.application.chat_use_case import ChatUseCase  # noqa: E402
+from backend.infrastructure.ai_adapter import create_groq_client  # noqa: E402
+from backend.infrastructure.vector_store import InMemoryVectorStore  # noqa: E402
+
+DIMENSION = 384
+
+
+class _FakeEmbedding:
+    async def embed(self, text: str) -> np.ndarray:
+        return (await self.embed_many([text]))[0]
+
+    async def embed_many(self, texts: List[str]) -> np.ndarray:
+        rng = np.random.default_rng(abs(hash(tuple(texts))) % 2**32)
+        return rng.standard_normal((len(texts), DIMENSION), dtype=np.float32)
+
+
+class _FakeLLM:
+    """Just enough of POST /openai/v1/chat/completions, streamed or not."""
+
+    def __init__(self, first_token_ms: float, tokens: int, token_ms: float):
+        self._first_token = first_token_ms / 1000
+        self._tokens = [f"tok{i} " for i in range(tokens)]
+        self._token_gap = token_ms / 1000
+        self._connections: Set[asyncio.StreamWriter] = set()
+
+    async def close(self) -> None:
+        writers = list(self._connections)
+        for writer in writers:
+            writer.close()
+        await asyncio.gather(*(writer.wait_closed() for writer in writers), return_exceptions=True)
+        await asyncio.sleep(0)   # let the handlers see EOF and return
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._connections.add(writer)
+        try:
+            while True:   # keep-alive: one request after another on this connection
+                head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+                headers = {k.lower(): v.strip() for k, _, v in (line.partition(":") for line in head[1:] if line)}
+                body = json.loads(await reader.readexactly(int(headers.get("content-length", 0))))
+                if body.get("stream"):
+                    await self._stream(writer, body["model"])
+                else:
+                    await asyncio.sleep(self._first_token + self._token_gap * len(self._tokens))
+                    await self._reply(writer, "".join(self._tokens))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+
+    async def _reply(self, writer: asyncio.StreamWriter, content: str) -> None:
+        payload = json.dumps({
+            "id": "fake", "object": "chat.completion", "created": 0, "model": "fake",
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+        }).encode()
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+            b"Content-Length: " + str(len(payload)).encode() + b"\r\n\r\n" + payload
+        )
+        await writer.drain()
+
+    async def _stream(self, writer: asyncio.StreamWriter, model: str) -> None:
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nTransfer-Encoding: chunked\r\n\r\n")
+        await asyncio.sleep(self._first_token)
+        for i, token in enumerate(self._tokens + [None]):
+            if i:
+                await asyncio.sleep(self._token_gap)
+            chunk = {
+                "id": "fake", "object": "chat.completion.chunk", "created": 0, "model": model,
+                "choices": [{
+                    "index": 0,
+                    "delta": {"content": token} if token else {},
+                    "finish_reason": None if token else "stop",
+                }],
+            }
+            self._chunk(writer, f"data: {json.dumps(chunk)}\n\n".encode())
+            await writer.drain()
+        self._chunk(writer, b"data: [DONE]\n\n")
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    @staticmethod
+    def _chunk(writer: asyncio.StreamWriter, data: bytes) -> None:
+        writer.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+
+
+async def _use_case() -> ChatUseCase:
+    store = InMemoryVectorStore(dimension=DIMENSION)
+    embedding = _FakeEmbedding()
+    texts = [f"learning {i} about pricing and onboarding" for i in range(200)]
+    await store.upsert_many(
+        [f"item-{i}" for i in range(len(texts))],
+        await embedding.embed_many(texts),
+        [{"_type": "learning", "content": text, "category": "insight"} for text in texts],
+    )
+    client = create_groq_client(
+        api_key=os.environ["GROQ_API_KEY"], max_connections=10, max_keepalive_connections=10,
+        keepalive_expiry=120.0, timeout=60.0, max_retries=0,
+    )
+    return ChatUseCase(store, embedding, client, mmr_lambda=0.7)
+
+
+async def _blocking(use_case: ChatUseCase) -> Dict[str, float]:
+    start = time.perf_counter()
+    await use_case.execute("How should I price the new plan?")
+    done = (time.perf_counter() - start) * 1000
+    return {"sources": done, "first": done, "last": done, "done": done}
+
+
+async def _streamed(use_case: ChatUseCase) -> Dict[str, float]:
+    start = time.perf_counter()
+    marks: Dict[str, float] = {}
+    async for event, _ in use_case.stream("How should I price the new plan?"):
+        now = (time.perf_counter() - start) * 1000
+        if event == "sources":
+            marks["sources"] = now
+        elif event == "token":
+            marks.setdefault("first", now)
+            marks["last"] = now
+        elif event == "done":
+            marks["done"] = now
+    return marks
+
+
+async def run(first_token_ms: float, tokens: int, token_ms: float, runs: int) -> None:
+    fake = _FakeLLM(first_token_ms, tokens, token_ms)
+    server = await asyncio.start_server(fake.handle, "127.0.0.1", 0)
+    os.environ["GROQ_BASE_URL"] = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+    use_case = await _use_case()
+
+    print(f"fake LLM: first token after {first_token_ms:.0f}ms, {tokens} tokens {token_ms:.0f}ms apart\n")
+    print(f"{'mode':<10} | {'sources ms':>10} | {'1st token ms':>12} | {'last token ms':>13} | {'done ms':>9}")
+    print("-" * 66)
+    for mode, drive in (("blocking", _blocking), ("streamed", _streamed)):
+        await drive(use_case)   # warm-up: connection pool, first search
+        samples = [await drive(use_case) for _ in range(runs)]
+        p50 = {key: statistics.median(s[key] for s in samples) for key in ("sources", "first", "last", "done")}
+        print(f"{mode:<10} | {p50['sources']:>10.1f} | {p50['first']:>12.1f} | {p50['last']:>13.1f} | {p50['done']:>9.1f}")
+
+    await fake.close()
+    server.close()
+    await server.wait_closed()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--first-token-ms", type=float, default=300.0)
+    parser.add_argument("--tokens", type=int, default=200)
+    parser.add_argument("--token-ms", type=float, default=10.0)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    asyncio.run(run(args.first_token_ms, args.tokens, args.token_ms, args.runs))
+
+
+if __name__ == "__main__":
+    main()
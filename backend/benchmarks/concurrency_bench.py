@@ -0,0 +1,134 @@
+"""
+Mixed read/write load — lock-free generation reads vs searches under the writer lock.
+
+R reader threads search continuously while one writer thread upserts (half
+of them updates of existing ids) and deletes at a fixed rate, each thread
+on its own event loop, as searches moved to a thread pool would run.
+"locked" reproduces the previous behaviour, where every search held the
+store lock; "lock-free" is the current one, where searches read the
+published generation.
+
+    python -m backend.benchmarks.concurrency_bench
+    python -m backend.benchmarks.concurrency_bench --size 100000 --readers 1 4 8 --seconds 5
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import threading
+import time
+from typing import Dict, List
+
+import numpy as np
+
+from backend.infrastructure.vector_store import InMemoryVectorStore
+
+DIMENSION = 384
+TYPES = ["objective", "learning", "decision", "reflection"]
+
+
+class _LockedReads(InMemoryVectorStore):
+    """Previous behaviour: a search holds the writer lock for its whole scan."""
+
+    async def search(self, *args, **kwargs):
+        with self._lock:
+            return await super().search(*args, **kwargs)
+
+
+def _percentile(values: List[float], q: float) -> float:
+    return sorted(values)[max(int(len(values) * q) - 1, 0)] if values else float("nan")
+
+
+async def _fill(store: InMemoryVectorStore, n: int, rng: np.random.Generator) -> None:
+    for start in range(0, n, 10_000):
+        m = min(10_000, n - start)
+        ids = [f"item-{i}" for i in range(start, start + m)]
+        await store.upsert_many(
+            ids, rng.standard_normal((m, DIMENSION), dtype=np.float32),
+            [{"_type": TYPES[i % 4], "text": f"item {i}"} for i in range(start, start + m)],
+        )
+
+
+def _mixed(
+    store: InMemoryVectorStore, n: int, readers: int, seconds: float, write_batch: int, write_rate: float,
+) -> Dict[str, float]:
+    stop = time.perf_counter() + seconds
+    read_lat: List[float] = []
+    write_lat: List[float] = []
+
+    async def read_loop(seed: int):
+        rng = np.random.default_rng(seed)
+        while time.perf_counter() < stop:
+            query = rng.standard_normal(DIMENSION, dtype=np.float32)
+            start = time.perf_counter()
+            await store.search(query, limit=10)
+            read_lat.append((time.perf_counter() - start) * 1000)
+
+    async def write_loop():
+        rng = np.random.default_rng(1234)
+        next_id = n
+        next_at = time.perf_counter()
+        while time.perf_counter() < stop:
+            await asyncio.sleep(max(next_at - time.perf_counter(), 0))
+            next_at += 1 / write_rate
+            # Half updates of existing items, half new ones, plus a delete.
+            updates = [f"item-{i}" for i in rng.integers(0, n, write_batch // 2 or 1)]
+            inserts = [f"item-{i}" for i in range(next_id, next_id + write_batch // 2)]
+            next_id += len(inserts)
+            ids = updates + inserts
+            start = time.perf_counter()
+            await store.upsert_many(
+                ids, rng.standard_normal((len(ids), DIMENSION), dtype=np.float32),
+                [{"_type": TYPES[len(i) % 4], "text": i} for i in ids],
+            )
+            await store.delete(f"item-{rng.integers(0, n)}")
+            write_lat.append((time.perf_counter() - start) * 1000)
+
+    threads = [threading.Thread(target=asyncio.run, args=(read_loop(r),)) for r in range(readers)]
+    threads.append(threading.Thread(target=asyncio.run, args=(write_loop(),)))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return {
+        "reads_s": len(read_lat) / seconds,
+        "read_p50": statistics.median(read_lat) if read_lat else float("nan"),
+        "read_p99": _percentile(read_lat, 0.99),
+        "writes_s": len(write_lat) / seconds,
+        "write_p50": statistics.median(write_lat) if write_lat else float("nan"),
+        "write_p99": _percentile(write_lat, 0.99),
+    }
+
+
+def run(size: int, reader_counts: List[int], seconds: float, write_batch: int, write_rate: float) -> None:
+    print(f"size={size} write_batch={write_batch} write_rate={write_rate}/s seconds={seconds}")
+    print(f"{'readers':>7} | {'mode':<9} | {'reads/s':>8} | {'read p50':>8} | {'read p99':>8} | "
+          f"{'writes/s':>8} | {'write p50':>9} | {'write p99':>9}")
+    print("-" * 88)
+    for readers in reader_counts:
+        for mode, cls in (("locked", _LockedReads), ("lock-free", InMemoryVectorStore)):
+            store = cls(dimension=DIMENSION, initial_capacity=size)
+            asyncio.run(_fill(store, size, np.random.default_rng(0)))
+            stats = _mixed(store, size, readers, seconds, write_batch, write_rate)
+            print(f"{readers:>7} | {mode:<9} | {stats['reads_s']:>8.1f} | {stats['read_p50']:>8.2f} | "
+                  f"{stats['read_p99']:>8.2f} | {stats['writes_s']:>8.1f} | {stats['write_p50']:>9.2f} | "
+                  f"{stats['write_p99']:>9.2f}")
+            del store
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--readers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--write-batch", type=int, default=8, help="upserts per write operation")
+    parser.add_argument("--write-rate", type=float, default=50.0, help="target write operations per second")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    run(args.size, args.readers, args.seconds, args.write_batch, args.write_rate)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Throughput benchmark — micro-batched vs unbatched embed() under concurrency.
+
+Each of C concurrent callers embeds its share of a fixed set of short texts
+one at a time, as chat/search/capture requests do. Unbatched, every call is
+its own encode(); batched, MicroBatchingEmbeddingProvider merges concurrent
+calls. Loads the real sentence-transformer model from EMBEDDING_MODEL.
+
+    python -m backend.benchmarks.embedding_batch_bench
+    python -m backend.benchmarks.embedding_batch_bench --concurrency 1 32 --texts 512
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import time
+from typing import Dict, List
+
+os.environ.setdefault("GROQ_API_KEY", "unused-by-benchmark")
+
+from backend.config import get_settings  # noqa: E402
+from backend.infrastructure.embedding_adapter import LocalEmbeddingProvider  # noqa: E402
+from backend.infrastructure.embedding_batcher import MicroBatchingEmbeddingProvider  # noqa: E402
+from backend.ports.interfaces import EmbeddingProvider  # noqa: E402
+
+_SUBJECTS = ["pricing", "onboarding", "the newsletter", "cold outreach", "the landing page", "hiring"]
+_VERBS = ["doubled", "hurt", "simplified", "delayed", "improved", "complicated"]
+_OBJECTS = ["signups", "churn", "cash flow", "support load", "conversion", "my focus"]
+
+
+def _texts(n: int) -> List[str]:
+    return [
+        f"Changing {_SUBJECTS[i % 6]} {_VERBS[(i // 6) % 6]} {_OBJECTS[(i // 36) % 6]} (note {i})"
+        for i in range(n)
+    ]
+
+
+async def _drive(provider: EmbeddingProvider, texts: List[str], concurrency: int) -> Dict[str, float]:
+    latencies: List[float] = []
+
+    async def caller(worker: int):
+        for text in texts[worker::concurrency]:
+            start = time.perf_counter()
+            await provider.embed(text)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(caller(w) for w in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return {
+        "throughput": len(texts) / elapsed,
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": sorted(latencies)[int(len(latencies) * 0.95) - 1],
+    }
+
+
+async def run(concurrency_levels: List[int], n_texts: int, max_batch_size: int, max_wait_ms: float) -> None:
+    base = LocalEmbeddingProvider()
+    batched = MicroBatchingEmbeddingProvider(base, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+    texts = _texts(n_texts)
+    await base.embed_many(texts[:8])  # warm-up
+
+    print(f"model={get_settings().embedding_model} texts={n_texts} "
+          f"max_batch_size={max_batch_size} max_wait_ms={max_wait_ms}")
+    print(f"{'callers':>8} | {'mode':<9} | {'texts/s':>9} | {'p50 ms':>8} | {'p95 ms':>8} | {'speedup':>7}")
+    print("-" * 62)
+    for concurrency in concurrency_levels:
+        plain = await _drive(base, texts, concurrency)
+        merged = await _drive(batched, texts, concurrency)
+        for mode, stats in (("unbatched", plain), ("batched", merged)):
+            speedup = stats["throughput"] / plain["throughput"]
+            print(f"{concurrency:>8} | {mode:<9} | {stats['throughput']:>9.1f} | "
+                  f"{stats['p50_ms']:>8.2f} | {stats['p95_ms']:>8.2f} | {speedup:>6.2f}x")
+    print(f"\nbatcher: {batched.stats()}")
+    base.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 128])
+    parser.add_argument("--texts", type=int, default=1024, help="embed() calls per run")
+    parser.add_argument("--max-batch-size", type=int, default=get_settings().embedding_batch_max_size)
+    parser.add_argument("--max-wait-ms", type=float, default=get_settings().embedding_batch_max_wait_ms)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    asyncio.run(run(args.concurrency, args.texts, args.max_batch_size, args.max_wait_ms))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+BM25 keyword index — build rate, query latency, update cost and memory.
+
+Indexes the realistic item mix of payload_memory_bench (each item also gets
+a rare "product name" term, the kind of exact match vector search misses)
+and reports, per size: index build throughput, traced memory, median query
+latency for 1-3 term queries, and the cost of single-item upserts while
+the index is live.
+
+    python -m backend.benchmarks.lexical_bench
+    python -m backend.benchmarks.lexical_bench --sizes 100000 --queries 500
+"""
+
+import argparse
+import asyncio
+import gc
+import logging
+import random
+import statistics
+import time
+import tracemalloc
+from typing import List
+
+from backend.benchmarks.payload_memory_bench import _WORDS, _items
+from backend.infrastructure.lexical_index import BM25Index
+
+
+def _payloads(n: int) -> List[dict]:
+    payloads = []
+    for i, item in enumerate(_items(n, 1.0)):
+        payload = item.index_payload()
+        payload.setdefault("tags", []).append(f"product{i % (n // 20 or 1)}")
+        payloads.append(payload)
+    return payloads
+
+
+async def _build(ids: List[str], payloads: List[dict]) -> BM25Index:
+    index = BM25Index()
+    for start in range(0, len(ids), 1000):
+        await index.upsert_many(ids[start:start + 1000], payloads[start:start + 1000])
+    return index
+
+
+async def run(sizes: List[int], n_queries: int) -> None:
+    print(f"{'N':>8} | {'build/s':>9} | {'MB':>6} | {'query p50 ms':>12} | {'query p95 ms':>12} | {'upsert ms':>9}")
+    print("-" * 72)
+    rng = random.Random(1)
+    for n in sizes:
+        payloads = _payloads(n)
+        ids = [f"item-{i}" for i in range(n)]
+
+        start = time.perf_counter()
+        index = await _build(ids, payloads)
+        rate = n / (time.perf_counter() - start)
+        del index
+        gc.collect()
+        tracemalloc.start()
+        index = await _build(ids, payloads)
+        used, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        queries = [
+            " ".join(rng.sample(_WORDS, rng.randint(1, 2)) + [f"product{rng.randrange(n // 20 or 1)}"])
+            for _ in range(n_queries)
+        ]
+        latencies = []
+        for query in queries:
+            start = time.perf_counter()
+            await index.search(query, limit=40)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+        updates = []
+        for i in rng.sample(range(n), min(n, 1000)):
+            start = time.perf_counter()
+            await index.upsert_many([ids[i]], [payloads[i]])
+            updates.append((time.perf_counter() - start) * 1000)
+
+        print(f"{n:>8} | {rate:>9.0f} | {used / 2**20:>6.1f} | {statistics.median(latencies):>12.2f} | "
+              f"{sorted(latencies)[int(len(latencies) * 0.95) - 1]:>12.2f} | {statistics.median(updates):>9.3f}")
+        del index
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    asyncio.run(run(args.sizes, args.queries))
+
+
+if __name__ == "__main__":
+    main()
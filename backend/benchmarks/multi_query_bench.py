@@ -0,0 +1,83 @@
+"""
+Latency benchmark — Q separate search() calls vs one search_many() call.
+
+Chat issues two searches per message (context + failure probe); reflection
+and future multi-probe retrieval can issue more. search_many scores every
+query against a segment in one matrix-matrix product, so the corpus is
+streamed through memory once instead of Q times.
+
+    python -m backend.benchmarks.multi_query_bench
+    python -m backend.benchmarks.multi_query_bench --sizes 100000 --queries-per-call 2 8 --quantization none int8
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from typing import List
+
+import numpy as np
+
+from backend.infrastructure.vector_store import InMemoryVectorStore
+
+DIMENSION = 384
+TYPES = ["objective", "learning", "decision", "reflection"]
+
+
+async def _build(n: int, quantization: str, rng: np.random.Generator) -> InMemoryVectorStore:
+    store = InMemoryVectorStore(dimension=DIMENSION, initial_capacity=n, quantization=quantization)
+    for start in range(0, n, 10_000):
+        m = min(10_000, n - start)
+        block = rng.standard_normal((m, DIMENSION), dtype=np.float32)
+        ids = [f"item-{i}" for i in range(start, start + m)]
+        await store.upsert_many(ids, block, [{"_type": TYPES[i % 4]} for i in range(start, start + m)])
+    return store
+
+
+async def _time(call, repeats: int) -> float:
+    await call()  # warm-up
+    latencies = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        await call()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return statistics.median(latencies)
+
+
+async def run(sizes: List[int], fanouts: List[int], quantizations: List[str], repeats: int) -> None:
+    rng = np.random.default_rng(0)
+    print(f"{'N':>9} | {'storage':<8} | {'Q':>3} | {'separate ms':>11} | {'search_many ms':>14} | {'speedup':>7}")
+    print("-" * 68)
+    for n in sizes:
+        for quantization in quantizations:
+            store = await _build(n, quantization, rng)
+            for q in fanouts:
+                queries = rng.standard_normal((q, DIMENSION), dtype=np.float32)
+
+                async def separate():
+                    return [await store.search(query, limit=10, min_score=-1.0) for query in queries]
+
+                async def batched():
+                    return await store.search_many(queries, [10] * q, min_score=-1.0)
+
+                plain = await _time(separate, repeats)
+                many = await _time(batched, repeats)
+                print(f"{n:>9} | {quantization:<8} | {q:>3} | {plain:>11.2f} | {many:>14.2f} | {plain / many:>6.2f}x")
+            del store
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--queries-per-call", type=int, nargs="+", default=[2, 4, 8])
+    parser.add_argument("--quantization", nargs="+", default=["none"], choices=["none", "float16", "int8"])
+    parser.add_argument("--repeats", type=int, default=30)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    asyncio.run(run(args.sizes, args.queries_per_call, args.quantization, args.repeats))
+
+
+if __name__ == "__main__":
+    main()
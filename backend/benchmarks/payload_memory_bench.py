@@ -0,0 +1,149 @@
+"""
+Memory benchmark — vector-store payload bytes per item, full dumps vs compact rows.
+
+Builds a realistic mix of objectives (with plans), learnings, decisions and
+reflections and measures, with tracemalloc, what the payload table holds for
+them under three layouts:
+
+  full dicts     model_dump(mode="json") per item — the previous layout
+  compact dicts  index_payload() per item, kept as dicts
+  compact bytes  index_payload() encoded by PayloadTable — the current layout
+
+Items are rebuilt from their serialised rows inside the measured block (as
+rehydration does), so no layout shares strings with a live model object.
+Vectors are excluded; they are the same in every layout.
+
+    python -m backend.benchmarks.payload_memory_bench
+    python -m backend.benchmarks.payload_memory_bench --items 100000 --text-scale 2
+"""
+
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+from typing import Callable, List
+
+from backend.domain.models import (
+    DecisionLog,
+    Learning,
+    LearningCategory,
+    Objective,
+    ObjectiveStatus,
+    PlanStep,
+    Reflection,
+)
+from backend.infrastructure.vector_snapshot import PayloadTable
+
+_WORDS = (
+    "pricing onboarding newsletter outreach landing page hiring signups churn cash flow support "
+    "conversion focus customers launch partner invoice funnel retention referral webinar agency "
+    "contract feedback roadmap budget campaign discount trial upsell"
+).split()
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _items(n: int, scale: float, seed: int = 0) -> List:
+    """Objectives / learnings / decisions / reflections at roughly 2:4:3:1."""
+    rng = random.Random(seed)
+    w = lambda k: max(int(k * scale), 1)  # noqa: E731
+    items = []
+    for i in range(n):
+        kind = i % 10
+        if kind < 2:
+            items.append(Objective(
+                what=_sentence(rng, w(10)),
+                why=_sentence(rng, w(20)),
+                context=_sentence(rng, w(40)),
+                expected_output=_sentence(rng, w(15)),
+                plan=[PlanStep(step_number=s, description=_sentence(rng, w(12))) for s in range(1, 6)],
+                status=ObjectiveStatus.IN_PROGRESS,
+                workdone=rng.randint(0, 100),
+                tags=rng.sample(_WORDS, 3),
+            ))
+        elif kind < 6:
+            items.append(Learning(
+                content=_sentence(rng, w(30)),
+                category=rng.choice(list(LearningCategory)),
+                tags=rng.sample(_WORDS, 3),
+            ))
+        elif kind < 9:
+            items.append(DecisionLog(
+                decision=_sentence(rng, w(12)),
+                why=_sentence(rng, w(20)),
+                context=_sentence(rng, w(40)),
+                alternatives_considered=[_sentence(rng, w(8)) for _ in range(2)],
+                expected_outcome=_sentence(rng, w(15)),
+                tags=rng.sample(_WORDS, 3),
+            ))
+        else:
+            items.append(Reflection(
+                trigger=_sentence(rng, w(12)),
+                summary=_sentence(rng, w(80)),
+                patterns_identified=[_sentence(rng, w(10)) for _ in range(3)],
+                suggestions=[_sentence(rng, w(10)) for _ in range(3)],
+            ))
+    return items
+
+
+def _full(item) -> dict:
+    payload = item.model_dump(mode="json")
+    payload["_type"] = type(item).__name__.lower().replace("decisionlog", "decision")
+    return payload
+
+
+def _measure(build: Callable[[], object]) -> tuple:
+    gc.collect()
+    start = time.perf_counter()
+    build()
+    elapsed = time.perf_counter() - start   # timed untraced; tracemalloc slows allocation
+    gc.collect()
+    tracemalloc.start()
+    table = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del table
+    return current, elapsed
+
+
+def run(n: int, scale: float) -> None:
+    rows = [(type(item), item.model_dump_json()) for item in _items(n, scale)]
+    load = lambda: (cls.model_validate_json(raw) for cls, raw in rows)  # noqa: E731
+
+    def full_dicts():
+        return [_full(item) for item in load()]
+
+    def compact_dicts():
+        return [item.index_payload() for item in load()]
+
+    def compact_bytes():
+        table = PayloadTable()
+        for item in load():
+            table.append(item.index_payload())
+        return table
+
+    print(f"items={n} text_scale={scale}")
+    print(f"{'layout':<14} | {'MB total':>9} | {'MB / 100k':>9} | {'bytes/item':>10} | {'build s':>8} | {'vs full':>7}")
+    print("-" * 72)
+    baseline = None
+    for name, build in (("full dicts", full_dicts), ("compact dicts", compact_dicts), ("compact bytes", compact_bytes)):
+        used, elapsed = _measure(build)
+        baseline = baseline or used
+        print(f"{name:<14} | {used / 2**20:>9.1f} | {used / n * 100_000 / 2**20:>9.1f} | "
+              f"{used / n:>10.0f} | {elapsed:>8.2f} | {used / baseline:>6.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--text-scale", type=float, default=1.0, help="multiplier on generated text lengths")
+    args = parser.parse_args()
+    run(args.items, args.text_scale)
+
+
+if __name__ == "__main__":
+    main()
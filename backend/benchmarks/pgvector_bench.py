@@ -0,0 +1,107 @@
+"""
+Recall@k vs latency — PgVectorStore against the exact InMemoryVectorStore.
+
+Needs a Postgres with the pgvector extension at POSTGRES_URL (the compose
+`postgres` service runs the pgvector image). The benchmark drops and
+refills the `vector_items` table, so point it at a scratch database. Uses
+the same clustered embeddings as ann_bench, and sweeps hnsw.ef_search (or
+ivfflat.probes) over one index build.
+
+    docker compose up -d postgres
+    GROQ_API_KEY=x python -m backend.benchmarks.pgvector_bench
+    GROQ_API_KEY=x python -m backend.benchmarks.pgvector_bench --size 100000 --index ivfflat --knob 1 10 40
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from typing import List
+
+import numpy as np
+from sqlalchemy import text
+
+from backend.benchmarks.ann_bench import DIMENSION, _clustered, _unit
+from backend.infrastructure.database import get_session_factory, shutdown_db
+from backend.infrastructure.pgvector_store import TABLE, PgVectorStore
+from backend.infrastructure.vector_store import InMemoryVectorStore
+
+TYPES = ["objective", "learning", "decision", "reflection"]
+
+
+async def _load(store, vectors: np.ndarray) -> float:
+    start = time.perf_counter()
+    for chunk in range(0, vectors.shape[0], 5_000):
+        block = vectors[chunk:chunk + 5_000]
+        ids = [f"item-{i}" for i in range(chunk, chunk + block.shape[0])]
+        payloads = [{"_type": TYPES[i % 4], "tags": [f"t{i % 16}"]} for i in range(chunk, chunk + block.shape[0])]
+        await store.upsert_many(ids, block, payloads)
+    return time.perf_counter() - start
+
+
+async def _run_queries(store, queries: np.ndarray, k: int, **filters):
+    latencies, results = [], []
+    for q in queries:
+        start = time.perf_counter()
+        hits = await store.search(q, limit=k, min_score=-1.0, **filters)
+        latencies.append((time.perf_counter() - start) * 1000)
+        results.append({h["id"] for h in hits})
+    return results, latencies
+
+
+def _row(label: str, found, truth, lat: List[float], build: float) -> str:
+    recall = statistics.mean(len(f & t) / max(len(t), 1) for f, t in zip(found, truth))
+    p95 = sorted(lat)[max(int(len(lat) * 0.95) - 1, 0)]
+    return f"{label:<22} | {recall:>9.3f} | {statistics.median(lat):>8.2f} | {p95:>8.2f} | {build:>8.2f}"
+
+
+async def run(n: int, index: str, knobs: List[int], k: int, n_queries: int) -> None:
+    rng = np.random.default_rng(0)
+    vectors = _clustered(n, DIMENSION, rng)
+    picks = rng.choice(n, n_queries, replace=False)
+    queries = _unit(vectors[picks] + 1.0 * rng.standard_normal((n_queries, DIMENSION), dtype=np.float32) / np.sqrt(DIMENSION))
+
+    async with get_session_factory()() as session:
+        await session.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+        await session.commit()
+    store = PgVectorStore(dimension=DIMENSION, index=index, lists=max(int(np.sqrt(n)), 1))
+    await store.ensure_schema()
+    pg_build = await _load(store, vectors)
+
+    exact = InMemoryVectorStore(dimension=DIMENSION, initial_capacity=n)
+    exact_build = await _load(exact, vectors)
+
+    print(f"N={n} index={index} k={k} queries={n_queries}")
+    print(f"{'store':<22} | {'recall@' + str(k):>9} | {'p50 ms':>8} | {'p95 ms':>8} | {'build s':>8}")
+    print("-" * 68)
+    for label, filters in (("", {}), (" type", {"types": ["learning"]})):
+        truth, lat = await _run_queries(exact, queries, k, **filters)
+        print(_row("exact" + label, truth, truth, lat, exact_build))
+        for knob in knobs:
+            if index == "hnsw":
+                store._ef_search = knob
+            else:
+                store._probes = knob
+            found, lat = await _run_queries(store, queries, k, **filters)
+            name = ("ef=" if index == "hnsw" else "probes=") + str(knob)
+            print(_row(f"pgvector {name}{label}", found, truth, lat, pg_build))
+    await shutdown_db()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=10_000)
+    parser.add_argument("--index", default="hnsw", choices=["hnsw", "ivfflat"])
+    parser.add_argument("--knob", type=int, nargs="+", default=[10, 40, 100],
+                        help="hnsw.ef_search values (or ivfflat.probes) to sweep")
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    asyncio.run(run(args.size, args.index, args.knob, args.k, args.queries))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Write throughput and search recall — QdrantVectorStore, unbuffered vs batched.
+
+Needs a Qdrant server (`docker compose --profile qdrant up -d qdrant`). The
+benchmark recreates its own collection. Writes are issued as concurrent
+single-item upsert() calls — as the use cases do — once with batch_size=1
+(one request per point, the previous behaviour) and once with the buffer;
+searches are checked against the exact InMemoryVectorStore.
+
+    python -m backend.benchmarks.qdrant_bench
+    python -m backend.benchmarks.qdrant_bench --size 20000 --batch-size 64 256 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from typing import List
+
+import numpy as np
+
+from backend.benchmarks.ann_bench import DIMENSION, _clustered, _unit
+from backend.infrastructure.qdrant_adapter import QdrantVectorStore
+from backend.infrastructure.vector_store import InMemoryVectorStore
+
+TYPES = ["objective", "learning", "decision", "reflection"]
+COLLECTION = "jarvis_bench"
+
+
+async def _fresh(host: str, port: int, batch_size: int) -> QdrantVectorStore:
+    store = QdrantVectorStore(host=host, port=port, collection=COLLECTION, dimension=DIMENSION, batch_size=batch_size)
+    await store._client.delete_collection(COLLECTION)
+    await store.ensure_schema()
+    return store
+
+
+async def _write(store, vectors: np.ndarray, ids: List[str], concurrency: int) -> float:
+    """Single-item upserts from `concurrency` concurrent writers; returns points/s."""
+    queue = iter(range(len(ids)))
+
+    async def writer():
+        for i in queue:
+            await store.upsert(ids[i], vectors[i], {"_type": TYPES[i % 4], "n": i})
+
+    start = time.perf_counter()
+    await asyncio.gather(*(writer() for _ in range(concurrency)))
+    if isinstance(store, QdrantVectorStore):
+        await store.flush()
+    return len(ids) / (time.perf_counter() - start)
+
+
+async def run(host: str, port: int, n: int, batch_sizes: List[int], concurrency: int, k: int, n_queries: int) -> None:
+    rng = np.random.default_rng(0)
+    vectors = _clustered(n, DIMENSION, rng)
+    ids = [f"00000000-0000-0000-0000-{i:012d}" for i in range(n)]   # Qdrant ids must be ints or UUIDs
+    picks = rng.choice(n, n_queries, replace=False)
+    queries = _unit(vectors[picks] + 1.0 * rng.standard_normal((n_queries, DIMENSION), dtype=np.float32) / np.sqrt(DIMENSION))
+
+    exact = InMemoryVectorStore(dimension=DIMENSION, initial_capacity=n)
+    await exact.upsert_many(ids, vectors, [{"_type": TYPES[i % 4]} for i in range(n)])
+    truth = [{h["id"] for h in await exact.search(q, limit=k, min_score=-1.0)} for q in queries]
+
+    print(f"N={n} concurrency={concurrency} k={k}")
+    print(f"{'batch_size':>10} | {'upserts/s':>10} | {'recall@' + str(k):>9} | {'search p50':>10} | {'many(4) p50':>11}")
+    print("-" * 64)
+    for batch_size in [1] + batch_sizes:
+        store = await _fresh(host, port, batch_size)
+        rate = await _write(store, vectors, ids, concurrency)
+        found, lat = [], []
+        for q in queries:
+            start = time.perf_counter()
+            found.append({h["id"] for h in await store.search(q, limit=k, min_score=-1.0)})
+            lat.append((time.perf_counter() - start) * 1000)
+        many = []
+        for start_q in range(0, n_queries - 3, 4):
+            start = time.perf_counter()
+            await store.search_many(queries[start_q:start_q + 4], [k] * 4, min_score=-1.0)
+            many.append((time.perf_counter() - start) * 1000)
+        recall = statistics.mean(len(f & t) / max(len(t), 1) for f, t in zip(found, truth))
+        print(f"{batch_size:>10} | {rate:>10.0f} | {recall:>9.3f} | {statistics.median(lat):>10.2f} | "
+              f"{statistics.median(many) if many else float('nan'):>11.2f}")
+        await store._client.delete_collection(COLLECTION)
+        await store.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=6333)
+    parser.add_argument("--size", type=int, default=10_000)
+    parser.add_argument("--batch-size", type=int, nargs="+", default=[64, 256])
+    parser.add_argument("--concurrency", type=int, default=16, help="concurrent single-item writers")
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    asyncio.run(run(args.host, args.port, args.size, args.batch_size, args.concurrency, args.k, args.queries))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Microbenchmark — per-search latency and allocation of InMemoryVectorStore.
+
+Compares the contiguous-matrix store against the previous layout, which
+rebuilt the corpus with np.stack() on every query. With --ranking, each
+layout is also timed with a RankingPolicy (recency decay + status boosts).
+
+    python -m backend.benchmarks.vector_store_bench
+    python -m backend.benchmarks.vector_store_bench --sizes 10000 100000 --queries 50
+    python -m backend.benchmarks.vector_store_bench --quantization none int8 float16 --no-legacy
+    python -m backend.benchmarks.vector_store_bench --sizes 100000 --no-legacy --ranking
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from backend.domain.models import RankingPolicy
+from backend.infrastructure.vector_store import InMemoryVectorStore
+
+DIMENSION = 384
+STATUSES = ["staging", "in_progress", "completed", "failed"]
+POLICY = RankingPolicy(half_life_days=180, decay_floor=0.5, status_boosts={"in_progress": 1.1, "staging": 0.9})
+
+
+def _random_unit_vectors(n: int, dim: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    vecs = rng.standard_normal((n, dim), dtype=np.float32)
+    vecs /= np.linalg.norm(vecs, axis=1, keepdims=True)
+    return vecs
+
+
+def _legacy_search(vectors: Dict[str, np.ndarray], query: np.ndarray, limit: int) -> List[str]:
+    """The pre-matrix search path: stack every vector per query, then full argsort."""
+    ids = list(vectors.keys())
+    matrix = np.stack([vectors[i] for i in ids])
+    scores = matrix @ query
+    return [ids[i] for i in np.argsort(scores)[::-1][:limit]]
+
+
+def _measure(fn: Callable[[], object], queries: int) -> Dict[str, float]:
+    fn()  # warm-up
+    timings = []
+    for _ in range(queries):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "p50_ms": statistics.median(timings),
+        "p95_ms": sorted(timings)[int(len(timings) * 0.95) - 1],
+        "peak_alloc_mb": peak / (1024 * 1024),
+    }
+
+
+async def _build_store(vectors: np.ndarray, quantization: str) -> InMemoryVectorStore:
+    store = InMemoryVectorStore(dimension=vectors.shape[1], quantization=quantization)
+    now = datetime.utcnow()
+    for i, vec in enumerate(vectors):
+        await store.upsert(f"item-{i}", vec, {
+            "_type": "objective",
+            "created_at": (now - timedelta(hours=i % 20_000)).isoformat(),
+            "status": STATUSES[i % len(STATUSES)],
+        })
+    return store
+
+
+def _index_mb(store: InMemoryVectorStore) -> float:
+    arrays = [
+        a for seg in store._segments.values()
+        for a in (seg.matrix, seg.scales, seg.exact, seg.created, seg.status) if a is not None
+    ]
+    return sum(a.nbytes for a in arrays) / (1024 * 1024)
+
+
+def run(sizes: List[int], queries: int, limit: int, legacy: bool, quantizations: List[str], ranking: bool) -> None:
+    loop = asyncio.new_event_loop()
+    query_vecs = _random_unit_vectors(queries, DIMENSION, seed=1)
+
+    print(f"{'N':>10} | {'layout':<11} | {'p50 ms':>9} | {'p95 ms':>9} | {'peak alloc MB':>14} | {'index MB':>9}")
+    print("-" * 77)
+    for n in sizes:
+        vectors = _random_unit_vectors(n, DIMENSION, seed=0)
+        q_iter = iter(range(10**9))
+        for quantization in quantizations:
+            store = loop.run_until_complete(_build_store(vectors, quantization))
+            for policy in [None, POLICY] if ranking else [None]:
+                matrix_stats = _measure(
+                    lambda: loop.run_until_complete(
+                        store.search(query_vecs[next(q_iter) % queries], limit=limit, ranking=policy)
+                    ),
+                    queries,
+                )
+                layout = ("matrix" if quantization == "none" else quantization) + ("+rank" if policy else "")
+                print(f"{n:>10} | {layout:<11} | {matrix_stats['p50_ms']:>9.2f} | "
+                      f"{matrix_stats['p95_ms']:>9.2f} | {matrix_stats['peak_alloc_mb']:>14.2f} | "
+                      f"{_index_mb(store):>9.1f}")
+            del store
+
+        if legacy:
+            as_dict = {f"item-{i}": vec for i, vec in enumerate(vectors)}
+            legacy_stats = _measure(
+                lambda: _legacy_search(as_dict, query_vecs[next(q_iter) % queries], limit),
+                queries,
+            )
+            print(f"{n:>10} | {'np.stack':<11} | {legacy_stats['p50_ms']:>9.2f} | "
+                  f"{legacy_stats['p95_ms']:>9.2f} | {legacy_stats['peak_alloc_mb']:>14.2f}")
+            del as_dict
+
+        del vectors
+    loop.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=8)
+    parser.add_argument("--no-legacy", action="store_true", help="skip the np.stack baseline")
+    parser.add_argument("--quantization", nargs="+", default=["none"], choices=["none", "float16", "int8"])
+    parser.add_argument("--ranking", action="store_true", help="also time searches with a RankingPolicy")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    run(
+        args.sizes, args.queries, args.limit, legacy=not args.no_legacy, quantizations=args.quantization,
+        ranking=args.ranking,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,8 @@ class EventType(str, Enum):
     REFLECTION_REQUESTED = "reflection_requested"
     REFLECTION_COMPLETED = "reflection_completed"
     INSIGHT_GENERATED = "insight_generated"
+    # Chat: auto-capture runs in the worker, after the reply has been sent
+    CHAT_EXCHANGE_COMPLETED = "chat_exchange_completed"
 
 
 class DomainEvent(BaseModel):
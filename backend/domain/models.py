@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Optional, List
 from enum import Enum
 import uuid
 
@@ -70,6 +70,16 @@ class Objective(BaseModel):
             parts.append(" ".join(self.tags))
         return " ".join(parts)
 
+    def index_payload(self) -> dict:
+        return {
+            "_type": "objective",
+            "created_at": self.created_at.isoformat(),
+            "what": self.what,
+            "status": self.status.value,
+            "workdone": self.workdone,
+            "tags": self.tags,
+        }
+
 
 # ─── Learning ──────────────────────────────────────────────────────
 class LearningCategory(str, Enum):
@@ -93,6 +103,15 @@ class Learning(BaseModel):
     def embedding_text(self) -> str:
         return f"{self.content} {' '.join(self.tags)}"
 
+    def index_payload(self) -> dict:
+        return {
+            "_type": "learning",
+            "created_at": self.created_at.isoformat(),
+            "content": self.content,
+            "category": self.category.value,
+            "tags": self.tags,
+        }
+
 
 # ─── Decision Log ─────────────────────────────────────────────────
 class DecisionLog(BaseModel):
@@ -110,6 +129,15 @@ class DecisionLog(BaseModel):
     def embedding_text(self) -> str:
         return f"{self.decision} {self.why} {self.context}"
 
+    def index_payload(self) -> dict:
+        return {
+            "_type": "decision",
+            "created_at": self.created_at.isoformat(),
+            "decision": self.decision,
+            "why": self.why,
+            "tags": self.tags,
+        }
+
 
 # ─── Reflection ────────────────────────────────────────────────────
 class Reflection(BaseModel):
@@ -125,6 +153,41 @@ class Reflection(BaseModel):
     def embedding_text(self) -> str:
         return f"{self.trigger} {self.summary}"
 
+    def index_payload(self) -> dict:
+        return {
+            "_type": "reflection",
+            "created_at": self.created_at.isoformat(),
+            "summary": self.summary[:200],
+            "trigger": self.trigger[:80],
+        }
+
+
+# ─── Retrieval ranking ─────────────────────────────────────────────
+class RankingPolicy(BaseModel):
+    """How a vector search weighs similarity by an item's age and status.
+
+    score = cosine × status_boosts[status] × (floor + (1 − floor) · 0.5^(age / half-life))
+
+    Age comes from the payload's `created_at`, status from its `status`
+    (objectives only); items without them are neither decayed nor boosted.
+    The default policy changes nothing.
+    """
+    half_life_days: Optional[float] = None    # None = no recency decay
+    decay_floor: float = 0.0                  # weight an arbitrarily old item keeps
+    status_boosts: Dict[str, float] = Field(default_factory=dict)
+
+    @property
+    def neutral(self) -> bool:
+        return not self.half_life_days and all(boost == 1.0 for boost in self.status_boosts.values())
+
+    def weight(self, age_days: Optional[float], status: Optional[str]) -> float:
+        """The multiplier for one item; stores apply the same formula vectorised."""
+        weight = self.status_boosts.get(status, 1.0) if status is not None else 1.0
+        if self.half_life_days and age_days is not None:
+            decay = 0.5 ** (max(age_days, 0.0) / self.half_life_days)
+            weight *= self.decay_floor + (1.0 - self.decay_floor) * decay
+        return weight
+
 
 # ─── Chat History ──────────────────────────────────────────────────
 class ChatMessageRecord(BaseModel):
@@ -1,17 +1,42 @@
 import json
 import logging
 from typing import List
-from groq import AsyncGroq
+import httpx
+from groq import AsyncGroq, DefaultAsyncHttpxClient
 from backend.ports.interfaces import StructuringAgent, PlanningAgent, ReflectionAgent, InsightAgent
 from backend.domain.models import Objective, PlanStep, Learning, LearningCategory, Reflection
-from backend.config import get_settings
+from backend.infrastructure.prompt_budget import MESSAGE_OVERHEAD_TOKENS, PromptBudget, estimate_tokens
 
 logger = logging.getLogger("jarvis.infra.groq")
 
 
+def create_groq_client(
+    api_key: str,
+    max_connections: int,
+    max_keepalive_connections: int,
+    keepalive_expiry: float,
+    timeout: float,
+    max_retries: int,
+) -> AsyncGroq:
+    """
+    The process-wide Groq client. Every agent and use case shares its httpx
+    pool, so a request reuses a warm keep-alive connection instead of paying
+    for a new TCP + TLS handshake.
+    """
+    http_client = DefaultAsyncHttpxClient(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        timeout=httpx.Timeout(timeout, connect=5.0),
+    )
+    return AsyncGroq(api_key=api_key, http_client=http_client, max_retries=max_retries)
+
+
 class GroqStructuringAgent(StructuringAgent):
-    def __init__(self):
-        self._client = AsyncGroq(api_key=get_settings().groq_api_key)
+    def __init__(self, client: AsyncGroq):
+        self._client = client
         logger.info("[GROQ] StructuringAgent initialized.")
 
     async def structure(self, raw_text: str) -> Objective:
@@ -52,8 +77,8 @@ class GroqStructuringAgent(StructuringAgent):
 
 
 class GroqPlanningAgent(PlanningAgent):
-    def __init__(self):
-        self._client = AsyncGroq(api_key=get_settings().groq_api_key)
+    def __init__(self, client: AsyncGroq):
+        self._client = client
         logger.info("[GROQ] PlanningAgent initialized.")
 
     async def draft_plan(self, objective: Objective) -> List[PlanStep]:
@@ -107,9 +132,21 @@ class GroqPlanningAgent(PlanningAgent):
         return result
 
 
+REFLECTION_SYSTEM_PROMPT = (
+    "You are JARVIS, a reflective thinking partner for a solo business owner. "
+    "Given the user's question and their history of objectives, learnings, and decisions, "
+    "provide a thoughtful reflection. "
+    "Return JSON with keys: "
+    '"summary" (thoughtful 2-4 paragraph reflection), '
+    '"patterns_identified" (list of recurring patterns you notice), '
+    '"suggestions" (list of actionable next steps or considerations).'
+)
+
+
 class GroqReflectionAgent(ReflectionAgent):
-    def __init__(self):
-        self._client = AsyncGroq(api_key=get_settings().groq_api_key)
+    def __init__(self, client: AsyncGroq, prompt_token_budget: int = 0):
+        self._client = client
+        self._prompt_token_budget = prompt_token_budget
         logger.info("[GROQ] ReflectionAgent initialized.")
 
     async def reflect(
@@ -124,48 +161,54 @@ class GroqReflectionAgent(ReflectionAgent):
             trigger[:60], len(related_objectives), len(related_learnings), len(related_decisions),
         )
 
+        # (section, rank within its list, line, is a failure or mistake)
+        items = (
+            [(0, i, f"- {o.get('what', '')} (why: {o.get('why', 'N/A')})", o.get("status") == "failed")
+             for i, o in enumerate(related_objectives[:5])]
+            + [(1, i, f"- [{l.get('category', '')}] {l.get('content', '')}", l.get("category") in ("mistake", "pattern"))
+               for i, l in enumerate(related_learnings[:5])]
+            + [(2, i, f"- {d.get('decision', '')} (why: {d.get('why', '')})", False)
+               for i, d in enumerate(related_decisions[:5])]
+        )
+        # Budget priority: failures and mistakes, then every section's best
+        # item, then every section's second best, … (lists are by relevance).
+        by_priority = sorted(items, key=lambda item: (not item[3], item[1]))
+        budget = PromptBudget(self._prompt_token_budget)
+        budget.reserve(REFLECTION_SYSTEM_PROMPT, MESSAGE_OVERHEAD_TOKENS)
+        budget.reserve(f"Question: {trigger}\n\nContext:\n", MESSAGE_OVERHEAD_TOKENS)
+        kept = sorted(
+            (section, rank, line)
+            for (section, rank, _, _), line in zip(by_priority, budget.take([item[2] for item in by_priority]))
+        )
+
         context_parts = []
-        if related_objectives:
-            context_parts.append(
-                "Past objectives:\n" +
-                "\n".join(f"- {o.get('what', '')} (why: {o.get('why', 'N/A')})" for o in related_objectives[:5])
-            )
-        if related_learnings:
-            context_parts.append(
-                "Past learnings:\n" +
-                "\n".join(f"- [{l.get('category', '')}] {l.get('content', '')}" for l in related_learnings[:5])
-            )
-        if related_decisions:
-            context_parts.append(
-                "Past decisions:\n" +
-                "\n".join(f"- {d.get('decision', '')} (why: {d.get('why', '')})" for d in related_decisions[:5])
-            )
+        for section, heading in enumerate(("Past objectives", "Past learnings", "Past decisions")):
+            shown = [line for s, _, line in kept if s == section]
+            if shown:
+                context_parts.append(f"{heading}:\n" + "\n".join(shown))
 
         context_block = "\n\n".join(context_parts) if context_parts else "No prior context available."
+        user_content = f"Question: {trigger}\n\nContext:\n{context_block}"
+        prompt_tokens = sum(
+            estimate_tokens(text) + MESSAGE_OVERHEAD_TOKENS for text in (REFLECTION_SYSTEM_PROMPT, user_content)
+        )
+        logger.info(
+            "[GROQ] Reflection prompt ~%d tokens (budget %s) | %d/%d context items",
+            prompt_tokens, self._prompt_token_budget or "none", len(kept), len(items),
+        )
 
         response = await self._client.chat.completions.create(
             model="llama-3.3-70b-versatile",
             temperature=0.4,
             response_format={"type": "json_object"},
             messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "You are JARVIS, a reflective thinking partner for a solo business owner. "
-                        "Given the user's question and their history of objectives, learnings, and decisions, "
-                        "provide a thoughtful reflection. "
-                        "Return JSON with keys: "
-                        '"summary" (thoughtful 2-4 paragraph reflection), '
-                        '"patterns_identified" (list of recurring patterns you notice), '
-                        '"suggestions" (list of actionable next steps or considerations).'
-                    ),
-                },
-                {
-                    "role": "user",
-                    "content": f"Question: {trigger}\n\nContext:\n{context_block}",
-                },
+                {"role": "system", "content": REFLECTION_SYSTEM_PROMPT},
+                {"role": "user", "content": user_content},
             ],
         )
+        if getattr(response, "usage", None):
+            logger.info("[GROQ] Reflection prompt tokens: ~%d estimated, %d billed",
+                        prompt_tokens, response.usage.prompt_tokens)
 
         parsed = json.loads(response.choices[0].message.content)
         logger.info(
@@ -184,8 +227,8 @@ class GroqReflectionAgent(ReflectionAgent):
 
 
 class GroqInsightAgent(InsightAgent):
-    def __init__(self):
-        self._client = AsyncGroq(api_key=get_settings().groq_api_key)
+    def __init__(self, client: AsyncGroq):
+        self._client = client
         logger.info("[GROQ] InsightAgent initialized.")
 
     async def extract_learnings(self, objective: Objective) -> List[Learning]:
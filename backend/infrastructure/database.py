@@ -1,4 +1,5 @@
 import logging
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import DeclarativeBase
 from backend.config import get_settings
@@ -62,6 +63,11 @@ async def init_db():
     logger.info("  DATABASE ▸ Running schema migration (create_all)…")
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        # create_all never alters existing tables: add columns introduced since.
+        for table in (ObjectiveTable, LearningTable, DecisionLogTable, ReflectionTable):
+            name = table.__tablename__
+            await conn.execute(text(f"ALTER TABLE {name} ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ"))
+            await conn.execute(text(f"CREATE INDEX IF NOT EXISTS ix_{name}_updated_at ON {name} (updated_at)"))
     logger.info("  DATABASE ▸ Schema ready ✓")
 
 
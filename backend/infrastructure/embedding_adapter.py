@@ -1,5 +1,9 @@
+import asyncio
 import logging
-from typing import List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from typing import Dict, List
 from sentence_transformers import SentenceTransformer
 from backend.ports.interfaces import EmbeddingProvider
 from backend.config import get_settings
@@ -8,17 +12,68 @@ logger = logging.getLogger("jarvis.infra.embedding")
 
 
 class LocalEmbeddingProvider(EmbeddingProvider):
+    """
+    SentenceTransformer embeddings. encode() is a CPU-bound forward pass, so it
+    runs on a dedicated thread pool (torch releases the GIL) and never on the
+    event loop. At most `max_pending` encodes are admitted at once; further
+    callers wait on the loop instead of piling up in the executor queue.
+    """
+
     def __init__(self):
         settings = get_settings()
         logger.info(
             "\n╔══ EMBEDDING ▸ INIT ══════════════════════════════════════\n"
-            "║  Model : %s\n"
+            "║  Model   : %s\n"
+            "║  Workers : %d (max pending %d)\n"
             "╚══════════════════════════════════════════════════════════\n",
-            settings.embedding_model,
+            settings.embedding_model, settings.embedding_workers, settings.embedding_max_pending,
         )
         self._model = SentenceTransformer(settings.embedding_model)
+        self._workers = settings.embedding_workers
+        self._max_pending = settings.embedding_max_pending
+        self._executor = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="embedding")
+        self._admission = asyncio.Semaphore(self._max_pending)
+        self._counter_lock = threading.Lock()
+        self._pending = 0     # encode calls in flight, queued or running
+        self._running = 0
+        self._completed = 0
         logger.info("  EMBEDDING ▸ Model loaded successfully")
 
+    def stats(self) -> Dict[str, int]:
+        """Executor metrics; queue_depth counts encodes waiting for a worker."""
+        with self._counter_lock:
+            return {
+                "workers": self._workers,
+                "max_pending": self._max_pending,
+                "queue_depth": max(0, self._pending - self._running),
+                "running": self._running,
+                "completed": self._completed,
+            }
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, texts, batch_size: int):
+        with self._counter_lock:
+            self._running += 1
+        try:
+            return self._model.encode(texts, batch_size=batch_size, normalize_embeddings=True)
+        finally:
+            with self._counter_lock:
+                self._running -= 1
+                self._completed += 1
+
+    async def _encode(self, texts, batch_size: int = 32):
+        with self._counter_lock:
+            self._pending += 1
+        try:
+            async with self._admission:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self._executor, self._run, texts, batch_size)
+        finally:
+            with self._counter_lock:
+                self._pending -= 1
+
     async def embed(self, text: str) -> List[float]:
         preview = (text[:80] + "…") if len(text) > 80 else text
         logger.info(
@@ -28,6 +83,13 @@ class LocalEmbeddingProvider(EmbeddingProvider):
             "╚══════════════════════════════════════════════════════════\n",
             preview, len(text),
         )
-        vector = self._model.encode(text, normalize_embeddings=True)
+        vector = await self._encode(text)
         logger.debug("  EMBEDDING ▸ Output dimension: %d", len(vector))
         return vector.tolist()
+
+    async def embed_many(self, texts: List[str]) -> np.ndarray:
+        """One batched encode; returns the (n, dim) float32 array without a list round trip."""
+        logger.info("  EMBEDDING ▸ ENCODE BATCH | %d texts", len(texts))
+        if not texts:
+            return np.empty((0, self._model.get_sentence_embedding_dimension()), dtype=np.float32)
+        return await self._encode(texts, batch_size=64)
@@ -0,0 +1,99 @@
+"""
+Micro-batching front for an EmbeddingProvider.
+
+Concurrent embed(text) calls are collected for up to `max_wait_ms` or
+`max_batch_size` texts, whichever comes first, and sent to the wrapped
+provider as one embed_many() call — one model invocation instead of one per
+caller. Each caller's future resolves with its own vector.
+
+When no batch is in flight the wait is skipped: calls made in the same loop
+iteration are flushed together on the next tick, so a lone caller pays no
+added latency and batching only kicks in once the model is busy.
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+from backend.ports.interfaces import EmbeddingProvider
+
+logger = logging.getLogger("jarvis.infra.embedding")
+
+
+class MicroBatchingEmbeddingProvider(EmbeddingProvider):
+    def __init__(self, inner: EmbeddingProvider, max_batch_size: int = 32, max_wait_ms: float = 5.0):
+        self._inner = inner
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait_ms / 1000
+        self._queue: List[Tuple[str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._in_flight: Set[asyncio.Task] = set()
+        self._busy = 0    # batches currently inside the wrapped provider
+        self._batches = 0
+        self._batched_texts = 0
+
+    def stats(self) -> Dict[str, float]:
+        stats = self._inner.stats() if hasattr(self._inner, "stats") else {}
+        return {
+            **stats,
+            "batches": self._batches,
+            "avg_batch_size": round(self._batched_texts / self._batches, 2) if self._batches else 0.0,
+            "batch_queue": len(self._queue),
+        }
+
+    def close(self) -> None:
+        if hasattr(self._inner, "close"):
+            self._inner.close()
+
+    async def embed(self, text: str) -> List[float]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._queue.append((text, future))
+        if len(self._queue) >= self._max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            delay = self._max_wait if self._busy else 0
+            self._timer = loop.call_later(delay, self._flush)
+        return await future
+
+    async def embed_many(self, texts: List[str]) -> Sequence[Sequence[float]]:
+        # Already a batch — no point waiting for company.
+        return await self._inner.embed_many(texts)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._queue:
+            batch = self._queue[:self._max_batch_size]
+            del self._queue[:self._max_batch_size]
+            task = asyncio.get_running_loop().create_task(self._run(batch))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _run(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        # Callers cancelled while queued drop out; duplicate texts encode once.
+        batch = [(text, future) for text, future in batch if not future.done()]
+        if not batch:
+            return
+        unique = list(dict.fromkeys(text for text, _ in batch))
+        self._batches += 1
+        self._batched_texts += len(unique)
+        logger.debug("  EMBEDDING ▸ MICRO-BATCH | %d callers | %d texts", len(batch), len(unique))
+        self._busy += 1
+        try:
+            vectors = await self._inner.embed_many(unique)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self._busy -= 1
+        by_text = dict(zip(unique, vectors))
+        for text, future in batch:
+            if not future.done():
+                vector = by_text[text]
+                future.set_result(vector.tolist() if hasattr(vector, "tolist") else vector)
+        # The model is free again: whatever queued up meanwhile goes now.
+        if self._queue:
+            asyncio.get_running_loop().call_soon(self._flush)
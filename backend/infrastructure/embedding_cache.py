@@ -0,0 +1,174 @@
+"""
+Content-addressed embedding cache.
+
+Embeddings are keyed by a hash of (model name, text), so a changed model never
+serves stale vectors. Two tiers sit in front of the wrapped provider:
+
+  • an in-process LRU bounded by a byte budget, and
+  • an optional Redis tier (raw float32 bytes with a TTL) shared by every
+    worker process, so one worker's encode benefits the others.
+
+Redis errors degrade to a cache miss — the cache never fails a request.
+"""
+
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence
+import numpy as np
+from redis.asyncio import Redis
+from backend.ports.interfaces import EmbeddingProvider
+
+logger = logging.getLogger("jarvis.infra.embedding")
+
+_KEY_OVERHEAD = 64   # rough per-entry bookkeeping cost on top of the vector itself
+
+
+class _ByteBudgetLRU:
+    def __init__(self, max_bytes: int):
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self.bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: bytes) -> Optional[np.ndarray]:
+        vector = self._entries.get(key)
+        if vector is not None:
+            self._entries.move_to_end(key)
+        return vector
+
+    def put(self, key: bytes, vector: np.ndarray) -> None:
+        size = vector.nbytes + _KEY_OVERHEAD
+        if size > self._max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes -= old.nbytes + _KEY_OVERHEAD
+        self._entries[key] = vector
+        self.bytes += size
+        while self.bytes > self._max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.bytes -= evicted.nbytes + _KEY_OVERHEAD
+
+
+class CachingEmbeddingProvider(EmbeddingProvider):
+    def __init__(
+        self,
+        inner: EmbeddingProvider,
+        model_name: str,
+        max_bytes: int,
+        redis: Optional[Callable[[], Awaitable[Redis]]] = None,
+        redis_ttl_seconds: int = 0,
+    ):
+        self._inner = inner
+        self._model_prefix = model_name.encode() + b"\0"
+        self._lru = _ByteBudgetLRU(max_bytes)
+        self._redis = redis
+        self._redis_ttl = redis_ttl_seconds
+        self._hits = 0
+        self._redis_hits = 0
+        self._misses = 0
+
+    def stats(self) -> Dict:
+        stats = self._inner.stats() if hasattr(self._inner, "stats") else {}
+        lookups = self._hits + self._redis_hits + self._misses
+        return {
+            **stats,
+            "cache": {
+                "hits": self._hits,
+                "redis_hits": self._redis_hits,
+                "misses": self._misses,
+                "hit_rate": round((self._hits + self._redis_hits) / lookups, 3) if lookups else 0.0,
+                "entries": len(self._lru),
+                "bytes": self._lru.bytes,
+            },
+        }
+
+    def close(self) -> None:
+        if hasattr(self._inner, "close"):
+            self._inner.close()
+
+    def _key(self, text: str) -> bytes:
+        return hashlib.blake2b(self._model_prefix + text.encode(), digest_size=16).digest()
+
+    @staticmethod
+    def _redis_key(key: bytes) -> str:
+        return f"emb:{key.hex()}"
+
+    async def _redis_get(self, keys: List[bytes]) -> List[Optional[np.ndarray]]:
+        if not self._redis or not keys:
+            return [None] * len(keys)
+        try:
+            client = await self._redis()
+            raws = await client.mget([self._redis_key(k) for k in keys])
+        except Exception as e:
+            logger.warning("  EMBEDDING ▸ CACHE | Redis read failed, treating as miss: %s", e)
+            return [None] * len(keys)
+        return [np.frombuffer(raw, dtype=np.float32) if raw else None for raw in raws]
+
+    async def _redis_put(self, keys: List[bytes], vectors: np.ndarray) -> None:
+        if not self._redis or not keys:
+            return
+        try:
+            client = await self._redis()
+            async with client.pipeline(transaction=False) as pipe:
+                for key, vector in zip(keys, vectors):
+                    pipe.set(self._redis_key(key), vector.tobytes(), ex=self._redis_ttl or None)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning("  EMBEDDING ▸ CACHE | Redis write failed: %s", e)
+
+    async def embed(self, text: str) -> List[float]:
+        key = self._key(text)
+        vector = self._lru.get(key)
+        if vector is not None:
+            self._hits += 1
+            return vector.tolist()
+        vector = (await self._redis_get([key]))[0]
+        if vector is not None:
+            self._redis_hits += 1
+            self._lru.put(key, vector)
+            return vector.tolist()
+
+        # Single misses go through inner.embed() so the micro-batcher can merge them.
+        self._misses += 1
+        vector = np.asarray(await self._inner.embed(text), dtype=np.float32)
+        self._lru.put(key, vector)
+        await self._redis_put([key], vector[None, :])
+        return vector.tolist()
+
+    async def embed_many(self, texts: List[str]) -> Sequence[Sequence[float]]:
+        keys = [self._key(text) for text in texts]
+        found: Dict[bytes, np.ndarray] = {}
+        for key in keys:
+            vector = self._lru.get(key)
+            if vector is not None:
+                found[key] = vector
+        self._hits += sum(1 for key in keys if key in found)
+
+        missing = list(dict.fromkeys(key for key in keys if key not in found))
+        if missing:
+            for key, vector in zip(missing, await self._redis_get(missing)):
+                if vector is not None:
+                    found[key] = vector
+                    self._lru.put(key, vector)
+                    self._redis_hits += 1
+
+        to_encode = {key: text for key, text in zip(keys, texts) if key not in found}
+        if to_encode:
+            self._misses += len(to_encode)
+            vectors = np.asarray(await self._inner.embed_many(list(to_encode.values())), dtype=np.float32)
+            for key, vector in zip(to_encode, vectors):
+                vector = vector.copy()   # own the row so the batch array can be freed
+                found[key] = vector
+                self._lru.put(key, vector)
+            await self._redis_put(list(to_encode), vectors)
+
+        logger.debug(
+            "  EMBEDDING ▸ CACHE | %d texts | %d encoded", len(texts), len(to_encode),
+        )
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.stack([found[key] for key in keys])
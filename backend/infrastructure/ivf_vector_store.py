@@ -0,0 +1,383 @@
+"""
+Approximate nearest-neighbour vector store — IVF-flat over the in-memory segments.
+
+Each type segment is partitioned into `nlist` inverted lists by spherical
+k-means. A search scores the query against the centroids, then scores
+exactly only the rows of the `nprobe` closest lists, so the work per query
+is about nprobe/nlist of a brute-force scan. `nprobe` trades recall for
+latency and can be changed at any time.
+
+Inserts are assigned to their nearest centroid and deletes leave their list
+in O(1), so the index stays current without rebuilds. A segment is trained
+once it holds `train_min` vectors (below that a flat scan is already cheap)
+and retrained whenever it has grown `retrain_growth`× since its last
+training. Training runs on a worker thread, never under the writer lock:
+k-means fits centroids to a copy of the segment's vectors, and the new
+index is swapped in whole once it also covers the rows written meanwhile.
+Until then searches use the previous index, or a flat scan before the
+first one. Centroids and list assignments are persisted with the snapshot,
+so a restart restores the index instead of retraining it.
+
+IVF-flat was picked over HNSW because every step is a NumPy matmul or
+array op; an HNSW graph walk is inherently per-node Python.
+"""
+
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+from backend.infrastructure.vector_store import (
+    DEFAULT_CAPACITY,
+    DEFAULT_DIMENSION,
+    InMemoryVectorStore,
+    _Ranking,
+    _Segment,
+)
+
+logger = logging.getLogger("jarvis.infra.vectorstore")
+
+_KMEANS_ITERATIONS = 10
+_KMEANS_SAMPLE_PER_LIST = 64
+_ASSIGN_CHUNK = 65536
+
+
+def _nearest(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Index of the closest centroid (by cosine) for each row, in chunks."""
+    out = np.empty(vectors.shape[0], dtype=np.int32)
+    for start in range(0, vectors.shape[0], _ASSIGN_CHUNK):
+        chunk = vectors[start:start + _ASSIGN_CHUNK]
+        out[start:start + chunk.shape[0]] = np.argmax(chunk @ centroids.T, axis=1)
+    return out
+
+
+def _train_centroids(sample: np.ndarray, nlist: int, rng: np.random.Generator) -> np.ndarray:
+    """Spherical k-means on unit vectors; empty lists are re-seeded from the sample."""
+    centroids = sample[rng.choice(sample.shape[0], nlist, replace=False)].copy()
+    for _ in range(_KMEANS_ITERATIONS):
+        assign = _nearest(sample, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, sample)
+        counts = np.bincount(assign, minlength=nlist)
+        empty = np.flatnonzero(counts == 0)
+        if empty.size:
+            sums[empty] = sample[rng.choice(sample.shape[0], empty.size, replace=False)]
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        centroids = sums / np.where(norms > 0, norms, 1.0)
+    return centroids.astype(np.float32)
+
+
+class _InvertedLists:
+    """
+    Row → list assignment of one segment, with each list's rows in a growable array.
+
+    Updated in place by writers while readers probe it, so a probe can see
+    rows newer than the reader's segment view (callers filter them), and
+    one racing a swap-remove may briefly miss the moved row or see it twice
+    (callers deduplicate) — harmless for an approximate index. `epoch`
+    ties it to one row numbering of its segment.
+    """
+
+    def __init__(self, centroids: np.ndarray, capacity: int, epoch: object):
+        self.centroids = centroids
+        self.epoch = epoch
+        nlist = centroids.shape[0]
+        self.rows: List[np.ndarray] = [np.empty(16, dtype=np.int64) for _ in range(nlist)]
+        self.sizes = np.zeros(nlist, dtype=np.int64)
+        self.row_list = np.full(capacity, -1, dtype=np.int32)    # -1 = not indexed
+        self.row_pos = np.zeros(capacity, dtype=np.int64)        # position inside its list
+        self.trained_at = 0                                       # live rows when trained
+
+    @classmethod
+    def build(cls, centroids: np.ndarray, row_list: np.ndarray, capacity: int, epoch: object) -> "_InvertedLists":
+        """Bulk-load from a row → list assignment (vectorised, no per-row Python)."""
+        index = cls(centroids, max(capacity, row_list.shape[0]), epoch)
+        index.row_list[:row_list.shape[0]] = row_list
+        live = np.flatnonzero(row_list >= 0)
+        order = live[np.argsort(row_list[live], kind="stable")]
+        counts = np.bincount(row_list[live], minlength=centroids.shape[0])
+        index.sizes[:] = counts
+        bounds = np.concatenate(([0], np.cumsum(counts)))
+        for list_id in range(centroids.shape[0]):
+            members = order[bounds[list_id]:bounds[list_id + 1]]
+            index.rows[list_id] = np.concatenate((members, np.empty(16, dtype=np.int64)))
+            index.row_pos[members] = np.arange(members.size)
+        index.trained_at = int(live.size)
+        return index
+
+    def _ensure_row(self, row: int) -> None:
+        if row >= self.row_list.shape[0]:
+            grown = max(row + 1, self.row_list.shape[0] * 2)
+            self.row_list = np.concatenate((self.row_list, np.full(grown - self.row_list.shape[0], -1, np.int32)))
+            self.row_pos = np.concatenate((self.row_pos, np.zeros(grown - self.row_pos.shape[0], np.int64)))
+
+    def add(self, row: int, vec: np.ndarray) -> None:
+        self._ensure_row(row)
+        if self.row_list[row] >= 0:
+            self.remove(row)
+        list_id = int(np.argmax(self.centroids @ vec))
+        size = self.sizes[list_id]
+        members = self.rows[list_id]
+        if size == members.shape[0]:
+            members = np.concatenate((members, np.empty(members.shape[0], dtype=np.int64)))
+            self.rows[list_id] = members
+        members[size] = row
+        self.row_list[row] = list_id
+        self.row_pos[row] = size
+        self.sizes[list_id] = size + 1
+
+    def remove(self, row: int) -> None:
+        if row >= self.row_list.shape[0] or self.row_list[row] < 0:
+            return
+        list_id = self.row_list[row]
+        pos = self.row_pos[row]
+        last = self.sizes[list_id] - 1
+        members = self.rows[list_id]
+        moved = members[last]
+        members[pos] = moved               # swap-remove keeps the list dense
+        self.row_pos[moved] = pos
+        self.sizes[list_id] = last
+        self.row_list[row] = -1
+
+    def probe(self, query: np.ndarray, nprobe: int) -> np.ndarray:
+        """Rows of the `nprobe` lists whose centroids are closest to the query."""
+        nprobe = min(nprobe, self.centroids.shape[0])
+        centroid_scores = self.centroids @ query
+        closest = np.argpartition(centroid_scores, -nprobe)[-nprobe:]
+        return np.concatenate([self.rows[l][:self.sizes[l]] for l in closest])
+
+
+class IVFVectorStore(InMemoryVectorStore):
+    """InMemoryVectorStore with an IVF-flat index per type segment."""
+
+    def __init__(
+        self,
+        dimension: int = DEFAULT_DIMENSION,
+        initial_capacity: int = DEFAULT_CAPACITY,
+        nlist: int = 0,
+        nprobe: int = 16,
+        quantization: str = "none",
+        rerank: bool = False,
+        train_min: int = 4096,
+        retrain_growth: float = 4.0,
+        seed: int = 0,
+    ):
+        super().__init__(
+            dimension=dimension, initial_capacity=initial_capacity, quantization=quantization, rerank=rerank,
+        )
+        self._nlist = nlist              # 0 = √n lists, chosen at each training
+        self.nprobe = nprobe
+        self._train_min = train_min
+        self._retrain_growth = retrain_growth
+        self._rng = np.random.default_rng(seed)
+        self._indexes: Dict[str, _InvertedLists] = {}
+        # One trainer thread: trainings queue behind each other instead of
+        # competing with searches for cores.
+        self._trainer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ivf-train")
+        self._training: Dict[str, Future] = {}   # _type → scheduled or running training
+        logger.info(
+            "  VECTOR ▸ IVF | nlist=%s nprobe=%d train_min=%d retrain×%.1f",
+            nlist or "√n", nprobe, train_min, retrain_growth,
+        )
+
+    def index_stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {
+                item_type: {"nlist": index.centroids.shape[0], "trained_at": index.trained_at}
+                for item_type, index in self._indexes.items()
+            }
+
+    def _fit(self, seg: _Segment) -> Tuple[np.ndarray, np.ndarray, int]:
+        """
+        Centroids and row → list assignment for a segment view's live rows.
+        Needs no lock: a view's rows are never written again.
+        """
+        live = seg.live_rows()
+        n = live.size
+        nlist = min(self._nlist or max(int(np.sqrt(n)), 1), n)
+        sample_rows = live
+        if n > nlist * _KMEANS_SAMPLE_PER_LIST:
+            sample_rows = np.sort(self._rng.choice(live, nlist * _KMEANS_SAMPLE_PER_LIST, replace=False))
+        centroids = _train_centroids(seg.vectors(sample_rows), nlist, self._rng)
+
+        row_list = np.full(seg.size, -1, dtype=np.int32)
+        for chunk in range(0, n, _ASSIGN_CHUNK):
+            rows = live[chunk:chunk + _ASSIGN_CHUNK]
+            row_list[rows] = _nearest(seg.vectors(rows), centroids)
+        return centroids, row_list, n
+
+    def _install(self, item_type: str, seg: _Segment, centroids: np.ndarray, row_list: np.ndarray) -> None:
+        """
+        Swap in an index fitted to an older view of `seg`, first assigning the
+        rows written since and dropping the ones deleted since. Caller must
+        hold the lock; `seg` must still have the view's row numbering.
+        """
+        fitted = row_list.shape[0]
+        if seg.size > fitted:
+            row_list = np.concatenate((row_list, np.full(seg.size - fitted, -1, dtype=np.int32)))
+        new_rows = np.arange(fitted, seg.size)
+        if seg.dead:
+            row_list[np.asarray(seg.dead, dtype=np.intp)] = -1
+            new_rows = np.setdiff1d(new_rows, seg.dead, assume_unique=True)
+        if new_rows.size:
+            row_list[new_rows] = _nearest(seg.vectors(new_rows), centroids)
+        self._indexes[item_type] = _InvertedLists.build(centroids, row_list, seg.matrix.shape[0], seg.epoch)
+
+    def _train(self, item_type: str) -> None:
+        """Fit a segment's index on a copy of its rows, then swap it in. Blocking; takes the lock only briefly."""
+        start = time.perf_counter()
+        with self._lock:
+            seg = self._segments.get(item_type)
+            if seg is None:
+                return
+            view = seg.view()
+        centroids, row_list, n = self._fit(view)
+        with self._lock:
+            seg = self._segments.get(item_type)
+            if seg is None or seg.epoch is not view.epoch:
+                # Compacted while training: the assignment no longer matches
+                # the row numbering. Try again if the segment still needs it.
+                logger.info("  VECTOR ▸ IVF TRAIN | type=%s | segment compacted meanwhile, retrying", item_type)
+                retry = seg is not None and self._due(item_type, seg)
+            else:
+                self._install(item_type, seg, centroids, row_list)
+                retry = False
+        if retry:
+            self._train(item_type)
+            return
+        logger.info(
+            "  VECTOR ▸ IVF TRAIN | type=%s | %d vectors → %d lists in %.2fs",
+            item_type, n, centroids.shape[0], time.perf_counter() - start,
+        )
+
+    def _due(self, item_type: str, seg: _Segment) -> bool:
+        """Whether a segment should be (re)trained. Caller must hold the lock."""
+        index = self._indexes.get(item_type)
+        if index is None:
+            return len(seg) >= self._train_min
+        return len(seg) >= index.trained_at * self._retrain_growth
+
+    def _schedule_training(self, item_type: str) -> None:
+        """Queue a training on the trainer thread unless one is pending. Caller must hold the lock."""
+        pending = self._training.get(item_type)
+        if pending is not None and not pending.done():
+            return
+        self._training[item_type] = self._trainer.submit(self._train_logged, item_type)
+
+    def _train_logged(self, item_type: str) -> None:
+        try:
+            self._train(item_type)
+        except Exception:
+            logger.exception("  VECTOR ▸ IVF TRAIN | type=%s | failed, searches stay on the previous index", item_type)
+
+    def wait_for_training(self, timeout: Optional[float] = None) -> None:
+        """Block until the trainings scheduled so far have finished. Run it off the event loop."""
+        with self._lock:
+            pending = list(self._training.values())
+        wait(pending, timeout=timeout)
+
+    def build(self) -> None:
+        """Train every segment large enough to index. Blocking — run it off the event loop."""
+        with self._lock:
+            types = [item_type for item_type, seg in self._segments.items() if len(seg) >= self._train_min]
+        for item_type in types:
+            self._train(item_type)
+
+    def _put(self, item_id: str, vec: np.ndarray, payload: Dict) -> None:
+        super()._put(item_id, vec, payload)
+        item_type, row = self._id_map()[item_id]
+        seg = self._segments[item_type]
+        index = self._indexes.get(item_type)
+        if index is not None:
+            # Keeps serving (and stays current) while a retraining runs.
+            index.add(row, vec)
+        if self._due(item_type, seg):
+            self._schedule_training(item_type)
+
+    def _release(self, item_type: str, row: int) -> None:
+        super()._release(item_type, row)
+        index = self._indexes.get(item_type)
+        if index is not None:
+            index.remove(row)
+
+    def _compacted(self, item_type: str, live: np.ndarray) -> None:
+        super()._compacted(item_type, live)
+        index = self._indexes.get(item_type)
+        if index is None:
+            return
+        # Same centroids and assignments, renumbered to the compacted rows.
+        seg = self._segments[item_type]
+        rebuilt = _InvertedLists.build(index.centroids, index.row_list[live], seg.matrix.shape[0], seg.epoch)
+        rebuilt.trained_at = index.trained_at
+        self._indexes[item_type] = rebuilt
+
+    def _index_for(self, item_type: str, seg: _Segment) -> Optional[_InvertedLists]:
+        """The segment's index, or None when there is none for this view's row numbering."""
+        index = self._indexes.get(item_type)
+        if index is None or index.epoch is not seg.epoch:
+            return None   # compacted since the reader's view was published: scan it flat
+        return index
+
+    def _probe(self, index: _InvertedLists, seg: _Segment, queries: np.ndarray) -> np.ndarray:
+        """Distinct rows of every query's probed lists that exist in the reader's view."""
+        rows = np.concatenate([index.probe(query, self.nprobe) for query in queries])
+        # unique: a probe racing a swap-remove can see the moved row twice, and
+        # several queries' lists overlap.
+        rows = np.unique(rows)
+        return rows[rows < seg.size]   # rows appended after the reader's view
+
+    def _segment_top_k(
+        self, item_type: str, seg: _Segment, query: np.ndarray, limit: int, min_score: Optional[float],
+        ranking: Optional[_Ranking] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        index = self._index_for(item_type, seg)
+        if index is None:
+            return super()._segment_top_k(item_type, seg, query, limit, min_score, ranking)
+        rows = self._probe(index, seg, query[None, :])
+        return seg.top_k(query, seg.score_rows(rows, query), rows, limit, min_score, ranking)
+
+    def _segment_top_k_many(
+        self, item_type: str, seg: _Segment, queries: np.ndarray, limits: List[int], min_score: Optional[float],
+        ranking: Optional[_Ranking] = None,
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        index = self._index_for(item_type, seg)
+        if index is None or queries.shape[0] == 1:
+            return super()._segment_top_k_many(item_type, seg, queries, limits, min_score, ranking)
+        # Score the union of every query's probed lists in one product. Each
+        # query sees a superset of its own lists, so recall can only improve.
+        rows = self._probe(index, seg, queries)
+        scores = seg.score_rows_many(rows, queries)
+        return [
+            seg.top_k(query, query_scores, rows, limit, min_score, ranking)
+            for query, query_scores, limit in zip(queries, scores, limits)
+        ]
+
+    # ─── Snapshots ─────────────────────────────────────────────────
+    def _snapshot_extra(self) -> Tuple[Dict, Dict[str, np.ndarray]]:
+        types = sorted(self._indexes)
+        arrays: Dict[str, np.ndarray] = {}
+        for i, item_type in enumerate(types):
+            index = self._indexes[item_type]
+            arrays[f"ivf{i}.centroids"] = index.centroids.copy()
+            arrays[f"ivf{i}.assign"] = index.row_list[:self._segments[item_type].size].copy()
+        return {"ivf": [{"type": t, "prefix": f"ivf{i}"} for i, t in enumerate(types)]}, arrays
+
+    def _restore_extra(self, manifest: Dict) -> None:
+        self._indexes = {}
+        for entry in manifest.get("ivf", []):
+            item_type = entry["type"]
+            seg = self._segments.get(item_type)
+            if seg is None:
+                continue
+            self._indexes[item_type] = _InvertedLists.build(
+                np.asarray(manifest["arrays"][f"{entry['prefix']}.centroids"]),
+                np.asarray(manifest["arrays"][f"{entry['prefix']}.assign"]),
+                seg.matrix.shape[0],
+                seg.epoch,
+            )
+        # Segments snapshotted before they were large enough get indexed in
+        # the background; they are scanned flat until then.
+        for item_type, seg in self._segments.items():
+            if item_type not in self._indexes and len(seg) >= self._train_min:
+                self._schedule_training(item_type)
@@ -0,0 +1,301 @@
+"""
+In-process BM25 keyword index, kept in step with the vector store.
+Implements the LexicalIndex port.
+
+Vector search alone misses exact-term queries — product names, tool
+names, tags. BM25Index scores the same items by keyword. It indexes the
+text fields of each item's index payload (see `index_payload()` on the
+domain models).
+
+The layout mirrors the vector segments. Documents are append-only rows:
+an update appends a new row and tombstones the old one, and a delete
+only tombstones. Every term keeps a posting list of (row, term
+frequency) in compact `array`s. The lists are compacted once a quarter
+of the rows are dead. Each item's lexical fields are kept too, so that a
+patch of some of them re-indexes the whole document.
+
+LexicalMirrorStore wraps any VectorStore and repeats each write into
+the index, so the two never drift apart.
+"""
+
+import logging
+import math
+import re
+import threading
+import time
+from array import array
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from backend.domain.models import RankingPolicy
+from backend.ports.interfaces import LexicalIndex, VectorStore
+
+logger = logging.getLogger("jarvis.infra.lexical")
+
+UNTYPED = "unknown"
+# Payload fields that carry searchable text (see index_payload()).
+LEXICAL_FIELDS = ("what", "content", "decision", "why", "summary", "trigger", "tags")
+_COMPACT_MIN_DEAD = 1024
+_COMPACT_RATIO = 0.25
+_TOKEN = re.compile(r"\w+")
+_STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have how i in is it its my of on or our "
+    "so that the their this to was we what when which who why will with you your".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased word tokens, without stopwords and one-letter words."""
+    return [t for t in _TOKEN.findall(text.lower()) if len(t) > 1 and t not in _STOPWORDS]
+
+
+def lexical_text(payload: Dict) -> str:
+    parts = []
+    for field in LEXICAL_FIELDS:
+        value = payload.get(field)
+        if isinstance(value, str):
+            parts.append(value)
+        elif isinstance(value, (list, tuple)):
+            parts.extend(str(v) for v in value)
+    return " ".join(parts)
+
+
+def lexical_fields(payload: Dict) -> Dict:
+    """The LEXICAL_FIELDS present in a payload."""
+    return {field: payload[field] for field in LEXICAL_FIELDS if field in payload}
+
+
+class BM25Index(LexicalIndex):
+    """Thread-safe, incremental BM25 (Okapi) over index payload text."""
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, initial_capacity: int = 1024):
+        self._k1 = k1
+        self._b = b
+        self._lock = threading.Lock()
+        self._rows: Dict[str, int] = {}                       # id → live row
+        self._ids: List[Optional[str]] = []                   # row → id, None once dead
+        self._fields: Dict[str, Dict] = {}                    # id → lexical fields, merged into by patch()
+        self._lengths = np.zeros(initial_capacity, dtype=np.float32)
+        self._type_codes = np.zeros(initial_capacity, dtype=np.int16)
+        self._dead = np.zeros(initial_capacity, dtype=bool)
+        self._types: List[str] = []                           # type code → _type
+        self._postings: Dict[str, Tuple[array, array]] = {}   # term → (rows, term frequencies)
+        self._n_dead = 0
+        self._live_length = 0.0
+        logger.info(
+            "\n╔══ LEXICAL INDEX ▸ INIT ══════════════════════════════════\n"
+            "║  Type     : In-memory BM25 (k1=%.2f, b=%.2f)\n"
+            "║  Fields   : %s\n"
+            "╚══════════════════════════════════════════════════════════\n",
+            k1, b, ", ".join(LEXICAL_FIELDS),
+        )
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def size(self) -> int:
+        return len(self._ids)
+
+    def _type_code(self, item_type: str) -> int:
+        try:
+            return self._types.index(item_type)
+        except ValueError:
+            self._types.append(item_type)
+            return len(self._types) - 1
+
+    def _add(self, item_id: str, item_type: str, fields: Dict) -> None:
+        """Retire the item's current row and append one for its new lexical fields. Caller must hold the lock."""
+        self._release(item_id)
+        self._fields[item_id] = fields
+        tokens = tokenize(lexical_text(fields))
+        if not tokens:
+            return
+        row = len(self._ids)
+        if row == self._lengths.shape[0]:
+            self._grow()
+        self._ids.append(item_id)
+        self._rows[item_id] = row
+        self._lengths[row] = len(tokens)
+        self._type_codes[row] = self._type_code(item_type)
+        self._live_length += len(tokens)
+        for term, tf in Counter(tokens).items():
+            posting = self._postings.get(term)
+            if posting is None:
+                posting = self._postings[term] = (array("i"), array("H"))
+            posting[0].append(row)
+            posting[1].append(min(tf, 0xFFFF))
+
+    def _release(self, item_id: str) -> Optional[int]:
+        """Tombstone the item's live row, if any. Caller must hold the lock."""
+        self._fields.pop(item_id, None)
+        row = self._rows.pop(item_id, None)
+        if row is not None:
+            self._dead[row] = True
+            self._ids[row] = None
+            self._n_dead += 1
+            self._live_length -= float(self._lengths[row])
+        return row
+
+    def _grow(self) -> None:
+        capacity = self._lengths.shape[0] * 2
+        for name in ("_lengths", "_type_codes", "_dead"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:old.shape[0]] = old
+            setattr(self, name, new)
+
+    def _maybe_compact(self) -> None:
+        """Drop dead rows from every posting list once enough have piled up. Caller must hold the lock."""
+        size = len(self._ids)
+        if self._n_dead < max(_COMPACT_MIN_DEAD, size * _COMPACT_RATIO):
+            return
+        start = time.perf_counter()
+        live = np.flatnonzero(~self._dead[:size])
+        new_row = np.full(size, -1, dtype=np.int32)
+        new_row[live] = np.arange(live.shape[0], dtype=np.int32)
+        for term in list(self._postings):
+            rows, tfs = self._postings[term]
+            r = np.frombuffer(rows, dtype=np.int32)
+            keep = new_row[r] >= 0
+            if not keep.any():
+                del self._postings[term]
+                continue
+            new_rows, new_tfs = array("i"), array("H")
+            new_rows.frombytes(new_row[r[keep]].tobytes())
+            new_tfs.frombytes(np.frombuffer(tfs, dtype=np.uint16)[keep].tobytes())
+            del r
+            self._postings[term] = (new_rows, new_tfs)
+        capacity = max(self._lengths.shape[0], 16)
+        for name in ("_lengths", "_type_codes"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:live.shape[0]] = old[live]
+            setattr(self, name, new)
+        self._dead = np.zeros(capacity, dtype=bool)
+        self._ids = [self._ids[row] for row in live.tolist()]
+        self._rows = {item_id: row for row, item_id in enumerate(self._ids)}
+        self._n_dead = 0
+        logger.info(
+            "  LEXICAL ▸ COMPACT | %d → %d rows in %.3fs", size, live.shape[0], time.perf_counter() - start,
+        )
+
+    async def upsert_many(self, ids: List[str], payloads: List[Dict]) -> None:
+        with self._lock:
+            for item_id, payload in zip(ids, payloads):
+                self._add(item_id, payload.get("_type", UNTYPED), lexical_fields(payload))
+            self._maybe_compact()
+        logger.debug("  LEXICAL ▸ UPSERT_MANY | %d items", len(ids))
+
+    async def patch(self, item_id: str, fields: Dict) -> None:
+        if not any(field in fields for field in LEXICAL_FIELDS):
+            return
+        with self._lock:
+            row = self._rows.get(item_id)
+            if row is None:
+                item_type = fields.get("_type", UNTYPED)
+            else:
+                item_type = self._types[self._type_codes[row]]
+            # A patch carries only the changed fields: re-index them over the stored ones.
+            self._add(item_id, item_type, {**self._fields.get(item_id, {}), **lexical_fields(fields)})
+            self._maybe_compact()
+
+    async def delete(self, item_id: str) -> None:
+        with self._lock:
+            if self._release(item_id) is not None:
+                self._maybe_compact()
+
+    async def search(self, query: str, limit: int = 10, types: Optional[List[str]] = None) -> List[Dict]:
+        terms = set(tokenize(query))
+        with self._lock:
+            n_live = len(self._rows)
+            if not terms or not n_live or limit <= 0:
+                return []
+            size = len(self._ids)
+            dead = self._dead[:size]
+            avgdl = self._live_length / n_live
+            scores = np.zeros(size, dtype=np.float32)
+            for term in terms:
+                posting = self._postings.get(term)
+                if posting is None:
+                    continue
+                rows = np.frombuffer(posting[0], dtype=np.int32).copy()
+                tfs = np.frombuffer(posting[1], dtype=np.uint16).astype(np.float32)
+                df = rows.shape[0] - int(np.count_nonzero(dead[rows]))
+                if not df:
+                    continue
+                idf = math.log(1.0 + (n_live - df + 0.5) / (df + 0.5))
+                norm = self._k1 * (1.0 - self._b + self._b * self._lengths[rows] / avgdl)
+                scores[rows] += idf * tfs * (self._k1 + 1.0) / (tfs + norm)
+            scores[dead] = 0.0
+            if types is not None:
+                codes = [self._types.index(t) for t in types if t in self._types]
+                scores[~np.isin(self._type_codes[:size], codes)] = 0.0
+            candidates = np.flatnonzero(scores > 0)
+            if candidates.size > limit:
+                candidates = candidates[np.argpartition(scores[candidates], -limit)[-limit:]]
+            candidates = candidates[np.argsort(scores[candidates])[::-1]]
+            results = [
+                {"id": self._ids[row], "score": float(scores[row]),
+                 "payload": {"_type": self._types[self._type_codes[row]]}}
+                for row in candidates.tolist()
+            ]
+        logger.info("  LEXICAL ▸ SEARCH | terms=%d limit=%d types=%s → %d results",
+                    len(terms), limit, types or "all", len(results))
+        return results
+
+
+class LexicalMirrorStore(VectorStore):
+    """VectorStore decorator that repeats every write into a LexicalIndex."""
+
+    def __init__(self, inner: VectorStore, lexical: LexicalIndex):
+        self._inner = inner
+        self._lexical = lexical
+
+    @property
+    def inner(self) -> VectorStore:
+        return self._inner
+
+    async def upsert(self, objective_id: str, embedding: List[float], payload: Dict) -> None:
+        await self._inner.upsert(objective_id, embedding, payload)
+        await self._lexical.upsert_many([objective_id], [payload])
+
+    async def upsert_many(self, ids: List[str], embeddings: Sequence[Sequence[float]], payloads: List[Dict]) -> None:
+        await self._inner.upsert_many(ids, embeddings, payloads)
+        await self._lexical.upsert_many(ids, payloads)
+
+    async def delete(self, objective_id: str) -> None:
+        await self._inner.delete(objective_id)
+        await self._lexical.delete(objective_id)
+
+    async def patch_payload(self, item_id: str, fields: Dict) -> bool:
+        if not await self._inner.patch_payload(item_id, fields):
+            return False
+        await self._lexical.patch(item_id, fields)
+        return True
+
+    async def search(
+        self,
+        embedding: List[float],
+        limit: int = 5,
+        min_score: Optional[float] = None,
+        types: Optional[List[str]] = None,
+        type_limits: Optional[Dict[str, int]] = None,
+        with_vectors: bool = False,
+        ranking: Optional[RankingPolicy] = None,
+    ) -> List[Dict]:
+        return await self._inner.search(embedding, limit, min_score, types, type_limits, with_vectors, ranking)
+
+    async def search_many(
+        self,
+        embeddings: Sequence[Sequence[float]],
+        limits: Sequence[Union[int, Dict[str, int]]],
+        min_score: Optional[float] = None,
+        types: Optional[Sequence[Optional[List[str]]]] = None,
+        union: bool = False,
+        with_vectors: bool = False,
+        ranking: Optional[RankingPolicy] = None,
+    ) -> Union[List[List[Dict]], List[Dict]]:
+        return await self._inner.search_many(embeddings, limits, min_score, types, union, with_vectors, ranking)
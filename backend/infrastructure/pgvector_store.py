@@ -0,0 +1,370 @@
+"""
+Postgres-backed vector store on the pgvector extension.
+Implements the VectorStore port (DIP / Liskov).
+
+Vectors live in one `vector_items` table next to the entity tables, so the
+index is durable, shared by every uvicorn worker and needs neither snapshots
+nor a rehydration on restart. Cosine similarity is served by an HNSW index
+(default) or IVFFlat; `_type` and tag filters are pushed into the WHERE
+clause, and per-type limits run as one LATERAL query rather than one round
+trip per type. Upserts are batched `INSERT … ON CONFLICT (id) DO UPDATE`.
+`created_at` and `status` are copied out of the payload into their own
+columns, so a RankingPolicy is evaluated in SQL over the index-ordered
+candidates instead of on JSONB.
+
+Filters and the ANN index: Postgres applies the WHERE clause to the rows
+the index scan yields, and one HNSW scan yields only `ef_search` candidates
+(IVFFlat: the rows of `probes` lists). A filter on a small type or a rare
+tag could therefore leave fewer than `limit` rows, or none, although
+matching rows exist. Searches turn on pgvector's iterative index scans
+(`hnsw.iterative_scan` / `ivfflat.iterative_scan` = relaxed_order, pgvector
+≥ 0.8), which keep scanning until the LIMIT is met; results are re-sorted
+by score afterwards, so the relaxed order is not visible. On an older
+pgvector the scans are not iterative and filtered searches can come back
+short — ensure_schema() logs a warning when that is the case.
+
+No client-side pgvector package is needed: vectors travel as their text
+form ('[0.1,0.2,…]') and are cast to `vector` in SQL, as the TypeScript
+memory module already does.
+
+Try it against a local container:
+
+    docker compose up -d postgres          # pgvector/pgvector image
+    VECTOR_BACKEND=pgvector uvicorn backend.main:app
+    python -m backend.benchmarks.pgvector_bench --size 10000
+"""
+
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import text
+
+from backend.domain.models import RankingPolicy
+from backend.ports.interfaces import VectorStore
+from backend.infrastructure.database import get_session_factory
+
+logger = logging.getLogger("jarvis.infra.pgvector")
+
+TABLE = "vector_items"
+UNTYPED = "unknown"
+INDEX_KINDS = ("hnsw", "ivfflat")
+UPSERT_CHUNK = 500         # rows per executemany round
+RANK_FACTOR = 4            # index candidates per result when a ranking re-weights them
+
+
+def _literal(vec: np.ndarray) -> str:
+    """pgvector's text form of one vector."""
+    return "[" + ",".join(map(str, vec.tolist())) + "]"
+
+
+def _version_tuple(version: str) -> tuple:
+    """'0.8.0' → (0, 8, 0); non-numeric parts count as 0."""
+    return tuple(int(part) if part.isdigit() else 0 for part in version.split("."))
+
+
+def _timestamp(value) -> Optional[datetime]:
+    """A payload's created_at as an aware datetime for the TIMESTAMPTZ column; naive values are UTC."""
+    if value is None or value == "":
+        return None
+    if not isinstance(value, datetime):
+        try:
+            value = datetime.fromisoformat(str(value))
+        except ValueError:
+            logger.warning("  PGVECTOR ▸ Unparseable created_at %r — stored as NULL (not decayed)", value)
+            return None
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _weight_sql(policy: RankingPolicy, params: Dict) -> str:
+    """SQL for the policy's multiplier of candidate row `c`, binding its values into `params`."""
+    factors = []
+    boosts = [(status, boost) for status, boost in policy.status_boosts.items() if boost != 1.0]
+    if boosts:
+        cases = []
+        for i, (status, boost) in enumerate(boosts):
+            params[f"status{i}"], params[f"boost{i}"] = status, boost
+            cases.append(f"WHEN CAST(:status{i} AS text) THEN CAST(:boost{i} AS float8)")
+        factors.append(f"(CASE c.status {' '.join(cases)} ELSE 1.0 END)")
+    if policy.half_life_days:
+        params["half_life"], params["floor"] = policy.half_life_days * 86400.0, policy.decay_floor
+        # No created_at → power(…) is NULL → not decayed.
+        factors.append(
+            "(CAST(:floor AS float8) + (1 - CAST(:floor AS float8)) * coalesce(power(0.5, "
+            "greatest(extract(epoch FROM now() - c.created_at), 0) / CAST(:half_life AS float8)), 1.0))"
+        )
+    return " * ".join(factors)
+
+
+class PgVectorStore(VectorStore):
+    """Vector store on a Postgres table with an HNSW / IVFFlat cosine index."""
+
+    def __init__(
+        self,
+        dimension: int = 384,
+        index: str = "hnsw",
+        lists: int = 100,
+        ef_search: int = 40,
+        probes: int = 10,
+    ):
+        if index not in INDEX_KINDS:
+            raise ValueError(f"Unknown pgvector index {index!r}")
+        self._dimension = dimension
+        self._index = index
+        self._lists = lists
+        self._ef_search = ef_search
+        self._probes = probes
+        self._iterative_scan = True     # pgvector ≥ 0.8; checked by ensure_schema()
+        self._sessions = get_session_factory()
+        logger.info(
+            "\n╔══ VECTOR STORE ▸ INIT ═══════════════════════════════════\n"
+            "║  Type     : Postgres + pgvector (table %s)\n"
+            "║  Index    : %s, dim=%d, %s\n"
+            "║  Durable, shared by every worker, no snapshots needed\n"
+            "╚══════════════════════════════════════════════════════════\n",
+            TABLE, index, dimension,
+            f"ef_search={ef_search}" if index == "hnsw" else f"lists={lists}, probes={probes}",
+        )
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    def _vector(self, embedding: Sequence[float]) -> np.ndarray:
+        vec = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        if vec.shape[0] != self._dimension:
+            raise ValueError(
+                f"Embedding dimension {vec.shape[0]} does not match store dimension {self._dimension}"
+            )
+        return vec
+
+    # ─── Schema ────────────────────────────────────────────────────
+    async def ensure_schema(self) -> None:
+        """Create the extension, table and indexes if missing. Idempotent."""
+        if self._index == "hnsw":
+            ann = "USING hnsw (embedding vector_cosine_ops)"
+        else:
+            ann = f"USING ivfflat (embedding vector_cosine_ops) WITH (lists = {int(self._lists)})"
+        statements = [
+            "CREATE EXTENSION IF NOT EXISTS vector",
+            f"""
+            CREATE TABLE IF NOT EXISTS {TABLE} (
+                id         TEXT PRIMARY KEY,
+                item_type  TEXT NOT NULL,
+                tags       TEXT[] NOT NULL DEFAULT '{{}}',
+                embedding  vector({int(self._dimension)}) NOT NULL,
+                payload    JSONB NOT NULL,
+                created_at TIMESTAMPTZ,
+                status     TEXT,
+                updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+            )
+            """,
+            f"ALTER TABLE {TABLE} ADD COLUMN IF NOT EXISTS created_at TIMESTAMPTZ",
+            f"ALTER TABLE {TABLE} ADD COLUMN IF NOT EXISTS status TEXT",
+            f"CREATE INDEX IF NOT EXISTS {TABLE}_type_idx ON {TABLE} (item_type)",
+            f"CREATE INDEX IF NOT EXISTS {TABLE}_tags_idx ON {TABLE} USING gin (tags)",
+            f"CREATE INDEX IF NOT EXISTS {TABLE}_{self._index}_idx ON {TABLE} {ann}",
+        ]
+        async with self._sessions() as session:
+            for statement in statements:
+                await session.execute(text(statement))
+            await session.commit()
+            version = (await session.execute(text(
+                "SELECT extversion FROM pg_extension WHERE extname = 'vector'"
+            ))).scalar_one()
+        self._iterative_scan = _version_tuple(version) >= (0, 8)
+        if not self._iterative_scan:
+            logger.warning(
+                "  PGVECTOR ▸ pgvector %s has no iterative index scans (needs ≥ 0.8): "
+                "searches filtered by type or tag may return fewer results than exist", version,
+            )
+        logger.info("  PGVECTOR ▸ Schema ready ✓ (table=%s, index=%s, pgvector %s)", TABLE, self._index, version)
+
+    async def count(self) -> int:
+        async with self._sessions() as session:
+            return (await session.execute(text(f"SELECT count(*) FROM {TABLE}"))).scalar_one()
+
+    # ─── Writes ────────────────────────────────────────────────────
+    _UPSERT = text(f"""
+        INSERT INTO {TABLE} (id, item_type, tags, embedding, payload, created_at, status, updated_at)
+        VALUES (
+            :id, :item_type, CAST(:tags AS text[]), CAST(:embedding AS vector), CAST(:payload AS jsonb),
+            :created_at, :status, now()
+        )
+        ON CONFLICT (id) DO UPDATE SET
+            item_type  = EXCLUDED.item_type,
+            tags       = EXCLUDED.tags,
+            embedding  = EXCLUDED.embedding,
+            payload    = EXCLUDED.payload,
+            created_at = EXCLUDED.created_at,
+            status     = EXCLUDED.status,
+            updated_at = EXCLUDED.updated_at
+    """)
+
+    @staticmethod
+    def _row(item_id: str, vec: np.ndarray, payload: Dict) -> Dict:
+        return {
+            "id": item_id,
+            "item_type": payload.get("_type", UNTYPED),
+            "tags": [str(tag) for tag in payload.get("tags") or []],
+            "embedding": _literal(vec),
+            "payload": json.dumps(payload, separators=(",", ":")),
+            "created_at": _timestamp(payload.get("created_at")),
+            "status": payload.get("status"),
+        }
+
+    async def upsert(self, item_id: str, embedding: List[float], payload: Dict) -> None:
+        row = self._row(item_id, self._vector(embedding), payload)
+        async with self._sessions() as session:
+            await session.execute(self._UPSERT, row)
+            await session.commit()
+        logger.info("  PGVECTOR ▸ UPSERT | id=%s | type=%s", item_id[:12], row["item_type"])
+
+    async def upsert_many(self, ids: List[str], embeddings: Sequence[Sequence[float]], payloads: List[Dict]) -> None:
+        if not ids:
+            return
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        if matrix.ndim != 2 or matrix.shape[1] != self._dimension:
+            raise ValueError(
+                f"Embedding batch shape {matrix.shape} does not match store dimension {self._dimension}"
+            )
+        rows = [self._row(item_id, vec, payload) for item_id, vec, payload in zip(ids, matrix, payloads)]
+        async with self._sessions() as session:
+            for start in range(0, len(rows), UPSERT_CHUNK):
+                await session.execute(self._UPSERT, rows[start:start + UPSERT_CHUNK])
+            await session.commit()
+        logger.info("  PGVECTOR ▸ UPSERT_MANY | %d vectors | dim=%d", len(rows), self._dimension)
+
+    async def delete(self, item_id: str) -> None:
+        async with self._sessions() as session:
+            await session.execute(text(f"DELETE FROM {TABLE} WHERE id = :id"), {"id": item_id})
+            await session.commit()
+        logger.info("  PGVECTOR ▸ DELETE | id=%s", item_id[:12])
+
+    async def patch_payload(self, item_id: str, fields: Dict) -> bool:
+        params = {"id": item_id, "fields": json.dumps(fields, separators=(",", ":"))}
+        column_updates = ""
+        if "tags" in fields:
+            column_updates += ", tags = CAST(:tags AS text[])"
+            params["tags"] = [str(tag) for tag in fields["tags"] or []]
+        if "created_at" in fields:
+            column_updates += ", created_at = :created_at"
+            params["created_at"] = _timestamp(fields["created_at"])
+        if "status" in fields:
+            column_updates += ", status = :status"
+            params["status"] = fields["status"]
+        async with self._sessions() as session:
+            item_type = (await session.execute(
+                text(f"SELECT item_type FROM {TABLE} WHERE id = :id FOR UPDATE"), {"id": item_id},
+            )).scalar_one_or_none()
+            if item_type is None:
+                return False
+            if fields.get("_type", item_type) != item_type:
+                raise ValueError(f"patch_payload cannot change _type of {item_id} ({item_type})")
+            await session.execute(text(
+                f"UPDATE {TABLE} SET payload = payload || CAST(:fields AS jsonb), updated_at = now()"
+                f"{column_updates} WHERE id = :id"
+            ), params)
+            await session.commit()
+        logger.info("  PGVECTOR ▸ PATCH | id=%s | fields=%s", item_id[:12], ",".join(fields))
+        return True
+
+    # ─── Reads ─────────────────────────────────────────────────────
+    async def search(
+        self,
+        embedding: List[float],
+        limit: int = 5,
+        min_score: Optional[float] = None,
+        types: Optional[List[str]] = None,
+        type_limits: Optional[Dict[str, int]] = None,
+        with_vectors: bool = False,
+        ranking: Optional[RankingPolicy] = None,
+        tags: Optional[List[str]] = None,
+    ) -> List[Dict]:
+        """
+        As VectorStore.search; `tags` additionally keeps only items sharing
+        at least one tag with it (GIN-indexed `&&`).
+        """
+        params = {"embedding": _literal(self._vector(embedding))}
+        tag_clause = ""
+        if tags:
+            tag_clause = "AND v.tags && CAST(:tags AS text[])"
+            params["tags"] = list(tags)
+        distance = "v.embedding <=> CAST(:embedding AS vector)"
+        vector_column = ", v.embedding::text AS embedding" if with_vectors else ""
+        weight = _weight_sql(ranking, params) if ranking is not None and not ranking.neutral else ""
+        columns = f"v.id, v.payload::text AS payload, 1 - ({distance}) AS score, v.created_at, v.status{vector_column}"
+
+        def nearest(where: str, lim: str) -> str:
+            """The index scan; with a ranking, RANK_FACTOR× candidates re-weighted and cut to `lim`."""
+            scan = f"SELECT {columns} FROM {TABLE} v WHERE {where} ORDER BY {distance}"
+            if not weight:
+                return f"{scan} LIMIT {lim}"
+            return f"""
+                SELECT c.id, c.payload, c.score * {weight} AS score{", c.embedding" if with_vectors else ""}
+                FROM ({scan} LIMIT {lim} * {RANK_FACTOR}) c
+                ORDER BY score DESC
+                LIMIT {lim}
+            """
+
+        if type_limits is not None:
+            if types is None:
+                types = list(type_limits)
+            planned = [(t, type_limits.get(t, limit)) for t in types]
+            planned = [(t, n) for t, n in planned if n > 0]
+            if not planned:
+                return []
+            params["types"] = [t for t, _ in planned]
+            params["limits"] = [n for _, n in planned]
+            # One index scan per type, in a single statement.
+            sql = f"""
+                SELECT r.*
+                FROM unnest(CAST(:types AS text[]), CAST(:limits AS int[])) AS t(item_type, lim)
+                CROSS JOIN LATERAL ({nearest(f"v.item_type = t.item_type {tag_clause}", "t.lim")}) r
+            """
+        else:
+            if limit <= 0:
+                return []
+            type_clause = ""
+            if types is not None:
+                type_clause = "AND v.item_type = ANY(CAST(:types AS text[]))"
+                params["types"] = list(types)
+            params["limit"] = limit
+            sql = nearest(f"TRUE {type_clause} {tag_clause}", ":limit")
+
+        async with self._sessions() as session:
+            async with session.begin():
+                for statement in self._tuning():
+                    await session.execute(text(statement))
+                rows = (await session.execute(text(sql), params)).all()
+
+        # The cutoff is applied here rather than in SQL so the ORDER BY … LIMIT
+        # stays a plain index scan; it matches InMemoryVectorStore's default.
+        results = []
+        for row in rows:
+            if not (row.score > 0 if min_score is None else row.score >= min_score):
+                continue
+            hit = {"id": row.id, "score": float(row.score), "payload": json.loads(row.payload)}
+            if with_vectors:
+                hit["vector"] = np.asarray(json.loads(row.embedding), dtype=np.float32)
+            results.append(hit)
+        results.sort(key=lambda r: r["score"], reverse=True)
+
+        logger.info(
+            "  PGVECTOR ▸ SEARCH | limit=%d min_score=%s types=%s tags=%s → %d results",
+            limit, min_score, types or "all", tags or "-", len(results),
+        )
+        return results
+
+    def _tuning(self) -> List[str]:
+        """Per-transaction recall / speed knobs for the ANN index."""
+        if self._index == "hnsw":
+            statements = [f"SET LOCAL hnsw.ef_search = {int(self._ef_search)}"]
+        else:
+            statements = [f"SET LOCAL ivfflat.probes = {int(self._probes)}"]
+        if self._iterative_scan:
+            # Keep scanning past the first candidates until filtered queries fill their LIMIT.
+            statements.append(f"SET LOCAL {self._index}.iterative_scan = relaxed_order")
+        return statements
@@ -1,5 +1,6 @@
 import logging
-from typing import Optional, List
+from datetime import datetime, timezone
+from typing import AsyncIterator, Optional, List
 from sqlalchemy import Column, String, Integer, Float, DateTime, Text, JSON, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from backend.infrastructure.database import Base
@@ -24,6 +25,8 @@ class ObjectiveTable(Base):
 
     id = Column(String, primary_key=True, index=True)
     created_at = Column(DateTime(timezone=True), nullable=False)
+    # Last insert or update; NULL on rows written before the column existed.
+    updated_at = Column(DateTime(timezone=True), nullable=True, index=True)
     what = Column(Text, nullable=False)
     why = Column(Text, nullable=True)
     context = Column(Text, nullable=False)
@@ -40,6 +43,8 @@ class LearningTable(Base):
 
     id = Column(String, primary_key=True, index=True)
     created_at = Column(DateTime(timezone=True), nullable=False)
+    # Last insert or update; NULL on rows written before the column existed.
+    updated_at = Column(DateTime(timezone=True), nullable=True, index=True)
     content = Column(Text, nullable=False)
     category = Column(String, nullable=False, default="insight")
     tags = Column(JSON, nullable=True)
@@ -52,6 +57,8 @@ class DecisionLogTable(Base):
 
     id = Column(String, primary_key=True, index=True)
     created_at = Column(DateTime(timezone=True), nullable=False)
+    # Last insert or update; NULL on rows written before the column existed.
+    updated_at = Column(DateTime(timezone=True), nullable=True, index=True)
     decision = Column(Text, nullable=False)
     why = Column(Text, nullable=False)
     context = Column(Text, nullable=False)
@@ -67,6 +74,8 @@ class ReflectionTable(Base):
 
     id = Column(String, primary_key=True, index=True)
     created_at = Column(DateTime(timezone=True), nullable=False)
+    # Last insert or update; NULL on rows written before the column existed.
+    updated_at = Column(DateTime(timezone=True), nullable=True, index=True)
     trigger = Column(Text, nullable=False)
     summary = Column(Text, nullable=False)
     patterns_identified = Column(JSON, nullable=True)
@@ -116,6 +125,7 @@ class PostgresObjectiveRepository(ObjectiveRepository):
         row = ObjectiveTable(
             id=objective.id,
             created_at=objective.created_at,
+            updated_at=datetime.now(timezone.utc),
             what=objective.what,
             why=objective.why,
             context=objective.context,
@@ -165,6 +175,7 @@ class PostgresObjectiveRepository(ObjectiveRepository):
         row.status = objective.status.value
         row.workdone = objective.workdone
         row.tags = objective.tags
+        row.updated_at = datetime.now(timezone.utc)
         await self._session.commit()
 
     async def list_recent(self, limit: int = 20) -> List[Objective]:
@@ -176,6 +187,32 @@ class PostgresObjectiveRepository(ObjectiveRepository):
         logger.debug("  POSTGRES ▸ OBJECTIVE LIST_RECENT | returned %d rows", len(rows))
         return [self._to_domain(row) for row in rows]
 
+    async def get_many(self, ids: List[str]) -> List[Objective]:
+        if not ids:
+            return []
+        result = await self._session.execute(
+            select(ObjectiveTable).where(ObjectiveTable.id.in_(ids))
+        )
+        rows = result.scalars().all()
+        logger.debug("  POSTGRES ▸ OBJECTIVE GET_MANY | %d requested, %d found", len(ids), len(rows))
+        return [self._to_domain(row) for row in rows]
+
+    async def stream_all(
+        self, batch_size: int = 500, updated_since: Optional[datetime] = None,
+    ) -> AsyncIterator[List[Objective]]:
+        logger.debug("  POSTGRES ▸ OBJECTIVE STREAM_ALL | batch_size=%d updated_since=%s", batch_size, updated_since)
+        query = select(ObjectiveTable).order_by(ObjectiveTable.created_at)
+        if updated_since is not None:
+            query = query.where(ObjectiveTable.updated_at >= updated_since)
+        result = await self._session.stream(query.execution_options(yield_per=batch_size))
+        async for rows in result.scalars().partitions(batch_size):
+            yield [self._to_domain(row) for row in rows]
+
+    async def stream_ids(self, batch_size: int = 5000) -> AsyncIterator[List[str]]:
+        result = await self._session.stream(select(ObjectiveTable.id).execution_options(yield_per=batch_size))
+        async for rows in result.scalars().partitions(batch_size):
+            yield list(rows)
+
     @staticmethod
     def _serialize_plan(plan: Optional[List[PlanStep]]) -> Optional[list]:
         if not plan:
@@ -221,6 +258,7 @@ class PostgresLearningRepository(LearningRepository):
         row = LearningTable(
             id=learning.id,
             created_at=learning.created_at,
+            updated_at=datetime.now(timezone.utc),
             content=learning.content,
             category=learning.category.value,
             tags=learning.tags,
@@ -239,6 +277,45 @@ class PostgresLearningRepository(LearningRepository):
         if not row:
             logger.warning("  POSTGRES ▸ LEARNING GET | NOT FOUND: %s", learning_id)
             return None
+        return self._to_domain(row)
+
+    async def list_recent(self, limit: int = 20) -> List[Learning]:
+        logger.debug("  POSTGRES ▸ LEARNING LIST_RECENT | limit=%d", limit)
+        result = await self._session.execute(
+            select(LearningTable).order_by(LearningTable.created_at.desc()).limit(limit)
+        )
+        rows = result.scalars().all()
+        logger.debug("  POSTGRES ▸ LEARNING LIST_RECENT | returned %d rows", len(rows))
+        return [self._to_domain(row) for row in rows]
+
+    async def get_many(self, ids: List[str]) -> List[Learning]:
+        if not ids:
+            return []
+        result = await self._session.execute(
+            select(LearningTable).where(LearningTable.id.in_(ids))
+        )
+        rows = result.scalars().all()
+        logger.debug("  POSTGRES ▸ LEARNING GET_MANY | %d requested, %d found", len(ids), len(rows))
+        return [self._to_domain(row) for row in rows]
+
+    async def stream_all(
+        self, batch_size: int = 500, updated_since: Optional[datetime] = None,
+    ) -> AsyncIterator[List[Learning]]:
+        logger.debug("  POSTGRES ▸ LEARNING STREAM_ALL | batch_size=%d updated_since=%s", batch_size, updated_since)
+        query = select(LearningTable).order_by(LearningTable.created_at)
+        if updated_since is not None:
+            query = query.where(LearningTable.updated_at >= updated_since)
+        result = await self._session.stream(query.execution_options(yield_per=batch_size))
+        async for rows in result.scalars().partitions(batch_size):
+            yield [self._to_domain(row) for row in rows]
+
+    async def stream_ids(self, batch_size: int = 5000) -> AsyncIterator[List[str]]:
+        result = await self._session.stream(select(LearningTable.id).execution_options(yield_per=batch_size))
+        async for rows in result.scalars().partitions(batch_size):
+            yield list(rows)
+
+    @staticmethod
+    def _to_domain(row: LearningTable) -> Learning:
         return Learning(
             id=row.id,
             created_at=row.created_at,
@@ -249,26 +326,6 @@ class PostgresLearningRepository(LearningRepository):
             confidence=row.confidence,
         )
 
-    async def list_recent(self, limit: int = 20) -> List[Learning]:
-        logger.debug("  POSTGRES ▸ LEARNING LIST_RECENT | limit=%d", limit)
-        result = await self._session.execute(
-            select(LearningTable).order_by(LearningTable.created_at.desc()).limit(limit)
-        )
-        rows = result.scalars().all()
-        logger.debug("  POSTGRES ▸ LEARNING LIST_RECENT | returned %d rows", len(rows))
-        return [
-            Learning(
-                id=row.id,
-                created_at=row.created_at,
-                content=row.content,
-                category=LearningCategory(row.category),
-                tags=row.tags or [],
-                source_objective_id=row.source_objective_id,
-                confidence=row.confidence,
-            )
-            for row in rows
-        ]
-
 
 class PostgresDecisionLogRepository(DecisionLogRepository):
     def __init__(self, session: AsyncSession):
@@ -288,6 +345,7 @@ class PostgresDecisionLogRepository(DecisionLogRepository):
         row = DecisionLogTable(
             id=decision.id,
             created_at=decision.created_at,
+            updated_at=datetime.now(timezone.utc),
             decision=decision.decision,
             why=decision.why,
             context=decision.context,
@@ -309,6 +367,45 @@ class PostgresDecisionLogRepository(DecisionLogRepository):
         if not row:
             logger.warning("  POSTGRES ▸ DECISION GET | NOT FOUND: %s", decision_id)
             return None
+        return self._to_domain(row)
+
+    async def list_recent(self, limit: int = 20) -> List[DecisionLog]:
+        logger.debug("  POSTGRES ▸ DECISION LIST_RECENT | limit=%d", limit)
+        result = await self._session.execute(
+            select(DecisionLogTable).order_by(DecisionLogTable.created_at.desc()).limit(limit)
+        )
+        rows = result.scalars().all()
+        logger.debug("  POSTGRES ▸ DECISION LIST_RECENT | returned %d rows", len(rows))
+        return [self._to_domain(row) for row in rows]
+
+    async def get_many(self, ids: List[str]) -> List[DecisionLog]:
+        if not ids:
+            return []
+        result = await self._session.execute(
+            select(DecisionLogTable).where(DecisionLogTable.id.in_(ids))
+        )
+        rows = result.scalars().all()
+        logger.debug("  POSTGRES ▸ DECISION GET_MANY | %d requested, %d found", len(ids), len(rows))
+        return [self._to_domain(row) for row in rows]
+
+    async def stream_all(
+        self, batch_size: int = 500, updated_since: Optional[datetime] = None,
+    ) -> AsyncIterator[List[DecisionLog]]:
+        logger.debug("  POSTGRES ▸ DECISION STREAM_ALL | batch_size=%d updated_since=%s", batch_size, updated_since)
+        query = select(DecisionLogTable).order_by(DecisionLogTable.created_at)
+        if updated_since is not None:
+            query = query.where(DecisionLogTable.updated_at >= updated_since)
+        result = await self._session.stream(query.execution_options(yield_per=batch_size))
+        async for rows in result.scalars().partitions(batch_size):
+            yield [self._to_domain(row) for row in rows]
+
+    async def stream_ids(self, batch_size: int = 5000) -> AsyncIterator[List[str]]:
+        result = await self._session.stream(select(DecisionLogTable.id).execution_options(yield_per=batch_size))
+        async for rows in result.scalars().partitions(batch_size):
+            yield list(rows)
+
+    @staticmethod
+    def _to_domain(row: DecisionLogTable) -> DecisionLog:
         return DecisionLog(
             id=row.id,
             created_at=row.created_at,
@@ -322,29 +419,6 @@ class PostgresDecisionLogRepository(DecisionLogRepository):
             source_objective_id=row.source_objective_id,
         )
 
-    async def list_recent(self, limit: int = 20) -> List[DecisionLog]:
-        logger.debug("  POSTGRES ▸ DECISION LIST_RECENT | limit=%d", limit)
-        result = await self._session.execute(
-            select(DecisionLogTable).order_by(DecisionLogTable.created_at.desc()).limit(limit)
-        )
-        rows = result.scalars().all()
-        logger.debug("  POSTGRES ▸ DECISION LIST_RECENT | returned %d rows", len(rows))
-        return [
-            DecisionLog(
-                id=row.id,
-                created_at=row.created_at,
-                decision=row.decision,
-                why=row.why,
-                context=row.context,
-                alternatives_considered=row.alternatives_considered or [],
-                expected_outcome=row.expected_outcome,
-                actual_outcome=row.actual_outcome,
-                tags=row.tags or [],
-                source_objective_id=row.source_objective_id,
-            )
-            for row in rows
-        ]
-
 
 class PostgresReflectionRepository(ReflectionRepository):
     def __init__(self, session: AsyncSession):
@@ -364,6 +438,7 @@ class PostgresReflectionRepository(ReflectionRepository):
         row = ReflectionTable(
             id=reflection.id,
             created_at=reflection.created_at,
+            updated_at=datetime.now(timezone.utc),
             trigger=reflection.trigger,
             summary=reflection.summary,
             patterns_identified=reflection.patterns_identified,
@@ -381,19 +456,46 @@ class PostgresReflectionRepository(ReflectionRepository):
         )
         rows = result.scalars().all()
         logger.debug("  POSTGRES ▸ REFLECTION LIST_RECENT | returned %d rows", len(rows))
-        return [
-            Reflection(
-                id=row.id,
-                created_at=row.created_at,
-                trigger=row.trigger,
-                summary=row.summary,
-                patterns_identified=row.patterns_identified or [],
-                suggestions=row.suggestions or [],
-                related_objective_ids=row.related_objective_ids or [],
-                related_learning_ids=row.related_learning_ids or [],
-            )
-            for row in rows
-        ]
+        return [self._to_domain(row) for row in rows]
+
+    async def get_many(self, ids: List[str]) -> List[Reflection]:
+        if not ids:
+            return []
+        result = await self._session.execute(
+            select(ReflectionTable).where(ReflectionTable.id.in_(ids))
+        )
+        rows = result.scalars().all()
+        logger.debug("  POSTGRES ▸ REFLECTION GET_MANY | %d requested, %d found", len(ids), len(rows))
+        return [self._to_domain(row) for row in rows]
+
+    async def stream_all(
+        self, batch_size: int = 500, updated_since: Optional[datetime] = None,
+    ) -> AsyncIterator[List[Reflection]]:
+        logger.debug("  POSTGRES ▸ REFLECTION STREAM_ALL | batch_size=%d updated_since=%s", batch_size, updated_since)
+        query = select(ReflectionTable).order_by(ReflectionTable.created_at)
+        if updated_since is not None:
+            query = query.where(ReflectionTable.updated_at >= updated_since)
+        result = await self._session.stream(query.execution_options(yield_per=batch_size))
+        async for rows in result.scalars().partitions(batch_size):
+            yield [self._to_domain(row) for row in rows]
+
+    async def stream_ids(self, batch_size: int = 5000) -> AsyncIterator[List[str]]:
+        result = await self._session.stream(select(ReflectionTable.id).execution_options(yield_per=batch_size))
+        async for rows in result.scalars().partitions(batch_size):
+            yield list(rows)
+
+    @staticmethod
+    def _to_domain(row: ReflectionTable) -> Reflection:
+        return Reflection(
+            id=row.id,
+            created_at=row.created_at,
+            trigger=row.trigger,
+            summary=row.summary,
+            patterns_identified=row.patterns_identified or [],
+            suggestions=row.suggestions or [],
+            related_objective_ids=row.related_objective_ids or [],
+            related_learning_ids=row.related_learning_ids or [],
+        )
 
 
 class PostgresChatHistoryRepository(ChatHistoryRepository):
@@ -0,0 +1,72 @@
+"""
+Token budgets for LLM prompts.
+
+estimate_tokens() is a local, dependency-free stand-in for the Llama 3
+tokenizer: every word or punctuation mark is a token, and long words cost
+one more per six characters. It is an estimate, not the model's count —
+budgets should keep headroom below the context window — but it needs no
+tokenizer download and costs one regex pass per text.
+
+PromptBudget fills a budget in the order text is offered — callers offer
+the most important sections first — and truncates deterministically: a
+section keeps the longest prefix of its items that fits, the first item
+that does not fit is cut at a word boundary if enough room is left, and
+nothing after it is taken.
+"""
+
+import re
+from typing import List
+
+_PIECE = re.compile(r"\w+|[^\w\s]")
+
+# Role header and separators the chat template adds around each message.
+MESSAGE_OVERHEAD_TOKENS = 4
+# Below this, a truncated item says too little to be worth sending.
+MIN_TRUNCATED_TOKENS = 24
+
+
+def estimate_tokens(text: str) -> int:
+    return sum(1 + (len(piece) - 1) // 6 for piece in _PIECE.findall(text))
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """The longest word-boundary prefix of `text` estimated at ≤ max_tokens, marked with "…" when cut."""
+    used = 0
+    for match in _PIECE.finditer(text):
+        used += 1 + (len(match.group()) - 1) // 6
+        if used > max_tokens - 1:   # leave room for the ellipsis
+            return text[:match.start()].rstrip() + "…"
+    return text
+
+
+class PromptBudget:
+    """Running token count of one prompt against an optional budget (0 = unlimited)."""
+
+    def __init__(self, budget: int = 0):
+        self.budget = budget
+        self.used = 0
+
+    @property
+    def remaining(self) -> float:
+        return self.budget - self.used if self.budget > 0 else float("inf")
+
+    def reserve(self, text: str, overhead: int = 0) -> None:
+        """Count text that is always sent (instructions, the user's message), even past the budget."""
+        self.used += estimate_tokens(text) + overhead
+
+    def take(self, items: List[str], separator_tokens: int = 1, min_tokens: int = MIN_TRUNCATED_TOKENS) -> List[str]:
+        """The prefix of `items` that fits, in order; the first one that does not is truncated or dropped."""
+        taken = []
+        for item in items:
+            cost = estimate_tokens(item) + separator_tokens
+            if cost <= self.remaining:
+                taken.append(item)
+                self.used += cost
+                continue
+            room = int(self.remaining) - separator_tokens
+            if room >= min_tokens:
+                item = truncate_to_tokens(item, room)
+                taken.append(item)
+                self.used += estimate_tokens(item) + separator_tokens
+            break
+        return taken
@@ -1,79 +1,332 @@
+"""
+Qdrant-backed vector store on the async client.
+Implements the VectorStore port (DIP / Liskov).
+
+One AsyncQdrantClient (and its pooled HTTP / gRPC connections) serves every
+call, so nothing blocks the event loop. Upserts are buffered and sent as
+batched `upsert` calls — when the buffer reaches `batch_size`, or
+`flush_interval_ms` after the first buffered write, whichever comes first.
+A search flushes the buffer before querying, so callers always read their
+own writes. `_type` has a keyword payload index; per-type limits and
+search_many go out as one `query_batch_points` request. A RankingPolicy
+becomes a server-side formula query (exp decay on `created_at`, status
+conditions) over a RANK_FACTOR× vector prefetch; formula queries need
+Qdrant ≥ 1.14 on both the client and the server.
+
+Try it against a local container:
+
+    docker compose --profile qdrant up -d qdrant
+    VECTOR_BACKEND=qdrant uvicorn backend.main:app
+    python -m backend.benchmarks.qdrant_bench --size 10000
+"""
+
+import asyncio
 import logging
-from typing import Dict, List
-from qdrant_client import QdrantClient
-from qdrant_client.models import PointStruct, VectorParams, Distance, models
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import Distance, PointStruct, VectorParams, models
+
+from backend.domain.models import RankingPolicy
 from backend.ports.interfaces import VectorStore
-from backend.config import get_settings
 
 logger = logging.getLogger("jarvis.infra.qdrant")
 
+RANK_FACTOR = 4            # vector candidates prefetched per result when a ranking re-weights them
+
+
+def _type_filter(types: Optional[Sequence[str]]) -> Optional[models.Filter]:
+    if not types:
+        return None
+    return models.Filter(must=[models.FieldCondition(key="_type", match=models.MatchAny(any=list(types)))])
+
+
+def _ranking_formula(policy: RankingPolicy) -> models.FormulaQuery:
+    """$score × status boost × (floor + (1 − floor) · 0.5^(age / half-life)), evaluated by Qdrant."""
+    now = datetime.now(timezone.utc).isoformat()
+    factors: list = ["$score"]
+    boosts = {status: boost for status, boost in policy.status_boosts.items() if boost != 1.0}
+    if boosts:
+        # Conditions evaluate to 1 or 0, so this is 1 + (boost − 1) for the matching status.
+        factors.append(models.SumExpression(sum=[1.0] + [
+            models.MultExpression(mult=[
+                boost - 1.0, models.FieldCondition(key="status", match=models.MatchValue(value=status)),
+            ])
+            for status, boost in boosts.items()
+        ]))
+    if policy.half_life_days:
+        decay = models.ExpDecayExpression(exp_decay=models.DecayParamsExpression(
+            x=models.DatetimeKeyExpression(datetime_key="created_at"),
+            target=models.DatetimeExpression(datetime=now),
+            scale=policy.half_life_days * 86400.0,
+            midpoint=0.5,
+        ))
+        factors.append(models.SumExpression(sum=[
+            policy.decay_floor, models.MultExpression(mult=[1.0 - policy.decay_floor, decay]),
+        ]))
+    # Items without created_at count as new, i.e. are not decayed.
+    return models.FormulaQuery(formula=models.MultExpression(mult=factors), defaults={"created_at": now})
+
 
 class QdrantVectorStore(VectorStore):
-    def __init__(self):
-        settings = get_settings()
-        self._client = QdrantClient(host=settings.qdrant_host, port=settings.qdrant_port)
-        self._collection = settings.qdrant_collection
-        self._dimension = settings.embedding_dimension
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6333,
+        collection: str = "jarvis",
+        dimension: int = 384,
+        batch_size: int = 256,
+        flush_interval_ms: float = 50.0,
+        prefer_grpc: bool = False,
+    ):
+        self._client = AsyncQdrantClient(host=host, port=port, prefer_grpc=prefer_grpc)
+        self._collection = collection
+        self._dimension = dimension
+        self._batch_size = max(batch_size, 1)
+        self._flush_interval = flush_interval_ms / 1000
+        self._pending: Dict[str, PointStruct] = {}        # id → latest buffered point
+        self._flush_lock = asyncio.Lock()
+        self._flush_timer: Optional[asyncio.Task] = None
         logger.info(
             "\n╔══ QDRANT ▸ INIT ═════════════════════════════════════════\n"
-            "║  Host       : %s:%s\n"
+            "║  Host       : %s:%s (%s)\n"
             "║  Collection : %s\n"
             "║  Dimension  : %d\n"
+            "║  Batching   : %d points or %.0fms\n"
             "╚══════════════════════════════════════════════════════════\n",
-            settings.qdrant_host, settings.qdrant_port,
-            self._collection, self._dimension,
+            host, port, "gRPC" if prefer_grpc else "HTTP",
+            collection, dimension, self._batch_size, flush_interval_ms,
         )
-        self._ensure_collection()
 
-    def _ensure_collection(self):
-        names = [c.name for c in self._client.get_collections().collections]
-        if self._collection not in names:
-            self._client.create_collection(
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    def _vector(self, embedding: Sequence[float]) -> List[float]:
+        vec = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        if vec.shape[0] != self._dimension:
+            raise ValueError(
+                f"Embedding dimension {vec.shape[0]} does not match store dimension {self._dimension}"
+            )
+        return vec.tolist()
+
+    # ─── Schema ────────────────────────────────────────────────────
+    async def ensure_schema(self) -> None:
+        """Create the collection and its `_type` payload index if missing. Idempotent."""
+        if not await self._client.collection_exists(self._collection):
+            await self._client.create_collection(
                 collection_name=self._collection,
                 vectors_config=VectorParams(size=self._dimension, distance=Distance.COSINE),
             )
             logger.info("  QDRANT ▸ Collection '%s' CREATED (dim=%d, cosine)", self._collection, self._dimension)
-        else:
-            logger.debug("  QDRANT ▸ Collection '%s' already exists", self._collection)
+        await self._client.create_payload_index(
+            collection_name=self._collection,
+            field_name="_type",
+            field_schema=models.PayloadSchemaType.KEYWORD,
+        )
+        logger.info("  QDRANT ▸ Collection '%s' ready ✓", self._collection)
+
+    async def count(self) -> int:
+        result = await self._client.count(collection_name=self._collection, exact=True)
+        return result.count + len(self._pending)
 
+    # ─── Buffered writes ───────────────────────────────────────────
     async def upsert(self, objective_id: str, embedding: List[float], payload: Dict) -> None:
+        self._pending[objective_id] = PointStruct(id=objective_id, vector=self._vector(embedding), payload=payload)
         logger.info(
-            "\n╔══ QDRANT ▸ UPSERT ═══════════════════════════════════════\n"
-            "║  ID        : %s\n"
-            "║  Vec dim   : %d\n"
-            "║  Payload   : %s\n"
-            "╚══════════════════════════════════════════════════════════\n",
-            objective_id, len(embedding),
-            ", ".join(f"{k}={v}" for k, v in payload.items() if k != "text"),
+            "  QDRANT ▸ UPSERT (buffered) | id=%s | type=%s | pending=%d",
+            objective_id[:12], payload.get("_type"), len(self._pending),
         )
-        self._client.upsert(
+        if len(self._pending) >= self._batch_size:
+            await self.flush()
+        elif self._flush_timer is None or self._flush_timer.done():
+            self._flush_timer = asyncio.create_task(self._flush_later())
+
+    async def upsert_many(self, ids: List[str], embeddings: Sequence[Sequence[float]], payloads: List[Dict]) -> None:
+        if not ids:
+            return
+        for item_id, embedding, payload in zip(ids, embeddings, payloads):
+            self._pending[item_id] = PointStruct(id=item_id, vector=self._vector(embedding), payload=payload)
+        await self.flush()
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._flush_interval)
+        try:
+            await self.flush()
+        except Exception as e:
+            # Points stay buffered; the next write or search retries them.
+            logger.error("  QDRANT ▸ Background flush FAILED (%d points kept): %s", len(self._pending), e)
+
+    async def flush(self) -> int:
+        """Send every buffered point, `batch_size` per request. Returns how many were sent."""
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            points = list(self._pending.values())
+            self._pending = {}
+            sent = 0
+            try:
+                for start in range(0, len(points), self._batch_size):
+                    await self._client.upsert(
+                        collection_name=self._collection,
+                        points=points[start:start + self._batch_size],
+                        wait=True,
+                    )
+                    sent = start + self._batch_size
+            except Exception:
+                # Re-buffer what was not sent, unless a newer write replaced it meanwhile.
+                for point in points[sent:]:
+                    self._pending.setdefault(point.id, point)
+                raise
+        logger.info("  QDRANT ▸ FLUSH | %d points", len(points))
+        return len(points)
+
+    async def delete(self, objective_id: str) -> None:
+        logger.info("  QDRANT ▸ DELETE | ID: %s", objective_id)
+        async with self._flush_lock:
+            self._pending.pop(objective_id, None)
+            await self._client.delete(
+                collection_name=self._collection,
+                points_selector=models.PointIdsList(points=[objective_id]),
+            )
+
+    async def patch_payload(self, item_id: str, fields: Dict) -> bool:
+        buffered = self._pending.get(item_id)
+        if buffered is not None:
+            buffered.payload = {**buffered.payload, **fields}
+            return True
+        found = await self._client.retrieve(self._collection, ids=[item_id], with_payload=["_type"], with_vectors=False)
+        if not found:
+            return False
+        item_type = (found[0].payload or {}).get("_type")
+        if fields.get("_type", item_type) != item_type:
+            raise ValueError(f"patch_payload cannot change _type of {item_id} ({item_type})")
+        logger.info("  QDRANT ▸ SET_PAYLOAD | ID: %s | fields=%s", item_id, ",".join(fields))
+        await self._client.set_payload(
             collection_name=self._collection,
-            points=[PointStruct(id=objective_id, vector=embedding, payload=payload)],
+            payload=fields,
+            points=[item_id],
         )
+        return True
 
-    async def search(self, embedding: List[float], limit: int = 5) -> List[Dict]:
+    # ─── Reads ─────────────────────────────────────────────────────
+    async def search(
+        self,
+        embedding: List[float],
+        limit: int = 5,
+        min_score: Optional[float] = None,
+        types: Optional[List[str]] = None,
+        type_limits: Optional[Dict[str, int]] = None,
+        with_vectors: bool = False,
+        ranking: Optional[RankingPolicy] = None,
+    ) -> List[Dict]:
         logger.info(
             "\n╔══ QDRANT ▸ SEARCH ═══════════════════════════════════════\n"
             "║  Vec dim   : %d\n"
-            "║  Limit     : %d\n"
+            "║  Limit     : %s\n"
+            "║  Min score : %s\n"
+            "║  Types     : %s\n"
             "╚══════════════════════════════════════════════════════════\n",
-            len(embedding), limit,
+            len(embedding), type_limits or limit, min_score, types or "all",
         )
-        # qdrant-client >= 1.17 uses query_points instead of search
-        response = self._client.query_points(
-            collection_name=self._collection,
-            query=embedding,
+        vector = self._vector(embedding)
+        formula = _ranking_formula(ranking) if ranking is not None and not ranking.neutral else None
+        if type_limits is not None:
+            # One filtered request per type, sent together and merged by score.
+            requests = [
+                self._request(vector, type_limits.get(item_type, limit), min_score, [item_type], with_vectors, formula)
+                for item_type in (types or list(type_limits))
+                if type_limits.get(item_type, limit) > 0
+            ]
+            merged = [hit for hits in await self._query_batch(requests) for hit in hits]
+            merged.sort(key=lambda r: r["score"], reverse=True)
+            return merged
+        return (await self._query_batch([self._request(vector, limit, min_score, types, with_vectors, formula)]))[0]
+
+    async def search_many(
+        self,
+        embeddings: Sequence[Sequence[float]],
+        limits: Sequence[Union[int, Dict[str, int]]],
+        min_score: Optional[float] = None,
+        types: Optional[Sequence[Optional[List[str]]]] = None,
+        union: bool = False,
+        with_vectors: bool = False,
+        ranking: Optional[RankingPolicy] = None,
+    ) -> Union[List[List[Dict]], List[Dict]]:
+        # Every query — and every per-type part of one — goes out in a single request.
+        formula = _ranking_formula(ranking) if ranking is not None and not ranking.neutral else None
+        requests, owners = [], []
+        for i, (embedding, limit) in enumerate(zip(embeddings, limits)):
+            vector = self._vector(embedding)
+            query_types = types[i] if types is not None else None
+            if isinstance(limit, dict):
+                for item_type in (query_types or list(limit)):
+                    if limit.get(item_type, 0) > 0:
+                        requests.append(
+                            self._request(vector, limit[item_type], min_score, [item_type], with_vectors, formula)
+                        )
+                        owners.append(i)
+            else:
+                requests.append(self._request(vector, limit, min_score, query_types, with_vectors, formula))
+                owners.append(i)
+        results: List[List[Dict]] = [[] for _ in limits]
+        for owner, hits in zip(owners, await self._query_batch(requests)):
+            results[owner].extend(hits)
+        for hits in results:
+            hits.sort(key=lambda r: r["score"], reverse=True)
+        logger.info("  QDRANT ▸ SEARCH_MANY | queries=%d requests=%d", len(limits), len(requests))
+        return self.merge_hits(results) if union else results
+
+    @staticmethod
+    def _request(
+        vector: List[float], limit: int, min_score: Optional[float], types: Optional[Sequence[str]],
+        with_vectors: bool = False,
+        formula: Optional[models.FormulaQuery] = None,
+    ) -> models.QueryRequest:
+        if formula is not None:
+            # Nearest neighbours first, then the formula re-weights and cuts them.
+            return models.QueryRequest(
+                prefetch=models.Prefetch(query=vector, limit=limit * RANK_FACTOR, filter=_type_filter(types)),
+                query=formula,
+                limit=limit,
+                score_threshold=min_score,
+                with_payload=True,
+                with_vector=with_vectors,
+            )
+        return models.QueryRequest(
+            query=vector,
             limit=limit,
+            score_threshold=min_score,
+            filter=_type_filter(types),
+            with_payload=True,
+            with_vector=with_vectors,
         )
-        results = response.points
-        logger.info("  QDRANT ▸ SEARCH returned %d results", len(results))
-        for i, r in enumerate(results):
-            logger.debug("    [%d] id=%s  score=%.4f", i, r.id, r.score)
-        return [{"id": r.id, "score": r.score, "payload": r.payload} for r in results]
 
-    async def delete(self, objective_id: str) -> None:
-        logger.info("  QDRANT ▸ DELETE | ID: %s", objective_id)
-        self._client.delete(
-            collection_name=self._collection,
-            points_selector=models.PointIdsList(points=[objective_id]),
-        )
+    async def _query_batch(self, requests: List[models.QueryRequest]) -> List[List[Dict]]:
+        if not requests:
+            return []
+        if self._pending:
+            await self.flush()   # read-your-writes
+        responses = await self._client.query_batch_points(collection_name=self._collection, requests=requests)
+        results = [[self._hit(p) for p in response.points] for response in responses]
+        logger.info("  QDRANT ▸ SEARCH returned %s results", [len(r) for r in results])
+        return results
+
+    @staticmethod
+    def _hit(point) -> Dict:
+        hit = {"id": str(point.id), "score": point.score, "payload": point.payload}
+        if point.vector is not None:
+            hit["vector"] = np.asarray(point.vector, dtype=np.float32)
+        return hit
+
+    async def close(self) -> None:
+        """Flush buffered points and close the client's connections."""
+        if self._flush_timer is not None and not self._flush_timer.done():
+            self._flush_timer.cancel()
+        try:
+            await self.flush()
+        finally:
+            await self._client.close()
+        logger.info("  QDRANT ▸ Client closed ✓")
@@ -0,0 +1,222 @@
+"""
+On-disk snapshot format for the in-memory vector index.
+
+A snapshot directory holds one generation subdirectory per save and a
+CURRENT file naming the live one:
+
+    <dir>/CURRENT                     JSON manifest (version, dimension, segments)
+    <dir>/gen-<ns>/seg<i>.npy         (rows, dim) float32 or quantized codes — memory-mapped on load
+    <dir>/gen-<ns>/seg<i>.ids         one id per row, empty line for a free row
+    <dir>/gen-<ns>/seg<i>.jsonl       one JSON payload per row
+    <dir>/gen-<ns>/seg<i>.offsets.npy int64 byte offset of each payload line, plus EOF
+    <dir>/gen-<ns>/<name>.array.npy   extra named arrays (e.g. ANN structures), listed in the manifest
+
+CURRENT is replaced atomically after a generation is fully written and
+fsynced, so a crash mid-save leaves the previous snapshot intact. Saves
+into one directory must not overlap (the store serialises them); each
+removes only the generations older than its own. Payloads decode lazily,
+row by row, so a restore costs a memory map plus the id table.
+"""
+
+import json
+import logging
+import mmap
+import os
+import shutil
+import time
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger("jarvis.infra.snapshot")
+
+SNAPSHOT_VERSION = 1
+MANIFEST = "CURRENT"
+
+_UNLOADED = object()
+
+
+def _encode(value: Dict) -> bytes:
+    return json.dumps(value, default=str, separators=(",", ":")).encode()
+
+
+class PayloadTable:
+    """List-like row → payload table holding each payload as compact JSON bytes.
+
+    A bytes object costs a fraction of the equivalent dict of str objects, so
+    rows are encoded on write and decoded on read — a search decodes only the
+    rows it returns, and every read hands out a fresh dict. Snapshot rows are
+    not copied at all: they are sliced out of the memory-mapped blob on access.
+    """
+
+    def __init__(
+        self,
+        rows: Optional[list] = None,
+        blob: Optional[mmap.mmap] = None,
+        offsets: Optional[np.ndarray] = None,
+    ):
+        self._rows = rows if rows is not None else []
+        self._blob = blob
+        self._offsets = offsets
+
+    @classmethod
+    def from_snapshot(cls, blob: mmap.mmap, offsets: np.ndarray) -> "PayloadTable":
+        return cls([_UNLOADED] * (len(offsets) - 1), blob, offsets)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, row: int) -> Optional[Dict]:
+        value = self._rows[row]
+        if value is None:
+            return None
+        return json.loads(self.encoded(row))
+
+    def __setitem__(self, row: int, value: Optional[Dict]) -> None:
+        self._rows[row] = None if value is None else _encode(value)
+
+    def append(self, value: Optional[Dict]) -> None:
+        self._rows.append(None if value is None else _encode(value))
+
+    def copy(self) -> "PayloadTable":
+        """Shallow copy — rows are immutable bytes, so this is a stable view."""
+        return PayloadTable(list(self._rows), self._blob, self._offsets)
+
+    def encoded(self, row: int) -> bytes:
+        """JSON bytes for a row, copied straight from the snapshot when never rewritten."""
+        value = self._rows[row]
+        if value is _UNLOADED:
+            return bytes(self._blob[self._offsets[row]:self._offsets[row + 1] - 1])
+        return value if value is not None else b"null"
+
+
+def _fsync(f) -> None:
+    f.flush()
+    os.fsync(f.fileno())
+
+
+def _save_array(path: str, array: np.ndarray) -> None:
+    with open(path, "wb") as f:
+        np.save(f, array)
+        _fsync(f)
+
+
+def _generation_ns(name: str) -> int:
+    try:
+        return int(name[len("gen-"):])
+    except ValueError:
+        return -1
+
+
+# (item_type, vectors, row → id, row → payload)
+SegmentState = Tuple[str, np.ndarray, List[Optional[str]], PayloadTable]
+
+
+def write_snapshot(
+    directory: str,
+    dimension: int,
+    segments: List[SegmentState],
+    extra: Optional[Dict] = None,
+    arrays: Optional[Dict[str, np.ndarray]] = None,
+) -> str:
+    """Write a new snapshot generation and make it current. Returns the generation name."""
+    os.makedirs(directory, exist_ok=True)
+    generation = f"gen-{time.time_ns()}"
+    gen_dir = os.path.join(directory, generation)
+    os.makedirs(gen_dir)
+
+    manifest_segments = []
+    total = 0
+    for i, (item_type, vectors, ids, payloads) in enumerate(segments):
+        prefix = os.path.join(gen_dir, f"seg{i}")
+        _save_array(f"{prefix}.npy", np.ascontiguousarray(vectors))
+
+        with open(f"{prefix}.ids", "w", encoding="utf-8") as f:
+            f.write("\n".join(item_id or "" for item_id in ids))
+            _fsync(f)
+
+        offsets = np.zeros(len(ids) + 1, dtype=np.int64)
+        with open(f"{prefix}.jsonl", "wb") as f:
+            position = 0
+            for row in range(len(ids)):
+                line = payloads.encoded(row) if ids[row] else b"null"
+                f.write(line)
+                f.write(b"\n")
+                offsets[row] = position
+                position += len(line) + 1
+            offsets[len(ids)] = position
+            _fsync(f)
+        _save_array(f"{prefix}.offsets.npy", offsets)
+
+        live = sum(1 for item_id in ids if item_id)
+        total += live
+        manifest_segments.append({"type": item_type, "file": f"seg{i}", "rows": len(ids), "live": live})
+
+    for name, array in (arrays or {}).items():
+        _save_array(os.path.join(gen_dir, f"{name}.array.npy"), array)
+
+    manifest = {
+        "version": SNAPSHOT_VERSION,
+        "generation": generation,
+        "dimension": dimension,
+        "count": total,
+        "segments": manifest_segments,
+        "arrays": sorted(arrays or {}),
+        **(extra or {}),
+    }
+    tmp_path = os.path.join(directory, f"{MANIFEST}.{generation}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+        _fsync(f)
+    os.replace(tmp_path, os.path.join(directory, MANIFEST))
+    dir_fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)   # make the rename itself durable
+    finally:
+        os.close(dir_fd)
+
+    # Older generations may still be memory-mapped by this process; unlinking
+    # them is safe on POSIX, the mapping keeps the inode alive. Newer ones
+    # belong to a later save and are never touched.
+    written = _generation_ns(generation)
+    for name in os.listdir(directory):
+        if name.startswith("gen-") and 0 <= _generation_ns(name) < written:
+            shutil.rmtree(os.path.join(directory, name), ignore_errors=True)
+
+    return generation
+
+
+def read_snapshot(directory: str) -> Optional[Tuple[Dict, List[SegmentState]]]:
+    """
+    Memory-map the current generation. Returns None when no snapshot exists.
+    The returned manifest's "arrays" maps each extra array name to its data.
+    """
+    manifest_path = os.path.join(directory, MANIFEST)
+    if not os.path.exists(manifest_path):
+        return None
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported vector snapshot version {manifest.get('version')}")
+
+    gen_dir = os.path.join(directory, manifest["generation"])
+    segments: List[SegmentState] = []
+    for seg in manifest["segments"]:
+        prefix = os.path.join(gen_dir, seg["file"])
+        # Copy-on-write: rows written after restore never touch the file.
+        vectors = np.load(f"{prefix}.npy", mmap_mode="c")
+
+        with open(f"{prefix}.ids", "r", encoding="utf-8") as f:
+            ids: List[Optional[str]] = f.read().split("\n")
+        if seg["live"] < seg["rows"]:
+            ids = [item_id or None for item_id in ids]
+
+        offsets = np.load(f"{prefix}.offsets.npy")
+        with open(f"{prefix}.jsonl", "rb") as f:
+            blob = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        segments.append((seg["type"], vectors, ids, PayloadTable.from_snapshot(blob, offsets)))
+
+    manifest["arrays"] = {
+        name: np.load(os.path.join(gen_dir, f"{name}.array.npy"), mmap_mode="c")
+        for name in manifest.get("arrays", [])
+    }
+    return manifest, segments
@@ -2,82 +2,860 @@
 In-memory vector store using numpy cosine similarity.
 Replaces Qdrant — simpler, faster, zero external dependencies.
 Implements the VectorStore port (DIP / Liskov).
+
+Vectors are partitioned by payload `_type` into segments. Each segment is
+one contiguous, preallocated float32 matrix that grows by doubling, with a
+row → id table and tombstones for deleted rows. A search is a matmul over
+the live prefix of each selected segment's buffer — no per-query copy of
+the corpus, and a type-filtered query never scores rows of other types.
+
+Reads are lock-free. Rows are append-only — an update appends a new row
+and tombstones the old one — so a writer can publish a new generation of
+segment views (shared arrays, frozen size and tombstones) after every
+change, while searches keep scanning whichever generation they started
+on. Writers serialise on a lock; segments are compacted once a quarter
+of their rows are dead.
+
+The index can be saved to and memory-mapped back from a snapshot directory
+(see vector_snapshot.py), so a restart does not need to re-embed anything.
+A snapshot records when it was taken (`snapshot_taken_at`), so that writes
+made after it — lost if the process then died — can be replayed from
+Postgres.
+
+Segments can optionally store vectors quantized — float16, or int8 with a
+per-vector scale — to cut index memory 2× / 4×. Quantized scores are within
+~0.002 of exact. With `rerank`, float32 originals are kept alongside the
+codes and the top candidates are rescored exactly; after a snapshot restore
+those originals stay memory-mapped, so only candidate rows are paged in.
+
+Next to the vectors, each segment keeps two compact columns per row —
+`created_at` as float32 days since the epoch and `status` as an int8 code —
+so a RankingPolicy's recency decay and status boosts are applied to the
+score array before top-k selection, in the same vectorised pass.
 """
 
+import copy
+import itertools
+import json
 import logging
 import threading
+import time
 import numpy as np
-from typing import Dict, List
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple, Union
 
+from backend.domain.models import RankingPolicy
 from backend.ports.interfaces import VectorStore
+from backend.infrastructure.vector_snapshot import PayloadTable, read_snapshot, write_snapshot
 
 logger = logging.getLogger("jarvis.infra.vectorstore")
 
+DEFAULT_DIMENSION = 384
+DEFAULT_CAPACITY = 1024
+UNTYPED = "unknown"
+
+QUANTIZATION_DTYPES = {"none": np.float32, "float16": np.float16, "int8": np.int8}
+RERANK_FACTOR = 4          # shortlist size per result when re-ranking quantized scores
+_SCAN_CHUNK = 1024         # rows dequantized per step: keeps the float32 scratch in cache
+_GEMM_MIN_QUERIES = 4      # below this, per-query GEMVs beat one skinny GEMM (OpenBLAS)
+_COMPACT_MIN_DEAD = 1024   # tombstones a segment tolerates before compaction is considered…
+_COMPACT_RATIO = 0.25      # …and the dead fraction of its rows that triggers it
+_MAX_STATUSES = 128        # distinct status codes an int8 column can hold
+_SECONDS_PER_DAY = 86400.0
+
+
+def _quantize_int8(vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-vector symmetric int8 codes and scales, so that vector ≈ codes * scale."""
+    scales = np.abs(vectors).max(axis=-1) / 127.0
+    scales = np.where(scales > 0, scales, 1.0).astype(np.float32)
+    codes = np.rint(vectors / scales[..., None]).astype(np.int8)
+    return codes, scales
+
+
+def _epoch_days(value) -> float:
+    """Days since the Unix epoch of a payload `created_at` (naive = UTC); NaN when missing or unparseable."""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return float("nan")
+    if not isinstance(value, datetime):
+        return float("nan")
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp() / _SECONDS_PER_DAY
+
+
+class _StatusCodes:
+    """Payload `status` → int8 code for the segment columns. Code 0 is "no status"; codes are only appended."""
+
+    def __init__(self, names: Sequence[str] = ("",)):
+        self.names: List[str] = list(names)
+        self._codes = {name: code for code, name in enumerate(self.names)}
+
+    def code(self, status) -> int:
+        """Code of a status, assigning the next one on first sight. Caller must hold the store lock."""
+        if not status:
+            return 0
+        status = str(status)
+        code = self._codes.get(status)
+        if code is None:
+            if len(self.names) == _MAX_STATUSES:
+                logger.warning("  VECTOR ▸ STATUS | more than %d statuses, %r is not boosted", _MAX_STATUSES - 1, status)
+                return 0
+            code = self._codes[status] = len(self.names)
+            self.names.append(status)
+        return code
+
+    def boosts(self, status_boosts: Dict[str, float]) -> np.ndarray:
+        """Boost per code, covering codes assigned after this call as 1.0."""
+        table = np.ones(_MAX_STATUSES, dtype=np.float32)
+        for code, name in enumerate(list(self.names)):
+            table[code] = status_boosts.get(name, 1.0)
+        table[0] = 1.0
+        return table
+
+
+class _Ranking(NamedTuple):
+    """A RankingPolicy resolved for one search: reference time and per-code boosts."""
+    now: float                  # days since the epoch
+    half_life: Optional[float]  # days; None = no decay
+    floor: float
+    boosts: np.ndarray          # status code → multiplier
+
+
+def _select_top_k(scores: np.ndarray, limit: int, min_score: Optional[float]) -> np.ndarray:
+    """
+    Indices of the best `limit` scores, best first, after a vectorised cutoff.
+    With no `min_score`, non-positive similarities are dropped (the store's
+    historical behaviour); otherwise scores below `min_score` are.
+    Uses argpartition, so only the surviving top-k are fully sorted.
+    """
+    if limit <= 0:
+        return np.empty(0, dtype=np.intp)
+    if min_score is None:
+        candidates = np.flatnonzero(scores > 0)
+    else:
+        candidates = np.flatnonzero(scores >= min_score)
+    if candidates.size > limit:
+        part = np.argpartition(scores[candidates], -limit)[-limit:]
+        candidates = candidates[part]
+    return candidates[np.argsort(scores[candidates])[::-1]]
+
+
+class _Segment:
+    """
+    Growable matrix holding every vector of one payload type — float32, or
+    quantized codes (plus per-row int8 scales and, with re-rank, float32
+    originals in `exact`).
+
+    Rows below `size` are never written again: an update or delete
+    tombstones its row (`dead`) and an update appends a fresh one. That is
+    what lets view() hand readers a consistent, lock-free copy — growth and
+    compaction build new arrays and leave the old ones to the views that
+    still hold them.
+    """
+
+    def __init__(self, dimension: int, capacity: int, quantization: str = "none", rerank: bool = False):
+        capacity = max(capacity, 1)
+        self.quantization = quantization
+        self.matrix = np.zeros((capacity, dimension), dtype=QUANTIZATION_DTYPES[quantization])
+        self.scales = np.ones(capacity, dtype=np.float32) if quantization == "int8" else None
+        self.exact = (
+            np.zeros((capacity, dimension), dtype=np.float32)
+            if rerank and quantization != "none" else None
+        )
+        self.created = np.full(capacity, np.nan, dtype=np.float32)   # row → created_at, epoch days
+        self.status = np.zeros(capacity, dtype=np.int8)               # row → status code
+        self.size = 0                              # high-water mark of used rows
+        self.ids: List[Optional[str]] = []         # row → id (kept for dead rows until compaction)
+        self.payloads = PayloadTable()             # row → payload
+        self.dead: List[int] = []                  # tombstoned rows; an array in views
+        self.epoch = object()                      # row numbering; changes on compaction
+        self._dead_array = np.empty(0, dtype=np.intp)
+
+    @classmethod
+    def from_snapshot(
+        cls,
+        matrix: np.ndarray,
+        ids: List[Optional[str]],
+        payloads: PayloadTable,
+        scales: Optional[np.ndarray] = None,
+        exact: Optional[np.ndarray] = None,
+        created: Optional[np.ndarray] = None,
+        status: Optional[np.ndarray] = None,
+    ) -> "_Segment":
+        """Segment over restored arrays. Missing ranking columns must be filled with index_columns()."""
+        seg = cls.__new__(cls)
+        seg.quantization = next(q for q, dtype in QUANTIZATION_DTYPES.items() if matrix.dtype == dtype)
+        seg.matrix = matrix
+        seg.scales = scales
+        seg.exact = exact
+        seg.created = created if created is not None else np.full(len(ids), np.nan, dtype=np.float32)
+        seg.status = status if status is not None else np.zeros(len(ids), dtype=np.int8)
+        seg.size = len(ids)
+        seg.ids = ids
+        seg.payloads = payloads
+        seg.dead = [row for row, item_id in enumerate(ids) if item_id is None] if None in ids else []
+        seg.epoch = object()
+        seg._dead_array = np.empty(0, dtype=np.intp)
+        return seg
+
+    def converted(self, quantization: str, rerank: bool) -> "_Segment":
+        """Re-encode into another storage mode (snapshot taken under different settings)."""
+        seg = _Segment(self.matrix.shape[1], self.size, quantization, rerank)
+        seg.ids, seg.payloads, seg.dead, seg.size = self.ids, self.payloads, self.dead, self.size
+        seg.created[:self.size] = self.created[:self.size]
+        seg.status[:self.size] = self.status[:self.size]
+        for start in range(0, self.size, 65536):
+            rows = np.arange(start, min(start + 65536, self.size))
+            seg.set_rows(rows, self.exact[rows] if self.exact is not None else self.vectors(rows))
+        return seg
+
+    def compacted(self) -> Tuple["_Segment", np.ndarray]:
+        """A copy without the dead rows, plus the old row of each new row."""
+        live = self.live_rows()
+        seg = _Segment(self.matrix.shape[1], max(live.size + live.size // 4, 16), self.quantization, self.exact is not None)
+        seg.size = live.size
+        for start in range(0, live.size, 65536):
+            rows = live[start:start + 65536]
+            seg.matrix[start:start + rows.size] = self.matrix[rows]
+            if seg.scales is not None:
+                seg.scales[start:start + rows.size] = self.scales[rows]
+            if seg.exact is not None:
+                seg.exact[start:start + rows.size] = self.exact[rows]
+        seg.created[:live.size] = self.created[live]
+        seg.status[:live.size] = self.status[live]
+        live_list = live.tolist()
+        seg.ids = [self.ids[row] for row in live_list]
+        seg.payloads = PayloadTable([self.payloads.encoded(row) for row in live_list])
+        return seg, live
+
+    def view(self) -> "_Segment":
+        """Read-only copy for a published generation: shares every array, freezes size and dead rows."""
+        if self._dead_array.size != len(self.dead):   # `dead` only grows until compaction
+            self._dead_array = np.array(self.dead, dtype=np.intp)
+        view = copy.copy(self)
+        view.dead = self._dead_array
+        return view
+
+    def __len__(self) -> int:
+        return self.size - len(self.dead)
+
+    def live_rows(self) -> np.ndarray:
+        if not len(self.dead):
+            return np.arange(self.size)
+        return np.setdiff1d(np.arange(self.size), self.dead, assume_unique=True)
+
+    def allocate(self, item_id: str) -> int:
+        if self.size == self.matrix.shape[0]:
+            self._grow()
+        row = self.size
+        self.size += 1
+        self.ids.append(item_id)
+        self.payloads.append(None)
+        return row
+
+    def set_rows(self, rows, vectors: np.ndarray) -> None:
+        """Store normalised float32 vectors at freshly allocated `rows`, quantizing as configured."""
+        if self.quantization == "int8":
+            self.matrix[rows], self.scales[rows] = _quantize_int8(vectors)
+        else:
+            self.matrix[rows] = vectors
+        if self.exact is not None:
+            self.exact[rows] = vectors
+
+    def set_columns(self, row: int, payload: Dict, statuses: _StatusCodes) -> None:
+        """Fill a row's ranking columns from its payload."""
+        if "created_at" in payload:
+            self.created[row] = _epoch_days(payload["created_at"])
+        if "status" in payload:
+            self.status[row] = statuses.code(payload["status"])
+
+    def index_columns(self, statuses: _StatusCodes) -> None:
+        """Rebuild the ranking columns from the payloads (snapshots written before they existed)."""
+        for row in range(self.size):
+            payload = self.payloads[row]
+            if payload is not None:
+                self.set_columns(row, payload, statuses)
+
+    def weights(self, ranking: _Ranking, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """RankingPolicy multiplier of `rows` (every row of the view when None)."""
+        selected = slice(0, self.size) if rows is None else rows
+        weights = ranking.boosts[self.status[selected]]
+        if ranking.half_life:
+            age = np.fmax(ranking.now - self.created[selected], 0.0)   # fmax: no created_at (NaN) → age 0
+            weights = weights * (ranking.floor + (1.0 - ranking.floor) * np.exp2(-age / ranking.half_life))
+        return weights
+
+    def release(self, row: int) -> None:
+        # Tombstone only: views published before this may still return the
+        # row, so its vector, id and payload stay until compaction.
+        self.dead.append(row)
+
+    def vectors(self, rows) -> np.ndarray:
+        """Float32 (dequantized) vectors at `rows`."""
+        vectors = self.matrix[rows].astype(np.float32, copy=False)
+        if self.scales is not None:
+            vectors = vectors * self.scales[rows, None]
+        return vectors
+
+    def scores(self, query: np.ndarray) -> np.ndarray:
+        return self.scores_many(query[None, :])[0]
+
+    def scores_many(self, queries: np.ndarray) -> np.ndarray:
+        """(n_queries, size) scores, reading the matrix from memory once for all queries."""
+        # Vectors are pre-normalised, so this is cosine similarity over a
+        # view of the live prefix of the buffer.
+        n_queries = queries.shape[0]
+        if self.quantization == "none" and n_queries == 1:
+            scores = (self.matrix[:self.size] @ queries[0])[None, :]
+        elif self.quantization == "none" and n_queries >= _GEMM_MIN_QUERIES:
+            scores = queries @ self.matrix[:self.size].T
+        else:
+            # Block by block: each block is dequantized (no BLAS for
+            # int8/float16) and pulled into cache once, then scored against
+            # every query.
+            scores = np.empty((n_queries, self.size), dtype=np.float32)
+            for start in range(0, self.size, _SCAN_CHUNK):
+                block = self.matrix[start:min(start + _SCAN_CHUNK, self.size)]
+                if self.quantization != "none":
+                    block = block.astype(np.float32)
+                end = start + block.shape[0]
+                if n_queries >= _GEMM_MIN_QUERIES:
+                    scores[:, start:end] = queries @ block.T
+                else:
+                    for i, query in enumerate(queries):
+                        scores[i, start:end] = block @ query
+            if self.scales is not None:
+                scores *= self.scales[:self.size]
+        if len(self.dead):
+            scores[:, self.dead] = -np.inf
+        return scores
+
+    def score_rows(self, rows: np.ndarray, query: np.ndarray) -> np.ndarray:
+        """Scores of selected rows only (used by the IVF index)."""
+        return self.vectors(rows) @ query
+
+    def score_rows_many(self, rows: np.ndarray, queries: np.ndarray) -> np.ndarray:
+        """(n_queries, len(rows)) scores of selected rows."""
+        return queries @ self.vectors(rows).T
+
+    def top_k(
+        self, query: np.ndarray, scores: np.ndarray, rows: Optional[np.ndarray],
+        limit: int, min_score: Optional[float], ranking: Optional[_Ranking] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (rows, scores) of the best `limit` matches, best first. `scores` covers
+        `rows`, or every row when `rows` is None. With a ranking, scores are
+        weighted before anything is selected. With float32 originals, a
+        RERANK_FACTOR× shortlist is rescored exactly before the cutoff.
+        """
+        if ranking is not None:
+            scores = scores * self.weights(ranking, rows)
+        if self.exact is None:
+            best = _select_top_k(scores, limit, min_score)
+            return (best if rows is None else rows[best]), scores[best]
+        shortlist = _select_top_k(scores, max(limit * RERANK_FACTOR, limit + 16), -2.0)
+        candidates = shortlist if rows is None else rows[shortlist]
+        exact = self.exact[candidates] @ query
+        if ranking is not None:
+            exact *= self.weights(ranking, candidates)
+        best = _select_top_k(exact, limit, min_score)
+        return candidates[best], exact[best]
+
+    def _grow(self) -> None:
+        old_capacity = self.matrix.shape[0]
+        self.matrix = self._grown(self.matrix, 0)
+        if self.scales is not None:
+            self.scales = self._grown(self.scales, 1)
+        if self.exact is not None:
+            self.exact = self._grown(self.exact, 0)
+        self.created = self._grown(self.created, np.nan)
+        self.status = self._grown(self.status, 0)
+        logger.info("  VECTOR ▸ GROW | capacity %d → %d", old_capacity, old_capacity * 2)
+
+    def _grown(self, array: np.ndarray, fill) -> np.ndarray:
+        grown = np.full((array.shape[0] * 2,) + array.shape[1:], fill, dtype=array.dtype)
+        grown[:self.size] = array[:self.size]
+        return grown
+
+
+class _Generation(NamedTuple):
+    """What readers see: immutable segment views as of one version."""
+    version: int
+    segments: Dict[str, _Segment]
+
 
 class InMemoryVectorStore(VectorStore):
     """Thread-safe, in-memory vector store with numpy cosine similarity."""
 
-    def __init__(self):
-        self._vectors: Dict[str, np.ndarray] = {}
-        self._payloads: Dict[str, Dict] = {}
+    def __init__(
+        self,
+        dimension: int = DEFAULT_DIMENSION,
+        initial_capacity: int = DEFAULT_CAPACITY,
+        quantization: str = "none",
+        rerank: bool = False,
+    ):
+        if quantization not in QUANTIZATION_DTYPES:
+            raise ValueError(f"Unknown vector quantization {quantization!r}")
+        self._dimension = dimension
+        self._initial_capacity = initial_capacity
+        self._quantization = quantization
+        self._rerank = rerank and quantization != "none"
+        self._segments: Dict[str, _Segment] = {}         # _type → segment
+        self._statuses = _StatusCodes()                   # payload status → int8 column code
+        # id → (_type, row); None until first needed after a snapshot restore.
+        self._locations: Optional[Dict[str, Tuple[str, int]]] = {}
+        # Writers serialise on the lock and publish a new generation after
+        # each change; readers take the current generation and never lock.
         self._lock = threading.Lock()
+        self._version = 0            # bumped on every mutation
+        self._saved_version = 0      # version captured by the last snapshot
+        # Held for a whole save, copy and write: concurrent saves would delete
+        # each other's files. Never taken while holding _lock.
+        self._save_lock = threading.Lock()
+        self._snapshot_taken_at: Optional[datetime] = None   # of the restored snapshot
+        self._generation = _Generation(0, {})
         logger.info(
             "\n╔══ VECTOR STORE ▸ INIT ═══════════════════════════════════\n"
-            "║  Type : In-Memory (numpy cosine similarity)\n"
+            "║  Type     : In-Memory (numpy cosine similarity)\n"
+            "║  Layout   : per-type segments, dim=%d, storage=%s%s\n"
             "║  Fast, zero-config, no external service needed\n"
-            "╚══════════════════════════════════════════════════════════\n"
+            "╚══════════════════════════════════════════════════════════\n",
+            dimension, QUANTIZATION_DTYPES[quantization].__name__, " + float32 re-rank" if self._rerank else "",
         )
 
-    async def upsert(self, item_id: str, embedding: List[float], payload: Dict) -> None:
-        vec = np.array(embedding, dtype=np.float32)
+    def __len__(self) -> int:
+        return sum(len(seg) for seg in self._generation.segments.values())
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    def type_counts(self) -> Dict[str, int]:
+        return {item_type: len(seg) for item_type, seg in self._generation.segments.items()}
+
+    @property
+    def snapshot_taken_at(self) -> Optional[datetime]:
+        """When the restored snapshot was taken; None if none was restored or it predates the field."""
+        return self._snapshot_taken_at
+
+    def ids(self) -> Set[str]:
+        """Every indexed id. Blocking after a restore (builds the id map) — run it off the event loop."""
+        with self._lock:
+            return set(self._id_map())
+
+    def _normalise(self, embedding: List[float]) -> np.ndarray:
+        vec = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        if vec.shape[0] != self._dimension:
+            raise ValueError(
+                f"Embedding dimension {vec.shape[0]} does not match store dimension {self._dimension}"
+            )
         norm = np.linalg.norm(vec)
         if norm > 0:
             vec = vec / norm
+        return vec
+
+    def _id_map(self) -> Dict[str, Tuple[str, int]]:
+        """The id → (_type, row) map, rebuilt lazily after a restore. Caller must hold the lock."""
+        if self._locations is None:
+            start = time.perf_counter()
+            locations: Dict[str, Tuple[str, int]] = {}
+            for item_type, seg in self._segments.items():
+                locations.update(zip(seg.ids, zip(itertools.repeat(item_type), range(seg.size))))
+            locations.pop(None, None)
+            self._locations = locations
+            logger.info(
+                "  VECTOR ▸ ID MAP | built for %d vectors in %.3fs",
+                len(locations), time.perf_counter() - start,
+            )
+        return self._locations
+
+    def _segment(self, item_type: str) -> _Segment:
+        """Segment for a type, created on first use. Caller must hold the lock."""
+        seg = self._segments.get(item_type)
+        if seg is None:
+            seg = _Segment(self._dimension, self._initial_capacity, self._quantization, self._rerank)
+            self._segments[item_type] = seg
+            logger.info("  VECTOR ▸ SEGMENT | created for type=%s", item_type)
+        return seg
+
+    def _put(self, item_id: str, vec: np.ndarray, payload: Dict) -> None:
+        """Write one normalised vector into its type segment. Caller must hold the lock."""
+        item_type = payload.get("_type", UNTYPED)
+        locations = self._id_map()
+        location = locations.get(item_id)
+        if location is not None:
+            # Published rows are immutable (and the type may have changed):
+            # retire the old row and append a new one.
+            self._release(*location)
+        seg = self._segment(item_type)
+        row = seg.allocate(item_id)
+        locations[item_id] = (item_type, row)
+        seg.set_rows(row, vec)
+        seg.set_columns(row, payload, self._statuses)
+        seg.payloads[row] = payload
+
+    def _release(self, item_type: str, row: int) -> None:
+        """Tombstone a row of a segment. Caller must hold the lock."""
+        self._segments[item_type].release(row)
+
+    def _publish(self) -> None:
+        """Compact where due, then make the current state visible to readers. Caller must hold the lock."""
+        for item_type, seg in list(self._segments.items()):
+            if len(seg.dead) >= max(_COMPACT_MIN_DEAD, seg.size * _COMPACT_RATIO):
+                self._compact(item_type)
+        self._version += 1
+        self._generation = _Generation(
+            self._version, {item_type: seg.view() for item_type, seg in self._segments.items()},
+        )
+
+    def _compact(self, item_type: str) -> None:
+        """Rebuild a segment without its dead rows. Caller must hold the lock."""
+        start = time.perf_counter()
+        old = self._segments[item_type]
+        seg, live = old.compacted()
+        locations = self._id_map()
+        for row, item_id in enumerate(seg.ids):
+            locations[item_id] = (item_type, row)
+        self._segments[item_type] = seg
+        self._compacted(item_type, live)
+        logger.info(
+            "  VECTOR ▸ COMPACT | type=%s | %d → %d rows in %.3fs",
+            item_type, old.size, seg.size, time.perf_counter() - start,
+        )
+
+    def _compacted(self, item_type: str, live: np.ndarray) -> None:
+        """Hook after a compaction; `live[new_row]` is the row's old number. Caller must hold the lock."""
+
+    async def upsert(self, item_id: str, embedding: List[float], payload: Dict) -> None:
+        vec = self._normalise(embedding)
+        item_type = payload.get("_type", UNTYPED)
 
         with self._lock:
-            self._vectors[item_id] = vec
-            self._payloads[item_id] = payload
+            self._put(item_id, vec, payload)
+            self._publish()
 
         logger.info(
             "  VECTOR ▸ UPSERT | id=%s | dim=%d | type=%s",
-            item_id[:12], len(embedding), payload.get("_type", "?"),
+            item_id[:12], len(embedding), item_type,
         )
 
-    async def search(self, embedding: List[float], limit: int = 5) -> List[Dict]:
-        query = np.array(embedding, dtype=np.float32)
-        norm = np.linalg.norm(query)
-        if norm > 0:
-            query = query / norm
+    async def upsert_many(self, ids: List[str], embeddings: Sequence[Sequence[float]], payloads: List[Dict]) -> None:
+        if not ids:
+            return
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        if matrix.ndim != 2 or matrix.shape[1] != self._dimension:
+            raise ValueError(
+                f"Embedding batch shape {matrix.shape} does not match store dimension {self._dimension}"
+            )
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix = matrix / np.where(norms > 0, norms, 1.0)
 
         with self._lock:
-            if not self._vectors:
-                logger.info("  VECTOR ▸ SEARCH | store empty, returning []")
-                return []
+            for item_id, vec, payload in zip(ids, matrix, payloads):
+                self._put(item_id, vec, payload)
+            self._publish()
 
-            ids = list(self._vectors.keys())
-            matrix = np.stack([self._vectors[i] for i in ids])
+        logger.info("  VECTOR ▸ UPSERT_MANY | %d vectors | dim=%d", len(ids), self._dimension)
 
-        # Cosine similarity (vectors are pre-normalised)
-        scores = matrix @ query
-        top_k = min(limit, len(ids))
-        top_indices = np.argsort(scores)[::-1][:top_k]
+    async def search(
+        self,
+        embedding: List[float],
+        limit: int = 5,
+        min_score: Optional[float] = None,
+        types: Optional[List[str]] = None,
+        type_limits: Optional[Dict[str, int]] = None,
+        with_vectors: bool = False,
+        ranking: Optional[RankingPolicy] = None,
+    ) -> List[Dict]:
+        query = self._normalise(embedding)
+        segments = self._generation.segments
+        plan, cap = self._plan(segments, limit, types, type_limits)
+        if not plan:
+            logger.info("  VECTOR ▸ SEARCH | no vectors to score, returning []")
+            return []
+        found = self._collect(segments, query[None, :], [plan], min_score, with_vectors, self._ranking(ranking))
+        results = self._results(found[0], cap)
 
-        results = []
-        for idx in top_indices:
-            score = float(scores[idx])
-            if score <= 0:
+        logger.info(
+            "  VECTOR ▸ SEARCH | dim=%d limit=%d min_score=%s types=%s → %d results",
+            len(embedding), limit, min_score, types or list(type_limits or []) or "all", len(results),
+        )
+        return results
+
+    async def search_many(
+        self,
+        embeddings: Sequence[Sequence[float]],
+        limits: Sequence[Union[int, Dict[str, int]]],
+        min_score: Optional[float] = None,
+        types: Optional[Sequence[Optional[List[str]]]] = None,
+        union: bool = False,
+        with_vectors: bool = False,
+        ranking: Optional[RankingPolicy] = None,
+    ) -> Union[List[List[Dict]], List[Dict]]:
+        if not len(embeddings):
+            return []
+        queries = np.stack([self._normalise(embedding) for embedding in embeddings])
+        segments = self._generation.segments
+        plans, caps = [], []
+        for i, limit in enumerate(limits):
+            query_types = types[i] if types is not None else None
+            if isinstance(limit, dict):
+                plan, cap = self._plan(segments, 0, query_types, limit)   # listed types without a limit are skipped
+            else:
+                plan, cap = self._plan(segments, limit, query_types, None)
+            plans.append(plan)
+            caps.append(cap)
+        candidates = self._collect(segments, queries, plans, min_score, with_vectors, self._ranking(ranking))
+
+        results = [self._results(found, cap) for found, cap in zip(candidates, caps)]
+        if union:
+            results = self.merge_hits(results)
+
+        logger.info(
+            "  VECTOR ▸ SEARCH_MANY | queries=%d min_score=%s union=%s → %s results",
+            len(limits), min_score, union, len(results) if union else [len(r) for r in results],
+        )
+        return results
+
+    def _plan(
+        self, segments: Dict[str, _Segment], limit: int, types: Optional[List[str]],
+        type_limits: Optional[Dict[str, int]],
+    ) -> Tuple[Dict[str, int], Optional[int]]:
+        """(type → per-segment limit, overall cap) for one query."""
+        if type_limits is not None and types is None:
+            types = list(type_limits)
+        plan = {}
+        for item_type, _ in self._iter_segments(segments, types):
+            type_limit = type_limits.get(item_type, limit) if type_limits is not None else limit
+            if type_limit > 0:
+                plan[item_type] = type_limit
+        return plan, (limit if type_limits is None else None)
+
+    def _ranking(self, policy: Optional[RankingPolicy]) -> Optional[_Ranking]:
+        """Resolve a policy against the status codes and the current time; None when it changes nothing."""
+        if policy is None or policy.neutral:
+            return None
+        return _Ranking(
+            now=time.time() / _SECONDS_PER_DAY,
+            half_life=policy.half_life_days or None,
+            floor=policy.decay_floor,
+            boosts=self._statuses.boosts(policy.status_boosts),
+        )
+
+    def _collect(
+        self, segments: Dict[str, _Segment], queries: np.ndarray, plans: List[Dict[str, int]],
+        min_score: Optional[float], with_vectors: bool = False, ranking: Optional[_Ranking] = None,
+    ) -> List[List[Tuple[float, str, bytes, Optional[np.ndarray]]]]:
+        """
+        Per query, (score, id, payload bytes, vector) of each planned
+        segment's best rows. A segment is scanned once for all the queries
+        that include it. Payloads are taken as bytes and only decoded once
+        the caller has merged and trimmed; vectors are only read (float32
+        originals where kept) when asked for.
+        """
+        candidates: List[List[Tuple[float, str, bytes, Optional[np.ndarray]]]] = [[] for _ in plans]
+        for item_type, seg in self._iter_segments(segments, None):
+            active = [i for i, plan in enumerate(plans) if item_type in plan]
+            if not active:
                 continue
-            results.append({
-                "id": ids[idx],
-                "score": score,
-                "payload": self._payloads[ids[idx]],
-            })
+            limits = [plans[i][item_type] for i in active]
+            hits = self._segment_top_k_many(item_type, seg, queries[active], limits, min_score, ranking)
+            for i, (rows, scores) in zip(active, hits):
+                if with_vectors:
+                    vectors = seg.exact[rows] if seg.exact is not None else seg.vectors(rows)
+                else:
+                    vectors = itertools.repeat(None)
+                for row, score, vec in zip(rows.tolist(), scores.tolist(), vectors):
+                    candidates[i].append((score, seg.ids[row], seg.payloads.encoded(row), vec))
+        return candidates
 
-        logger.info("  VECTOR ▸ SEARCH | dim=%d limit=%d → %d results", len(embedding), limit, len(results))
+    @staticmethod
+    def _results(candidates: List[Tuple[float, str, bytes, Optional[np.ndarray]]], cap: Optional[int]) -> List[Dict]:
+        candidates = sorted(candidates, key=lambda c: c[0], reverse=True)
+        if cap is not None:
+            candidates = candidates[:cap]
+        results = []
+        for score, item_id, payload, vec in candidates:
+            hit = {"id": item_id, "score": score, "payload": json.loads(payload)}
+            if vec is not None:
+                hit["vector"] = vec
+            results.append(hit)
         return results
 
+    def _segment_top_k(
+        self, item_type: str, seg: _Segment, query: np.ndarray, limit: int, min_score: Optional[float],
+        ranking: Optional[_Ranking] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """(rows, scores) of a segment view's best matches, best first."""
+        return seg.top_k(query, seg.scores(query), None, limit, min_score, ranking)
+
+    def _segment_top_k_many(
+        self, item_type: str, seg: _Segment, queries: np.ndarray, limits: List[int], min_score: Optional[float],
+        ranking: Optional[_Ranking] = None,
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """_segment_top_k for several queries over one scan."""
+        if queries.shape[0] == 1:
+            return [self._segment_top_k(item_type, seg, queries[0], limits[0], min_score, ranking)]
+        scores = seg.scores_many(queries)
+        return [
+            seg.top_k(query, query_scores, None, limit, min_score, ranking)
+            for query, query_scores, limit in zip(queries, scores, limits)
+        ]
+
+    @staticmethod
+    def _iter_segments(segments: Dict[str, _Segment], types: Optional[Iterable[str]]) -> List[Tuple[str, _Segment]]:
+        """Non-empty segments matching the type filter."""
+        if types is None:
+            items = segments.items()
+        else:
+            items = ((t, segments[t]) for t in types if t in segments)
+        return [(t, seg) for t, seg in items if len(seg)]
+
     async def delete(self, item_id: str) -> None:
         with self._lock:
-            self._vectors.pop(item_id, None)
-            self._payloads.pop(item_id, None)
+            location = self._id_map().pop(item_id, None)
+            if location is not None:
+                self._release(*location)
+                self._publish()
         logger.info("  VECTOR ▸ DELETE | id=%s", item_id[:12])
+
+    async def patch_payload(self, item_id: str, fields: Dict) -> bool:
+        with self._lock:
+            location = self._id_map().get(item_id)
+            if location is None:
+                return False
+            item_type, row = location
+            if fields.get("_type", item_type) != item_type:
+                raise ValueError(f"patch_payload cannot change _type of {item_id} ({item_type})")
+            seg = self._segments[item_type]
+            # Rows are encoded bytes — decode, merge, re-encode.
+            seg.payloads[row] = {**seg.payloads[row], **fields}
+            # The columns are shared with published views, like the payloads.
+            seg.set_columns(row, fields, self._statuses)
+            self._publish()
+        logger.info("  VECTOR ▸ PATCH | id=%s | fields=%s", item_id[:12], ",".join(fields))
+        return True
+
+    # ─── Snapshots ─────────────────────────────────────────────────
+    def save_snapshot(self, directory: str) -> bool:
+        """
+        Write the index to `directory`. Blocking — run it off the event loop.
+        Returns False (and writes nothing) when nothing changed since the last save.
+        Saves are serialised: a second caller waits for the first to finish.
+        """
+        with self._save_lock:
+            with self._lock:
+                if self._version == self._saved_version:
+                    return False
+                version = self._version
+                taken_at = datetime.now(timezone.utc)
+                # Published rows never change, so the current views' arrays are
+                # written as-is; only the id and payload tables are copied here.
+                state = []
+                arrays: Dict[str, np.ndarray] = {}
+                for item_type, seg in self._generation.segments.items():
+                    if not seg.size:
+                        continue
+                    name = f"seg{len(state)}"
+                    ids = seg.ids[:seg.size]
+                    for row in seg.dead.tolist():
+                        ids[row] = None
+                    state.append((item_type, seg.matrix[:seg.size], ids, seg.payloads.copy()))
+                    arrays[f"{name}.created"] = seg.created[:seg.size].copy()
+                    arrays[f"{name}.status"] = seg.status[:seg.size].copy()
+                    if seg.scales is not None:
+                        arrays[f"{name}.scales"] = seg.scales[:seg.size]
+                    if seg.exact is not None:
+                        arrays[f"{name}.exact"] = seg.exact[:seg.size]
+                count = sum(len(seg) for seg in self._segments.values())
+                extra, extra_arrays = self._snapshot_extra()
+                extra = {
+                    "quantization": {"mode": self._quantization, "rerank": self._rerank},
+                    "statuses": list(self._statuses.names),
+                    "taken_at": taken_at.isoformat(),
+                    **extra,
+                }
+                arrays.update(extra_arrays)
+
+            start = time.perf_counter()
+            generation = write_snapshot(directory, self._dimension, state, extra=extra, arrays=arrays)
+            self._saved_version = version
+            logger.info(
+                "  VECTOR ▸ SNAPSHOT | saved %d vectors to %s/%s in %.2fs",
+                count, directory, generation, time.perf_counter() - start,
+            )
+            return True
+
+    def load_snapshot(self, directory: str) -> bool:
+        """Memory-map the snapshot in `directory`, replacing the current contents."""
+        start = time.perf_counter()
+        loaded = read_snapshot(directory)
+        if loaded is None:
+            logger.info("  VECTOR ▸ SNAPSHOT | none found in %s", directory)
+            return False
+        manifest, state = loaded
+        if manifest["dimension"] != self._dimension:
+            raise ValueError(
+                f"Snapshot dimension {manifest['dimension']} does not match store dimension {self._dimension}"
+            )
+
+        arrays = manifest["arrays"]
+        statuses = _StatusCodes(manifest.get("statuses", [""]))
+        segments = {}
+        for i, (item_type, matrix, ids, payloads) in enumerate(state):
+            seg = _Segment.from_snapshot(
+                matrix, ids, payloads, arrays.get(f"seg{i}.scales"), arrays.get(f"seg{i}.exact"),
+                arrays.get(f"seg{i}.created"), arrays.get(f"seg{i}.status"),
+            )
+            if f"seg{i}.created" not in arrays:
+                logger.info("  VECTOR ▸ SNAPSHOT | indexing created_at / status of type=%s", item_type)
+                seg.index_columns(statuses)
+            if seg.quantization != self._quantization or (seg.exact is not None) != self._rerank:
+                logger.info(
+                    "  VECTOR ▸ SNAPSHOT | re-encoding type=%s from %s to %s",
+                    item_type, seg.quantization, self._quantization,
+                )
+                seg = seg.converted(self._quantization, self._rerank)
+            segments[item_type] = seg
+        with self._lock:
+            self._segments = segments
+            self._statuses = statuses
+            self._locations = None
+            self._restore_extra(manifest)
+            self._publish()
+            self._saved_version = self._version
+            self._snapshot_taken_at = (
+                datetime.fromisoformat(manifest["taken_at"]) if "taken_at" in manifest else None
+            )
+
+        logger.info(
+            "  VECTOR ▸ SNAPSHOT | restored %d vectors (%s) from %s in %.3fs",
+            manifest["count"], manifest["generation"], directory, time.perf_counter() - start,
+        )
+        return True
+
+    def _snapshot_extra(self) -> Tuple[Dict, Dict[str, np.ndarray]]:
+        """Extra manifest fields and named arrays to persist. Caller must hold the lock."""
+        return {}, {}
+
+    def _restore_extra(self, manifest: Dict) -> None:
+        """Counterpart of _snapshot_extra, after the segments are in place. Caller must hold the lock."""
+
+    def warm_up(self) -> None:
+        """
+        Build the id map and fault the memory-mapped vectors into RAM, so the
+        first write and first search after a restore don't pay for it.
+        Blocking — run it off the event loop.
+        """
+        with self._lock:
+            self._id_map()
+            # Only the scanned codes; re-rank originals stay cold on disk.
+            matrices = [seg.matrix[:seg.size] for seg in self._segments.values()]
+        start = time.perf_counter()
+        for matrix in matrices:
+            for chunk_start in range(0, matrix.shape[0], 65536):
+                matrix[chunk_start:chunk_start + 65536].sum()
+        logger.info("  VECTOR ▸ WARM-UP | vectors paged in in %.3fs", time.perf_counter() - start)
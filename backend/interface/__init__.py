@@ -109,6 +109,7 @@ class ReflectionResponse(BaseModel):
 class SearchRequest(BaseModel):
     query: str
     limit: int = 10
+    min_score: Optional[float] = None
 
 
 class SearchResult(BaseModel):
@@ -134,7 +135,14 @@ class ChatResponse(BaseModel):
     context_used: int = 0
     sources: List[dict] = []
     session_id: Optional[str] = None
-    auto_captured: List[dict] = []
+    capture_id: Optional[str] = None   # poll GET /chat/captures/{capture_id} for the auto-captured items
+    prompt_tokens: int = 0             # estimated size of the prompt sent to the LLM
+
+
+class ChatCaptureResponse(BaseModel):
+    capture_id: str
+    status: str                        # "pending", "done" or "failed"
+    items: List[dict] = []
 
 
 class ChatSessionResponse(BaseModel):
@@ -1,5 +1,7 @@
+import json
 import logging
 from fastapi import APIRouter, UploadFile, File, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from backend.interface import (
     IngestTextRequest,
@@ -19,10 +21,12 @@ from backend.interface import (
     SearchResult,
     ChatRequest,
     ChatResponse,
+    ChatCaptureResponse,
     ChatSessionResponse,
     ChatHistoryResponse,
 )
-from backend.infrastructure.database import get_db_session
+from backend.infrastructure.database import get_db_session, get_session_factory
+from backend.config import get_settings
 from backend.application.container import (
     get_ingest_use_case,
     get_confirm_plan_use_case,
@@ -394,7 +398,7 @@ async def list_reflections(
 # SEMANTIC SEARCH
 # ═══════════════════════════════════════════════════════════════════
 @router.post("/search", response_model=List[SearchResult])
-async def semantic_search_route(body: SearchRequest):
+async def semantic_search_route(body: SearchRequest, session: AsyncSession = Depends(get_db_session)):
     logger.info(
         "\n╔══ API ▸ POST /search ════════════════════════════════════\n"
         "║  Query : %s\n"
@@ -403,8 +407,8 @@ async def semantic_search_route(body: SearchRequest):
         (body.query[:80] + "…") if len(body.query) > 80 else body.query,
         body.limit,
     )
-    use_case = await get_search_use_case()
-    results = await use_case.execute(query=body.query, limit=body.limit)
+    use_case = await get_search_use_case(session)
+    results = await use_case.execute(query=body.query, limit=body.limit, min_score=body.min_score)
     logger.info("  API ▸ RESPONSE 200 | returned %d search results", len(results))
     return [
         SearchResult(
@@ -481,6 +485,75 @@ async def chat_route(body: ChatRequest, session: AsyncSession = Depends(get_db_s
     return ChatResponse(**result)
 
 
+@router.post("/chat/stream")
+async def chat_stream_route(body: ChatRequest):
+    """
+    POST /chat as Server-Sent Events: `sources` first, then one `token`
+    event per completion chunk, then `done` (or `error`). Each event's data
+    is a JSON object. The stream then stays open for up to
+    CHAT_CAPTURE_STREAM_WAIT_SECONDS to push the worker's auto-capture
+    result as `captured` ({capture_id, status, items}).
+    """
+    logger.info(
+        "\n╔══ API ▸ POST /chat/stream ═══════════════════════════════\n"
+        "║  Message    : %s\n"
+        "║  Session ID : %s\n"
+        "╚══════════════════════════════════════════════════════════\n",
+        (body.message[:80] + "…") if len(body.message) > 80 else body.message,
+        body.session_id or "(new)",
+    )
+    history = [{"role": m.role, "content": m.content} for m in (body.history or [])]
+
+    async def events():
+        capture_id = None
+        # Once the response has started, an exception would just drop the
+        # connection: anything that escapes the use case becomes an error event.
+        try:
+            # The session is opened here, not as a dependency, so it lives exactly
+            # as long as the stream — persistence runs after the last token.
+            async with get_session_factory()() as session:
+                use_case = await get_chat_use_case_with_history(session)
+                async for event, data in use_case.stream(
+                    message=body.message,
+                    session_id=body.session_id,
+                    history=history,
+                ):
+                    if event == "done":
+                        capture_id = data.get("capture_id")
+                    yield f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+        except Exception as e:
+            logger.error("  API ▸ STREAM 500 | session=%s | %s", body.session_id, e)
+            data = {"message": "The assistant could not finish this reply."}
+            yield f"event: error\ndata: {json.dumps(data)}\n\n"
+            return
+
+        # The DB session is released; waiting on the worker only reads the cache.
+        wait_seconds = get_settings().chat_capture_stream_wait_seconds
+        if capture_id and wait_seconds > 0:
+            record = await use_case.captured(capture_id, wait_seconds=wait_seconds)
+            if record:
+                data = {"capture_id": capture_id, **record}
+                yield f"event: captured\ndata: {json.dumps(data, default=str)}\n\n"
+        logger.info("  API ▸ STREAM CLOSED | session=%s", body.session_id)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/chat/captures/{capture_id}", response_model=ChatCaptureResponse)
+async def get_chat_capture(capture_id: str):
+    """Auto-capture result for a chat reply: `pending` until the event worker has run."""
+    use_case = await get_chat_use_case()
+    record = await use_case.captured(capture_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail="Capture not found or expired")
+    logger.info("  API ▸ CAPTURE %s | status=%s items=%d", capture_id, record["status"], len(record["items"]))
+    return ChatCaptureResponse(capture_id=capture_id, **record)
+
+
 @router.get("/chat/sessions", response_model=List[ChatSessionResponse])
 async def list_chat_sessions(
     limit: int = 20,
@@ -2,10 +2,16 @@ import asyncio
 import logging
 import sys
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from backend.infrastructure.database import init_db, shutdown_db
-from backend.application.container import create_event_worker, shutdown_redis
+from backend.application.container import (
+    create_event_worker, shutdown_redis, embedding_stats, shutdown_embedding, shutdown_llm_client,
+    init_vector_store, rehydrate_vector_store, reconcile_vector_store, save_vector_snapshot,
+    vector_index_ready, vector_index_size, uses_vector_snapshots, shutdown_vector_store,
+    build_lexical_index,
+)
+from backend.config import get_settings
 from backend.interface.routes import router
 
 # ─── Logging Configuration ─────────────────────────────────────────
@@ -29,6 +35,51 @@ logging.getLogger("sentence_transformers").setLevel(logging.WARNING)
 logger = logging.getLogger("jarvis.main")
 
 
+async def _snapshot_loop(interval: int, stop: asyncio.Event):
+    """
+    Persist the vector index every `interval` seconds (skipped when unchanged)
+    until `stop` is set. Stopped, not cancelled: cancelling would not stop a
+    save already running in its worker thread.
+    """
+    while True:
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=interval)
+            return
+        except asyncio.TimeoutError:
+            pass
+        try:
+            await save_vector_snapshot()
+        except Exception as e:
+            logger.error("[SNAPSHOT] Periodic vector snapshot failed: %s", e)
+
+
+async def _rehydrate():
+    try:
+        count = await rehydrate_vector_store()
+        logger.info("[STARTUP] Vector index rehydrated from Postgres (%d items). Ready.", count)
+    except Exception as e:
+        logger.error("[STARTUP] Vector index rehydration FAILED — /health stays unready: %s", e, exc_info=True)
+
+
+async def _reconcile():
+    try:
+        counts = await reconcile_vector_store()
+        logger.info(
+            "[STARTUP] Vector index caught up with Postgres (%d replayed, %d missing, %d deleted). Ready.",
+            counts["replayed"], counts["missing"], counts["deleted"],
+        )
+    except Exception as e:
+        logger.error("[STARTUP] Vector index reconciliation FAILED — /health stays unready: %s", e, exc_info=True)
+
+
+async def _build_lexical():
+    try:
+        count = await build_lexical_index()
+        logger.info("[STARTUP] Keyword index built from Postgres (%d items).", count)
+    except Exception as e:
+        logger.error("[STARTUP] Keyword index build FAILED — search falls back to vectors only: %s", e, exc_info=True)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("=" * 60)
@@ -39,6 +90,26 @@ async def lifespan(app: FastAPI):
     await init_db()
     logger.info("[STARTUP] Database ready.")
 
+    logger.info("[STARTUP] Loading vector index...")
+    rehydrate_task = reconcile_task = lexical_task = None
+    if await init_vector_store():
+        logger.info("[STARTUP] Vector index restored (%d vectors).", await vector_index_size())
+        if uses_vector_snapshots():
+            # The snapshot may predate the last writes before shutdown or a crash.
+            reconcile_task = asyncio.create_task(_reconcile())
+        # Rehydration feeds the keyword index as it goes; a restore does not.
+        lexical_task = asyncio.create_task(_build_lexical())
+    else:
+        logger.info("[STARTUP] Vector index empty — rehydrating from Postgres in the background.")
+        rehydrate_task = asyncio.create_task(_rehydrate())
+
+    snapshot_task = None
+    snapshot_stop = asyncio.Event()
+    interval = get_settings().vector_snapshot_interval_seconds
+    if interval > 0 and uses_vector_snapshots():
+        snapshot_task = asyncio.create_task(_snapshot_loop(interval, snapshot_stop))
+        logger.info("[STARTUP] Vector snapshots every %ds.", interval)
+
     logger.info("[STARTUP] Creating event worker...")
     worker = await create_event_worker()
     worker_task = asyncio.create_task(worker.start())
@@ -56,6 +127,32 @@ async def lifespan(app: FastAPI):
         pass
     logger.info("[SHUTDOWN] Event worker stopped.")
 
+    logger.info("[SHUTDOWN] Saving vector index snapshot...")
+    # Let an in-flight periodic save finish before the final one.
+    snapshot_stop.set()
+    if snapshot_task:
+        await snapshot_task
+    for task in (rehydrate_task, reconcile_task, lexical_task):
+        if task and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+    try:
+        saved = await save_vector_snapshot()
+        logger.info("[SHUTDOWN] Vector index %s.", "saved" if saved else "unchanged or incomplete, not saved")
+    except Exception as e:
+        logger.error("[SHUTDOWN] Vector snapshot failed: %s", e)
+
+    try:
+        await shutdown_vector_store()
+    except Exception as e:
+        logger.error("[SHUTDOWN] Vector store flush failed: %s", e)
+
+    shutdown_embedding()
+    await shutdown_llm_client()
+
     logger.info("[SHUTDOWN] Closing Redis...")
     await shutdown_redis()
     logger.info("[SHUTDOWN] Redis closed.")
@@ -86,5 +183,17 @@ app.include_router(router)
 
 
 @app.get("/health")
-async def health():
-    return {"status": "ok", "service": "jarvis", "version": "2.0.0"}
+async def health(response: Response):
+    ready = vector_index_ready()
+    if not ready:
+        # Not ready until the vector index holds the full corpus, so load
+        # balancers hold traffic instead of serving against a partial index.
+        response.status_code = 503
+    return {
+        "status": "ok" if ready else "starting",
+        "service": "jarvis",
+        "version": "2.0.0",
+        "index_ready": ready,
+        "indexed_items": await vector_index_size(),
+        "embedding": embedding_stats(),
+    }
@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Union
 from backend.domain.models import (
     Objective, PlanStep, Learning, DecisionLog, Reflection,
-    ChatMessageRecord, ChatSession,
+    ChatMessageRecord, ChatSession, RankingPolicy,
 )
 from backend.domain.events import DomainEvent
 
@@ -56,6 +57,11 @@ class ObjectiveRepository(ABC):
     async def get(self, objective_id: str) -> Optional[Objective]:
         pass
 
+    @abstractmethod
+    async def get_many(self, ids: List[str]) -> List[Objective]:
+        """Rows for the given ids in one query; missing ids are skipped."""
+        pass
+
     @abstractmethod
     async def update(self, objective: Objective) -> None:
         pass
@@ -64,6 +70,18 @@ class ObjectiveRepository(ABC):
     async def list_recent(self, limit: int = 20) -> List[Objective]:
         pass
 
+    @abstractmethod
+    def stream_all(
+        self, batch_size: int = 500, updated_since: Optional[datetime] = None,
+    ) -> AsyncIterator[List[Objective]]:
+        """Every stored row — or those written at or after `updated_since` — in pages of `batch_size` (server-side cursor)."""
+        pass
+
+    @abstractmethod
+    def stream_ids(self, batch_size: int = 5000) -> AsyncIterator[List[str]]:
+        """Every stored id, in pages of `batch_size`."""
+        pass
+
 
 class LearningRepository(ABC):
     @abstractmethod
@@ -74,10 +92,27 @@ class LearningRepository(ABC):
     async def get(self, learning_id: str) -> Optional[Learning]:
         pass
 
+    @abstractmethod
+    async def get_many(self, ids: List[str]) -> List[Learning]:
+        """Rows for the given ids in one query; missing ids are skipped."""
+        pass
+
     @abstractmethod
     async def list_recent(self, limit: int = 20) -> List[Learning]:
         pass
 
+    @abstractmethod
+    def stream_all(
+        self, batch_size: int = 500, updated_since: Optional[datetime] = None,
+    ) -> AsyncIterator[List[Learning]]:
+        """Every stored row — or those written at or after `updated_since` — in pages of `batch_size` (server-side cursor)."""
+        pass
+
+    @abstractmethod
+    def stream_ids(self, batch_size: int = 5000) -> AsyncIterator[List[str]]:
+        """Every stored id, in pages of `batch_size`."""
+        pass
+
 
 class DecisionLogRepository(ABC):
     @abstractmethod
@@ -88,20 +123,54 @@ class DecisionLogRepository(ABC):
     async def get(self, decision_id: str) -> Optional[DecisionLog]:
         pass
 
+    @abstractmethod
+    async def get_many(self, ids: List[str]) -> List[DecisionLog]:
+        """Rows for the given ids in one query; missing ids are skipped."""
+        pass
+
     @abstractmethod
     async def list_recent(self, limit: int = 20) -> List[DecisionLog]:
         pass
 
+    @abstractmethod
+    def stream_all(
+        self, batch_size: int = 500, updated_since: Optional[datetime] = None,
+    ) -> AsyncIterator[List[DecisionLog]]:
+        """Every stored row — or those written at or after `updated_since` — in pages of `batch_size` (server-side cursor)."""
+        pass
+
+    @abstractmethod
+    def stream_ids(self, batch_size: int = 5000) -> AsyncIterator[List[str]]:
+        """Every stored id, in pages of `batch_size`."""
+        pass
+
 
 class ReflectionRepository(ABC):
     @abstractmethod
     async def save(self, reflection: Reflection) -> None:
         pass
 
+    @abstractmethod
+    async def get_many(self, ids: List[str]) -> List[Reflection]:
+        """Rows for the given ids in one query; missing ids are skipped."""
+        pass
+
     @abstractmethod
     async def list_recent(self, limit: int = 10) -> List[Reflection]:
         pass
 
+    @abstractmethod
+    def stream_all(
+        self, batch_size: int = 500, updated_since: Optional[datetime] = None,
+    ) -> AsyncIterator[List[Reflection]]:
+        """Every stored row — or those written at or after `updated_since` — in pages of `batch_size` (server-side cursor)."""
+        pass
+
+    @abstractmethod
+    def stream_ids(self, batch_size: int = 5000) -> AsyncIterator[List[str]]:
+        """Every stored id, in pages of `batch_size`."""
+        pass
+
 
 class VectorStore(ABC):
     @abstractmethod
@@ -109,19 +178,132 @@ class VectorStore(ABC):
         pass
 
     @abstractmethod
-    async def search(self, embedding: List[float], limit: int = 5) -> List[Dict]:
+    async def search(
+        self,
+        embedding: List[float],
+        limit: int = 5,
+        min_score: Optional[float] = None,
+        types: Optional[List[str]] = None,
+        type_limits: Optional[Dict[str, int]] = None,
+        with_vectors: bool = False,
+        ranking: Optional[RankingPolicy] = None,
+    ) -> List[Dict]:
+        """Top matches by cosine similarity, best first.
+
+        `min_score` drops matches scoring below it inside the store; when
+        omitted, implementations keep their default cutoff. `types` restricts
+        the search to payloads whose `_type` is listed. `type_limits` maps a
+        type to its own result cap — it replaces `limit`, and `types`
+        defaults to its keys. With `with_vectors`, each hit also carries its
+        stored vector as a float32 ndarray under "vector" (for re-ranking).
+        With `ranking`, each similarity is weighted by the item's age and
+        status inside the scoring pass; `min_score`, the limits and the
+        returned "score" are all on the weighted scale.
+        """
         pass
 
     @abstractmethod
     async def delete(self, objective_id: str) -> None:
         pass
 
+    @abstractmethod
+    async def patch_payload(self, item_id: str, fields: Dict) -> bool:
+        """Merge `fields` into an item's payload, leaving its vector untouched.
+
+        Returns False when the item is not in the store, so the caller can
+        fall back to a full upsert. `fields` must not change `_type`.
+        """
+        pass
+
+    async def upsert_many(self, ids: List[str], embeddings: Sequence[Sequence[float]], payloads: List[Dict]) -> None:
+        """Bulk upsert. Adapters with a native batch path should override this."""
+        for item_id, embedding, payload in zip(ids, embeddings, payloads):
+            await self.upsert(item_id, embedding, payload)
+
+    async def search_many(
+        self,
+        embeddings: Sequence[Sequence[float]],
+        limits: Sequence[Union[int, Dict[str, int]]],
+        min_score: Optional[float] = None,
+        types: Optional[Sequence[Optional[List[str]]]] = None,
+        union: bool = False,
+        with_vectors: bool = False,
+        ranking: Optional[RankingPolicy] = None,
+    ) -> Union[List[List[Dict]], List[Dict]]:
+        """Several searches in one call.
+
+        Query i is `search(embeddings[i], ...)` with `limits[i]` as its
+        `limit` (an int) or its `type_limits` (a dict), and `types[i]` as its
+        `types`. Returns one result list per query; with `union`, a single
+        list of every query's hits in query order, each id kept once at its
+        first occurrence. Adapters that can score queries together should
+        override this.
+        """
+        results = []
+        for i, (embedding, limit) in enumerate(zip(embeddings, limits)):
+            query_types = types[i] if types is not None else None
+            if isinstance(limit, dict):
+                hits = await self.search(
+                    embedding, min_score=min_score, types=query_types, type_limits=limit,
+                    with_vectors=with_vectors, ranking=ranking,
+                )
+            else:
+                hits = await self.search(
+                    embedding, limit=limit, min_score=min_score, types=query_types,
+                    with_vectors=with_vectors, ranking=ranking,
+                )
+            results.append(hits)
+        return self.merge_hits(results) if union else results
+
+    @staticmethod
+    def merge_hits(results: List[List[Dict]]) -> List[Dict]:
+        """Concatenate result lists, keeping each id once at its first occurrence."""
+        seen = set()
+        merged = []
+        for hits in results:
+            for hit in hits:
+                if hit["id"] not in seen:
+                    seen.add(hit["id"])
+                    merged.append(hit)
+        return merged
+
+
+class LexicalIndex(ABC):
+    """Keyword index over the items of the VectorStore, for exact-term matches."""
+
+    @abstractmethod
+    async def upsert_many(self, ids: List[str], payloads: List[Dict]) -> None:
+        """Index (or re-index) items from their index payloads."""
+        pass
+
+    @abstractmethod
+    async def patch(self, item_id: str, fields: Dict) -> None:
+        """Re-index an item from patched payload fields, keeping its `_type`."""
+        pass
+
+    @abstractmethod
+    async def delete(self, item_id: str) -> None:
+        pass
+
+    @abstractmethod
+    async def search(self, query: str, limit: int = 10, types: Optional[List[str]] = None) -> List[Dict]:
+        """Best keyword matches first, as {"id", "score", "payload": {"_type"}}."""
+        pass
+
 
 class EmbeddingProvider(ABC):
     @abstractmethod
     async def embed(self, text: str) -> List[float]:
         pass
 
+    @abstractmethod
+    async def embed_many(self, texts: List[str]) -> Sequence[Sequence[float]]:
+        """
+        Embed several texts in one model call. Row i is the embedding of
+        texts[i]; implementations may return an (n, dim) ndarray as-is.
+        """
+        pass
+
 
 class StagingCache(ABC):
     @abstractmethod
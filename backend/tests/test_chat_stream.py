@@ -0,0 +1,34 @@
+import asyncio
+
+import numpy as np
+
+from backend.application.chat_use_case import ChatUseCase
+from backend.infrastructure.vector_store import InMemoryVectorStore
+
+
+class _FailingEmbedding:
+    async def embed(self, text: str) -> np.ndarray:
+        raise ConnectionError("embedding service unavailable")
+
+    async def embed_many(self, texts):
+        raise ConnectionError("embedding service unavailable")
+
+
+class _UnusedClient:
+    """The completion must never be requested when retrieval fails."""
+
+    def __getattr__(self, name):
+        raise AssertionError(f"LLM client used: {name}")
+
+
+async def _collect(use_case: ChatUseCase):
+    return [event async for event in use_case.stream("How should I price the new plan?")]
+
+
+def test_stream_reports_prepare_failure_as_error_event():
+    use_case = ChatUseCase(InMemoryVectorStore(dimension=8), _FailingEmbedding(), _UnusedClient())
+
+    events = asyncio.run(_collect(use_case))
+
+    assert [event for event, _ in events] == ["error"]
+    assert events[0][1]["message"]
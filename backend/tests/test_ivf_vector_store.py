@@ -0,0 +1,58 @@
+import asyncio
+import threading
+
+import numpy as np
+
+from backend.infrastructure.ivf_vector_store import IVFVectorStore
+
+DIMENSION = 16
+
+
+def _store(n: int) -> IVFVectorStore:
+    store = IVFVectorStore(dimension=DIMENSION, nlist=4, nprobe=4, train_min=256)
+    vectors = np.random.default_rng(0).standard_normal((n, DIMENSION), dtype=np.float32)
+    asyncio.run(store.upsert_many([f"i{i}" for i in range(n)], vectors, [{"_type": "learning"}] * n))
+    store.wait_for_training()
+    assert store.index_stats()["learning"]["nlist"] == 4
+    return store
+
+
+def _assert_distinct(hits):
+    ids = [hit["id"] for hit in hits]
+    assert len(ids) == len(set(ids)), ids
+
+
+def test_search_mid_swap_remove_returns_distinct_ids():
+    store = _store(512)
+    index = store._indexes["learning"]
+    # The first half of a swap-remove: the last row is copied into the
+    # removed row's slot, the list has not shrunk yet.
+    list_id = int(np.argmax(index.sizes))
+    members = index.rows[list_id]
+    members[0] = members[index.sizes[list_id] - 1]
+    query = store._segments["learning"].vectors(members[0])
+
+    _assert_distinct(asyncio.run(store.search(query, limit=50, min_score=-1.0)))
+    for hits in asyncio.run(store.search_many([query, -query], [50, 50], min_score=-1.0)):
+        _assert_distinct(hits)
+
+
+def test_concurrent_deletes_and_searches_return_distinct_ids():
+    store = _store(2048)
+    queries = np.random.default_rng(1).standard_normal((200, DIMENSION), dtype=np.float32)
+    done = threading.Event()
+
+    def delete_all():
+        for i in range(0, 2048, 2):
+            asyncio.run(store.delete(f"i{i}"))
+        done.set()
+
+    writer = threading.Thread(target=delete_all)
+    writer.start()
+    try:
+        while not done.is_set():
+            for query in queries:
+                _assert_distinct(asyncio.run(store.search(query, limit=20, min_score=-1.0)))
+    finally:
+        writer.join()
+    assert len(store) == 1024
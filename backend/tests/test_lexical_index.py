@@ -0,0 +1,37 @@
+import asyncio
+
+from backend.infrastructure.lexical_index import BM25Index
+
+
+def _ids(results):
+    return [hit["id"] for hit in results]
+
+
+def test_patch_keeps_unpatched_fields_searchable():
+    index = BM25Index()
+    asyncio.run(index.upsert_many(
+        ["d1", "d2"],
+        [
+            {"_type": "decision", "decision": "Adopt Kubernetes for staging", "why": "autoscaling", "tags": ["infra"]},
+            {"_type": "decision", "decision": "Switch billing to Stripe", "why": "fees", "tags": ["billing"]},
+        ],
+    ))
+
+    asyncio.run(index.patch("d1", {"why": "cheaper than managed VMs"}))
+
+    assert _ids(asyncio.run(index.search("kubernetes"))) == ["d1"]
+    assert _ids(asyncio.run(index.search("infra"))) == ["d1"]
+    assert _ids(asyncio.run(index.search("cheaper"))) == ["d1"]
+    assert asyncio.run(index.search("autoscaling")) == []
+    assert len(index) == 2
+
+
+def test_delete_forgets_stored_fields():
+    index = BM25Index()
+    asyncio.run(index.upsert_many(["l1"], [{"_type": "learning", "content": "Pricing pages convert better"}]))
+    asyncio.run(index.delete("l1"))
+
+    asyncio.run(index.patch("l1", {"_type": "learning", "tags": ["pricing"]}))
+
+    assert asyncio.run(index.search("convert")) == []
+    assert _ids(asyncio.run(index.search("pricing"))) == ["l1"]
@@ -0,0 +1,78 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from backend.application.reconcile_index_use_case import RECONCILE_OVERLAP, ReconcileIndexUseCase
+from backend.domain.models import Learning
+from backend.infrastructure.vector_store import InMemoryVectorStore
+
+DIMENSION = 8
+
+
+class _Embedding:
+    async def embed_many(self, texts):
+        return np.ones((len(texts), DIMENSION), dtype=np.float32)
+
+
+class _Repo:
+    """Rows of one table with their last write time."""
+
+    def __init__(self, rows=()):
+        self.rows = {item.id: (item, written) for item, written in rows}
+
+    async def stream_all(self, batch_size=500, updated_since=None):
+        items = [item for item, written in self.rows.values() if updated_since is None or written >= updated_since]
+        for start in range(0, len(items), batch_size):
+            yield items[start:start + batch_size]
+
+    async def stream_ids(self, batch_size=5000):
+        ids = list(self.rows)
+        for start in range(0, len(ids), batch_size):
+            yield ids[start:start + batch_size]
+
+    async def get_many(self, ids):
+        return [self.rows[i][0] for i in ids if i in self.rows]
+
+
+def _use_case(learnings: _Repo, store: InMemoryVectorStore) -> ReconcileIndexUseCase:
+    return ReconcileIndexUseCase(_Repo(), learnings, _Repo(), _Repo(), store, _Embedding(), batch_size=2)
+
+
+def test_reconcile_replays_writes_after_the_snapshot(tmp_path):
+    taken = datetime.now(timezone.utc)
+    before, after = taken - RECONCILE_OVERLAP - timedelta(hours=1), taken + timedelta(minutes=1)
+    kept = Learning(id="kept", content="kept as snapshotted")
+    edited = Learning(id="edited", content="edited after the snapshot")
+    lost = Learning(id="lost", content="written after the snapshot")
+    unindexed = Learning(id="unindexed", content="index write failed before the snapshot")
+
+    source = InMemoryVectorStore(dimension=DIMENSION)
+    vectors = np.ones((3, DIMENSION), dtype=np.float32)
+    asyncio.run(source.upsert_many(
+        ["kept", "edited", "deleted"], vectors,
+        [kept.index_payload(), {"_type": "learning", "content": "old text"}, {"_type": "learning", "content": "gone"}],
+    ))
+    assert source.save_snapshot(str(tmp_path))
+
+    store = InMemoryVectorStore(dimension=DIMENSION)
+    assert store.load_snapshot(str(tmp_path))
+    assert store.snapshot_taken_at is not None and abs(store.snapshot_taken_at - taken) < timedelta(minutes=1)
+
+    learnings = _Repo([(kept, before), (edited, after), (lost, after), (unindexed, before)])
+    counts = asyncio.run(_use_case(learnings, store).execute(store.ids(), store.snapshot_taken_at))
+
+    assert counts == {"replayed": 2, "missing": 1, "deleted": 1}
+    assert store.ids() == {"kept", "edited", "lost", "unindexed"}
+    hits = asyncio.run(store.search(list(np.ones(DIMENSION)), limit=10))
+    assert {hit["id"]: hit["payload"]["content"] for hit in hits}["edited"] == "edited after the snapshot"
+
+
+def test_reconcile_without_snapshot_time_reindexes_everything():
+    store = InMemoryVectorStore(dimension=DIMENSION)
+    learnings = _Repo([(Learning(id=f"l{i}", content=f"learning {i}"), datetime.now(timezone.utc)) for i in range(3)])
+
+    counts = asyncio.run(_use_case(learnings, store).execute(set(), None))
+
+    assert counts == {"replayed": 3, "missing": 0, "deleted": 0}
+    assert store.ids() == {"l0", "l1", "l2"}
@@ -0,0 +1,54 @@
+import asyncio
+import os
+import threading
+
+import numpy as np
+
+from backend.infrastructure.vector_snapshot import MANIFEST, PayloadTable, write_snapshot
+from backend.infrastructure.vector_store import InMemoryVectorStore
+
+DIMENSION = 8
+
+
+def test_concurrent_saves_leave_a_loadable_snapshot(tmp_path):
+    store = InMemoryVectorStore(dimension=DIMENSION)
+    rng = np.random.default_rng(0)
+    errors = []
+
+    def save():
+        try:
+            store.save_snapshot(str(tmp_path))
+        except Exception as e:   # noqa: BLE001 — collected for the assertion
+            errors.append(e)
+
+    for round_ in range(6):
+        asyncio.run(store.upsert_many(
+            [f"r{round_}-{i}" for i in range(200)],
+            rng.standard_normal((200, DIMENSION)),
+            [{"_type": "learning", "content": f"item {i}"} for i in range(200)],
+        ))
+        threads = [threading.Thread(target=save) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert errors == []
+    restored = InMemoryVectorStore(dimension=DIMENSION)
+    assert restored.load_snapshot(str(tmp_path))
+    assert len(restored) == len(store)
+    assert len([name for name in os.listdir(tmp_path) if name.startswith("gen-")]) == 1
+
+
+def test_write_snapshot_keeps_newer_generations(tmp_path):
+    newer = tmp_path / "gen-99999999999999999999"
+    newer.mkdir()
+    ids = ["a"]
+    payloads = PayloadTable([b'{"_type":"learning"}'])
+
+    generation = write_snapshot(str(tmp_path), DIMENSION, [("learning", np.ones((1, DIMENSION), np.float32), ids, payloads)])
+    write_snapshot(str(tmp_path), DIMENSION, [("learning", np.ones((1, DIMENSION), np.float32), ids, payloads)])
+
+    assert newer.exists()
+    assert not (tmp_path / generation).exists()
+    assert (tmp_path / MANIFEST).exists()
@@ -19,6 +19,7 @@ export const api = {
       method: 'POST',
       body: JSON.stringify({ message, session_id, history }),
     }),
+  getChatCapture: (captureId) => request(`/chat/captures/${captureId}`),
   listChatSessions: (limit = 20) => request(`/chat/sessions?limit=${limit}`),
   getChatHistory: (sessionId) => request(`/chat/sessions/${sessionId}`),
   deleteChatSession: (sessionId) =>
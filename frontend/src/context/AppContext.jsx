@@ -67,6 +67,14 @@ function reducer(state, action) {
       return { ...state, toasts: [...state.toasts, action.payload] };
     case 'REMOVE_TOAST':
       return { ...state, toasts: state.toasts.filter((t) => t.id !== action.payload) };
+    case 'SET_MESSAGE_CAPTURES': {
+      // The backend worker finished auto-capture for an assistant reply
+      const { captureId, auto_captured, linkedObjectiveId } = action.payload;
+      const updatedMessages = state.chatMessages.map((msg) =>
+        msg.captureId === captureId ? { ...msg, auto_captured, linkedObjectiveId } : msg
+      );
+      return { ...state, chatMessages: updatedMessages };
+    }
     case 'MARK_OBJECTIVE_STEP_DONE': {
       // Reverse-sync: when a step is marked done in Objectives, update any linked chat message
       const { objectiveId, stepNumber } = action.payload;
@@ -91,6 +99,111 @@ function generateSessionId() {
 export function AppProvider({ children }) {
   const [state, dispatch] = useReducer(reducer, initialState);
 
+  // ─── Auto-capture (runs in the backend worker after the reply) ───
+  const handleAutoCaptured = useCallback(async (items) => {
+    // Track objective IDs created during auto-capture
+    let linkedObjectiveId = null;
+
+    // Show toast notifications for auto-captured items
+    if (items.length > 0) {
+      for (const item of items) {
+        const toastId = 'toast-' + Date.now() + '-' + Math.random().toString(36).substr(2, 5);
+        let toastMessage = '';
+        let toastIcon = '✨';
+        if (item.type === 'learning') {
+          toastIcon = '💡';
+          toastMessage = `Learning captured: "${item.content?.substring(0, 60)}…"`;
+        } else if (item.type === 'decision') {
+          toastIcon = '⚖️';
+          toastMessage = `Decision logged: "${item.decision?.substring(0, 60)}…"`;
+        } else if (item.type === 'objective_suggestion') {
+          toastIcon = '🎯';
+          // Actually create the objective via the ingest API and auto-approve it
+          const objText = item.text || '';
+          if (objText.trim()) {
+            try {
+              const ingestResult = await api.ingestText(objText);
+              const objId = ingestResult.objective_id;
+              linkedObjectiveId = objId;
+              toastMessage = `Objective created: "${objText.substring(0, 60)}…"`;
+              // Auto-approve after the plan is drafted (poll for readiness)
+              if (objId) {
+                const autoApprove = async () => {
+                  let attempts = 0;
+                  const maxAttempts = 20;
+                  const poll = async () => {
+                    attempts++;
+                    try {
+                      const status = await api.getStatus(objId);
+                      if (status.plan_draft || status.status === 'planning' || status.status === 'staging') {
+                        try {
+                          await api.confirmPlan(objId, true);
+                          console.log('[JARVIS] Auto-approved objective:', objId);
+                          // Refresh objectives so they appear on the Objectives page
+                          loadObjectives();
+                        } catch (confirmErr) {
+                          console.warn('[JARVIS] Auto-approve failed:', confirmErr);
+                        }
+                        return;
+                      }
+                      if (status.status === 'approved' || status.status === 'in_progress') {
+                        loadObjectives();
+                        return;
+                      }
+                      if (attempts < maxAttempts) {
+                        setTimeout(poll, 2000);
+                      }
+                    } catch {
+                      if (attempts < maxAttempts) {
+                        setTimeout(poll, 2000);
+                      }
+                    }
+                  };
+                  setTimeout(poll, 3000); // Wait 3s before first poll to let backend process
+                };
+                autoApprove();
+              }
+            } catch (objErr) {
+              console.error('Failed to auto-create objective:', objErr);
+              toastMessage = `Objective detected but failed to save: "${objText.substring(0, 50)}…"`;
+            }
+          } else {
+            toastMessage = `Objective detected — check Objectives to create it!`;
+          }
+        }
+        dispatch({
+          type: 'ADD_TOAST',
+          payload: { id: toastId, icon: toastIcon, message: toastMessage, itemType: item.type },
+        });
+        // Auto-remove after 6 seconds
+        setTimeout(() => {
+          dispatch({ type: 'REMOVE_TOAST', payload: toastId });
+        }, 6000);
+      }
+    }
+    return linkedObjectiveId;
+  }, []);
+
+  const followCapture = useCallback(async (captureId) => {
+    for (let attempt = 0; attempt < 30; attempt++) {
+      await new Promise((resolve) => setTimeout(resolve, 1000));
+      try {
+        const capture = await api.getChatCapture(captureId);
+        if (capture.status === 'pending') continue;
+        const items = capture.items || [];
+        const linkedObjectiveId = await handleAutoCaptured(items);
+        dispatch({
+          type: 'SET_MESSAGE_CAPTURES',
+          payload: { captureId, auto_captured: items, linkedObjectiveId },
+        });
+        return;
+      } catch (err) {
+        console.warn('[JARVIS] Auto-capture poll failed:', err);
+        return;
+      }
+    }
+  }, [handleAutoCaptured]);
+
   // ─── Chat actions ─────────────────────────────────────
   const sendMessage = useCallback(async (message) => {
     let sessionId = state.chatSessionId;
@@ -109,88 +222,7 @@ export function AppProvider({ children }) {
     try {
       const result = await api.chat(message, sessionId);
 
-      // Track objective IDs created during auto-capture
-      let linkedObjectiveId = null;
-
-      // Show toast notifications for auto-captured items
-      if (result.auto_captured && result.auto_captured.length > 0) {
-        for (const item of result.auto_captured) {
-          const toastId = 'toast-' + Date.now() + '-' + Math.random().toString(36).substr(2, 5);
-          let toastMessage = '';
-          let toastIcon = '✨';
-          if (item.type === 'learning') {
-            toastIcon = '💡';
-            toastMessage = `Learning captured: "${item.content?.substring(0, 60)}…"`;
-          } else if (item.type === 'decision') {
-            toastIcon = '⚖️';
-            toastMessage = `Decision logged: "${item.decision?.substring(0, 60)}…"`;
-          } else if (item.type === 'objective_suggestion') {
-            toastIcon = '🎯';
-            // Actually create the objective via the ingest API and auto-approve it
-            const objText = item.text || '';
-            if (objText.trim()) {
-              try {
-                const ingestResult = await api.ingestText(objText);
-                const objId = ingestResult.objective_id;
-                linkedObjectiveId = objId;
-                toastMessage = `Objective created: "${objText.substring(0, 60)}…"`;
-                // Auto-approve after the plan is drafted (poll for readiness)
-                if (objId) {
-                  const autoApprove = async () => {
-                    let attempts = 0;
-                    const maxAttempts = 20;
-                    const poll = async () => {
-                      attempts++;
-                      try {
-                        const status = await api.getStatus(objId);
-                        if (status.plan_draft || status.status === 'planning' || status.status === 'staging') {
-                          try {
-                            await api.confirmPlan(objId, true);
-                            console.log('[JARVIS] Auto-approved objective:', objId);
-                            // Refresh objectives so they appear on the Objectives page
-                            loadObjectives();
-                          } catch (confirmErr) {
-                            console.warn('[JARVIS] Auto-approve failed:', confirmErr);
-                          }
-                          return;
-                        }
-                        if (status.status === 'approved' || status.status === 'in_progress') {
-                          loadObjectives();
-                          return;
-                        }
-                        if (attempts < maxAttempts) {
-                          setTimeout(poll, 2000);
-                        }
-                      } catch {
-                        if (attempts < maxAttempts) {
-                          setTimeout(poll, 2000);
-                        }
-                      }
-                    };
-                    setTimeout(poll, 3000); // Wait 3s before first poll to let backend process
-                  };
-                  autoApprove();
-                }
-              } catch (objErr) {
-                console.error('Failed to auto-create objective:', objErr);
-                toastMessage = `Objective detected but failed to save: "${objText.substring(0, 50)}…"`;
-              }
-            } else {
-              toastMessage = `Objective detected — check Objectives to create it!`;
-            }
-          }
-          dispatch({
-            type: 'ADD_TOAST',
-            payload: { id: toastId, icon: toastIcon, message: toastMessage, itemType: item.type },
-          });
-          // Auto-remove after 6 seconds
-          setTimeout(() => {
-            dispatch({ type: 'REMOVE_TOAST', payload: toastId });
-          }, 6000);
-        }
-      }
-
-      // Add assistant message with linked objective ID
+      // Add assistant message; captured items and the linked objective ID arrive later
       dispatch({
         type: 'ADD_CHAT_MESSAGE',
         payload: {
@@ -198,11 +230,15 @@ export function AppProvider({ children }) {
           content: result.reply,
           sources: result.sources || [],
           context_used: result.context_used || 0,
-          auto_captured: result.auto_captured || [],
-          linkedObjectiveId: linkedObjectiveId,
+          auto_captured: [],
+          captureId: result.capture_id,
+          linkedObjectiveId: null,
           timestamp: new Date().toISOString(),
         },
       });
+      if (result.capture_id) {
+        followCapture(result.capture_id);
+      }
 
       // Refresh sessions list
       loadChatSessions();
@@ -218,7 +254,7 @@ export function AppProvider({ children }) {
     } finally {
       dispatch({ type: 'SET_CHAT_LOADING', payload: false });
     }
-  }, [state.chatSessionId]);
+  }, [state.chatSessionId, followCapture]);
 
   const loadChatSessions = useCallback(async () => {
     try {